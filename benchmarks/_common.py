@@ -0,0 +1,37 @@
+# benchmarks/_common.py
+# Shared helpers for the ChainFlow benchmark scripts.
+# Run any benchmark from the repository root, e.g.
+#   python -m benchmarks.bench_fraud_scoring
+
+import importlib
+import os
+import time
+
+
+def load_app():
+    """Import streamlit_app outside of `streamlit run` without the bare-mode log noise"""
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    from streamlit import logger
+
+    logger.set_log_level(os.environ["STREAMLIT_LOGGER_LEVEL"])
+    return importlib.import_module("streamlit_app")
+
+
+def timed(fn, *args, repeat=1, **kwargs):
+    """Run fn `repeat` times and return (last_result, best_seconds)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def print_table(headers, rows):
+    """Print a small fixed-width results table"""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
@@ -0,0 +1,63 @@
+# benchmarks/_synthetic_catalog.py
+# Large products.json-shaped catalogues for stress-testing the circuit input
+# pipeline, cloned from the shipped catalogue's registries and products.
+
+import copy
+import random
+
+from chainflow.witness import load_catalog
+
+
+def build_synthetic_catalog(n_products=100_000, n_suppliers=2_000, n_distributors=200, n_retailers=500, seed=0):
+    """
+    A catalogue with the shipped registries widened to the given sizes and
+    `n_products` products cloned from the shipped ones, each with its own
+    ID, batch, dates, signatures and a random supplier/distributor/retailer.
+    """
+    rng = random.Random(seed)
+    base = load_catalog()
+    templates = list(base["products"].values())
+    supplier_templates = list(base["suppliers"].values())
+
+    suppliers = {}
+    for i in range(n_suppliers):
+        supplier = copy.deepcopy(rng.choice(supplier_templates))
+        supplier["tier"] = rng.choice([1, 1, 2, 2, 3])
+        supplier["certification_hash"] = f"0x{rng.getrandbits(128):032x}"
+        suppliers[str(10_000 + i)] = supplier
+    distributors = {str(20_000 + i): {"name": f"Distributor {i}"} for i in range(n_distributors)}
+    retailers = {str(30_000 + i): {"name": f"Retailer {i}"} for i in range(n_retailers)}
+    supplier_ids, distributor_ids = list(suppliers), [int(d) for d in distributors]
+    retailer_ids = [int(r) for r in retailers]
+
+    products = {}
+    for i in range(n_products):
+        product = copy.deepcopy(rng.choice(templates))
+        supplier_id = rng.choice(supplier_ids)
+        manufactured = 1_700_000_000 + rng.randrange(60_000_000)
+        hops = rng.randint(0, 3)
+        product.update({
+            "supplier_id": supplier_id,
+            "batch_number": f"B{i:07d}",
+            "manufacturing_date": manufactured,
+            "serial_number": f"SN-{rng.getrandbits(40):010x}",
+            "supply_chain": {
+                "origin": int(supplier_id),
+                "intermediates": rng.sample(distributor_ids, hops) + [0] * (5 - hops),
+                "destination": rng.choice(retailer_ids),
+            },
+            "signatures": {
+                "manufacturer": f"0x{rng.getrandbits(120):030x}",
+                "distributor": f"0x{rng.getrandbits(120):030x}",
+            },
+        })
+        product["zk_verification"] = dict(product.get("zk_verification", {}), timestamp=manufactured + 86_400)
+        products[f"P{i:06d}"] = product
+
+    return {
+        "suppliers": suppliers,
+        "product_categories": base.get("product_categories", {}),
+        "products": products,
+        "distributors": distributors,
+        "retailers": retailers,
+    }
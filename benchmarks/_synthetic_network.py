@@ -0,0 +1,48 @@
+# benchmarks/_synthetic_network.py
+# Random planar hub networks for stress-testing the route search.
+
+import numpy as np
+
+from chainflow.routing import HubNetwork
+
+
+def build_synthetic_hub_network(n_hubs=400, n_countries=100, neighbours=5, seed=0, gateway_every=5):
+    """
+    Hubs scattered over a 10,000 km square, each linked by sea to its nearest
+    hubs; every `gateway_every`-th hub is an air gateway linked by air to its
+    nearest gateways. Countries feed into their three nearest hubs by road.
+    Metrics scale with straight-line distance, as in the real network.
+    """
+    rng = np.random.default_rng(seed)
+    hubs = rng.uniform(0, 10_000, size=(n_hubs, 2))
+    countries = rng.uniform(0, 10_000, size=(n_countries, 2))
+
+    network = HubNetwork()
+    hub_nodes = [network.add_node(f"H{i}", hub=True, tags=[f"zone-{i % 10}"], risk=1 + i % 4) for i in range(n_hubs)]
+    country_nodes = [network.add_node(f"C{i}") for i in range(n_countries)]
+
+    hub_distances = np.linalg.norm(hubs[:, None, :] - hubs[None, :, :], axis=2)
+    for i in range(n_hubs):
+        for j in np.argsort(hub_distances[i])[1:neighbours + 1]:
+            if j < i and i in np.argsort(hub_distances[j])[1:neighbours + 1]:
+                continue  # already linked from the other side
+            km = hub_distances[i, j]
+            network.add_edge(hub_nodes[i], hub_nodes[j], 300 + 0.25 * km, 1 + km / 700, km * 1.6e-4, 'sea')
+
+    gateways = np.arange(0, n_hubs, gateway_every)
+    gateway_distances = hub_distances[np.ix_(gateways, gateways)]
+    for a, i in enumerate(gateways):
+        for b in np.argsort(gateway_distances[a])[1:4]:
+            j = gateways[b]
+            if j < i and a in np.argsort(gateway_distances[b])[1:4]:
+                continue
+            km = hub_distances[i, j]
+            network.add_edge(hub_nodes[i], hub_nodes[j], 1200 + 1.1 * km, 1 + km / 9000, km * 1.1e-3, 'air')
+
+    country_distances = np.linalg.norm(countries[:, None, :] - hubs[None, :, :], axis=2)
+    for c in range(n_countries):
+        for j in np.argsort(country_distances[c])[:3]:
+            km = country_distances[c, j]
+            network.add_edge(country_nodes[c], hub_nodes[j], 150 + 1.2 * km, 1 + km / 600, km * 1e-4, 'road')
+
+    return network, [f"C{i}" for i in range(n_countries)]
@@ -0,0 +1,50 @@
+# benchmarks/bench_bulk_lanes.py
+# Bulk lane planning throughput for a quarterly plan of 50k origin/destination
+# pairs, inline and across process pools of increasing size. Each run starts
+# with cold per-process lane memos; pool runs include worker start-up.
+#   python -m benchmarks.bench_bulk_lanes
+
+import random
+import time
+
+import pandas as pd
+
+from benchmarks._common import print_table
+from chainflow import lanes as lane_planning
+from chainflow.geography import COUNTRIES
+from chainflow.parallel import default_workers
+
+N_LANES = 50_000
+
+
+def quarterly_plan(seed=0):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'origin': [rng.choice(COUNTRIES) for _ in range(N_LANES)],
+        'destination': [rng.choice(COUNTRIES) for _ in range(N_LANES)],
+        'priority': [rng.choice(["Cost", "Time", "Sustainability", "Security"]) for _ in range(N_LANES)],
+        'max_stops': [rng.choice([2, 4, 8]) for _ in range(N_LANES)],
+    })
+
+
+def main():
+    plan = quarterly_plan()
+    unique = len(plan.drop_duplicates())
+    cpus = default_workers()
+    rows = []
+    baseline = None
+    for workers in sorted({1, 2, 4, cpus}):
+        lane_planning.plan_lane.cache_clear()
+        start = time.perf_counter()
+        planned = lane_planning.plan_lanes(plan, workers=workers, chunk_size=1000)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        rows.append([workers, f"{seconds:.1f}", f"{N_LANES / seconds:,.0f}", f"{baseline / seconds:.2f}x",
+                     int((planned['status'] == 'ok').sum())])
+
+    print(f"{N_LANES:,} lanes ({unique:,} unique), {cpus} CPU(s) available\n")
+    print_table(["workers", "seconds", "lanes/s", "speedup", "feasible"], rows)
+
+
+if __name__ == "__main__":
+    main()
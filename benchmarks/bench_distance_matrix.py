@@ -0,0 +1,63 @@
+# benchmarks/bench_distance_matrix.py
+# Great-circle distance matrix: vectorized haversine vs a per-pair Python
+# loop, disk-cache load vs recompute, and per-lookup latency.
+#   python -m benchmarks.bench_distance_matrix
+
+import math
+import random
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks._common import print_table, timed
+from chainflow import distances
+
+
+def haversine_loop(coordinates):
+    n = len(coordinates)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i, (lat1, lon1) in enumerate(coordinates):
+        for j, (lat2, lon2) in enumerate(coordinates):
+            p1, p2 = math.radians(lat1), math.radians(lat2)
+            a = (math.sin((p2 - p1) / 2) ** 2
+                 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+            matrix[i][j] = 2 * distances.EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+    return matrix
+
+
+def main():
+    coordinates = distances.coordinate_array()
+    n = len(coordinates)
+    vectorized, vectorized_s = timed(distances.haversine_matrix, coordinates, repeat=20)
+    loop, loop_s = timed(haversine_loop, coordinates.tolist(), repeat=3)
+    assert np.allclose(vectorized, loop)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        distances.DISTANCE_CACHE_DIR = Path(tmp)
+        distances.distance_matrix.cache_clear()
+        _, cold_s = timed(distances.distance_matrix)
+        loads = []
+        for _ in range(20):
+            distances.distance_matrix.cache_clear()
+            loads.append(timed(distances.distance_matrix)[1])
+        warm_s = min(loads)
+        _, memory_s = timed(distances.distance_matrix, repeat=1000)
+
+    names = [(name, hub) for name, hub in distances.LOCATIONS]
+    pairs = [random.Random(0).sample(names, 2) for _ in range(100_000)]
+    _, lookup_s = timed(lambda: [distances.distance_km(a, b, a_hub, b_hub) for (a, a_hub), (b, b_hub) in pairs])
+
+    print(f"{n} locations, {n * n:,} pairs\n")
+    print_table(["step", "ms"], [
+        ["haversine, python loop", f"{loop_s * 1e3:.2f}"],
+        ["haversine, vectorized", f"{vectorized_s * 1e3:.3f}"],
+        ["distance_matrix, compute + save", f"{cold_s * 1e3:.3f}"],
+        ["distance_matrix, disk cache", f"{warm_s * 1e3:.3f}"],
+        ["distance_matrix, memory cache", f"{memory_s * 1e3:.5f}"],
+        ["distance_km lookup (per call)", f"{lookup_s / len(pairs) * 1e3:.5f}"],
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# benchmarks/bench_fraud_scoring.py
+# Rows/sec of predict_fraud_risk_batch versus calling predict_fraud_risk in a loop.
+#   python -m benchmarks.bench_fraud_scoring [n_rows]
+
+import sys
+
+import numpy as np
+
+from benchmarks._common import load_app, print_table, timed
+
+
+def main(n_rows=50_000, loop_rows=500):
+    app = load_app()
+    app.train_fraud_detection_model()  # warm the model cache outside the timings
+
+    df = app.generate_fraud_detection_dataset()
+    _, _, _, feature_columns = app.train_fraud_detection_model()
+    sample = df[feature_columns].sample(n=n_rows, replace=True, random_state=0).reset_index(drop=True)
+
+    # Single-row baseline on a slice (the loop is far too slow for the full batch)
+    records = sample.head(loop_rows).to_dict("records")
+    loop_probs, loop_seconds = timed(lambda: [app.predict_fraud_risk(r)[0] for r in records])
+
+    (batch_probs, bands, _), batch_seconds = timed(app.predict_fraud_risk_batch, sample, repeat=3)
+
+    assert np.allclose(batch_probs[:loop_rows], loop_probs), "batch and single-row scores disagree"
+
+    loop_rate = loop_rows / loop_seconds
+    batch_rate = n_rows / batch_seconds
+    print_table(
+        ["mode", "rows", "seconds", "rows/sec"],
+        [
+            ["predict_fraud_risk loop", loop_rows, f"{loop_seconds:.3f}", f"{loop_rate:,.0f}"],
+            ["predict_fraud_risk_batch", n_rows, f"{batch_seconds:.3f}", f"{batch_rate:,.0f}"],
+        ],
+    )
+    print(f"\nspeed-up: {batch_rate / loop_rate:,.0f}x")
+    labels, counts = np.unique(bands, return_counts=True)
+    print("risk bands:", {str(k): int(v) for k, v in zip(labels, counts)})
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,64 @@
+# benchmarks/bench_fraud_streaming.py
+# Streams the synthetic fraud dataset to disk and reports throughput and peak
+# RSS for growing row counts at a fixed chunk size: peak memory should track
+# the chunk size, not the total.
+#   python -m benchmarks.bench_fraud_streaming [max_rows]
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks._common import print_table
+
+PROBE = """
+import json, resource, sys, time
+import numpy as np
+from chainflow.synthetic import PARQUET_AVAILABLE, write_fraud_detection_dataset
+path, n_rows, chunk_size = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+start = time.perf_counter()
+rows = write_fraud_detection_dataset(path, n_rows, chunk_size, 0.2, np.random.default_rng(0))
+print(json.dumps({
+    "rows": rows,
+    "seconds": time.perf_counter() - start,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "format": "parquet" if PARQUET_AVAILABLE else "npy",
+}))
+"""
+
+
+def run_probe(path, n_rows, chunk_size):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, path, str(n_rows), str(chunk_size)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out)
+
+
+def disk_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def main(max_rows=20_000_000, chunk_size=500_000):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        n_rows = max_rows // 100
+        while n_rows <= max_rows:
+            path = os.path.join(tmp, f"fraud_{n_rows}.parquet")
+            result = run_probe(path, n_rows, chunk_size)
+            rows.append([
+                f"{result['rows']:,}", f"{chunk_size:,}", result["format"],
+                f"{result['seconds']:.2f}", f"{result['rows'] / result['seconds']:,.0f}",
+                f"{result['peak_rss_mb']:.0f}", f"{disk_size(path) / 2**20:.0f}",
+            ])
+            if os.path.isfile(path):
+                os.remove(path)  # keep disk usage to one output at a time
+            n_rows *= 10
+    print_table(["rows", "chunk", "format", "seconds", "rows/sec", "peak RSS MB", "file MB"], rows)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,84 @@
+# benchmarks/bench_geofence.py
+# Geofence replay: 1M GPS pings from 2,000 drivers wandering across 400
+# delivery zones, written to a JSONL file and replayed through
+# GeofenceEngine in batches. Reports engine-only throughput (pre-parsed
+# batches) and end-to-end throughput including JSON parsing.
+#   python -m benchmarks.bench_geofence
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import print_table
+from chainflow.geofence import PING_COLUMNS, GeofenceEngine, regular_zone
+
+N_PINGS = 1_000_000
+N_DRIVERS = 2_000
+BOX = ((37.6, 37.9), (-122.55, -122.25))
+
+
+def delivery_zones(n_side=20, seed=0):
+    """A jittered grid of n_side x n_side polygonal zones with gaps between them"""
+    rng = np.random.default_rng(seed)
+    lats = np.linspace(*BOX[0], n_side)
+    lons = np.linspace(*BOX[1], n_side)
+    return {
+        f"ZONE-{r:02d}{c:02d}": regular_zone(lat + rng.normal(0, 0.002), lon + rng.normal(0, 0.002),
+                                             radius_km=rng.uniform(0.4, 0.7), sides=int(rng.integers(6, 24)))
+        for r, lat in enumerate(lats) for c, lon in enumerate(lons)
+    }
+
+
+def ping_stream(seed=0):
+    """Pings in arrival order: each tick a random driver moves ~50 m from its last position"""
+    rng = np.random.default_rng(seed)
+    driver = rng.integers(0, N_DRIVERS, N_PINGS)
+    steps = pd.DataFrame(rng.normal(0, 0.0005, size=(N_PINGS, 2)), columns=['lat', 'lon'])
+    walked = steps.groupby(driver).cumsum()
+    return pd.DataFrame({
+        'driver_id': [f"DRV-{d:04d}" for d in driver],
+        'lat': (rng.uniform(*BOX[0], N_DRIVERS)[driver] + walked['lat']).round(6),
+        'lon': (rng.uniform(*BOX[1], N_DRIVERS)[driver] + walked['lon']).round(6),
+        'ts': 1_700_000_000 + np.arange(N_PINGS) // 100
+    })[PING_COLUMNS]
+
+
+def main():
+    zones = delivery_zones()
+    start = time.perf_counter()
+    engine = GeofenceEngine(zones)
+    build_s = time.perf_counter() - start
+    pings = ping_stream()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pings.jsonl")
+        with open(path, "w") as f:
+            for record in pings.to_dict('records'):
+                f.write(json.dumps(record) + "\n")
+        size_mb = os.path.getsize(path) / 1e6
+
+        rows = []
+        for batch_size in (10_000, 50_000, 200_000):
+            engine = GeofenceEngine(zones)
+            start = time.perf_counter()
+            events = sum(len(engine.process(pings.iloc[i:i + batch_size])) for i in range(0, N_PINGS, batch_size))
+            seconds = time.perf_counter() - start
+            rows.append([f"engine, batches of {batch_size:,}", f"{seconds:.2f}", f"{N_PINGS / seconds:,.0f}", f"{events:,}"])
+
+        engine = GeofenceEngine(zones)
+        start = time.perf_counter()
+        events = sum(len(batch) for batch in engine.replay(path, batch_size=50_000))
+        seconds = time.perf_counter() - start
+        rows.append(["JSONL replay (parse + engine)", f"{seconds:.2f}", f"{N_PINGS / seconds:,.0f}", f"{events:,}"])
+
+    print(f"{len(zones)} zones indexed in {build_s:.2f}s; {N_PINGS:,} pings from {N_DRIVERS:,} drivers "
+          f"({size_mb:.0f} MB JSONL)\n")
+    print_table(["mode", "seconds", "pings/s", "events"], rows)
+
+
+if __name__ == "__main__":
+    main()
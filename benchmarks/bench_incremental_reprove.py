@@ -0,0 +1,84 @@
+# benchmarks/bench_incremental_reprove.py
+# Incremental re-proving on a 100k-product catalogue: the initial manifest,
+# then the plan after typical single-record edits (which products must be
+# re-proved, and how long the diff takes) versus re-proving everything.
+#   python -m benchmarks.bench_incremental_reprove
+
+import copy
+import tempfile
+from pathlib import Path
+
+from benchmarks._common import print_table, timed
+from benchmarks._synthetic_catalog import build_synthetic_catalog
+from chainflow.changes import ProofManifest, requeue
+from chainflow.jobs import ProofJobQueue
+
+N_PRODUCTS = 100_000
+SECONDS_PER_PROOF = 2.0  # assumed nargo execute + prove time per product
+
+
+def edits(catalog):
+    """(description, edited copy of the catalogue) for single-record edits"""
+    supplier_id = next(iter(catalog["suppliers"]))
+    product_id = next(iter(catalog["products"]))
+    distributor_id = next(iter(catalog["distributors"]))
+
+    tier = copy.deepcopy(catalog)
+    tier["suppliers"][supplier_id]["tier"] = tier["suppliers"][supplier_id]["tier"] % 3 + 1
+    renamed = copy.deepcopy(catalog)
+    renamed["suppliers"][supplier_id]["name"] = "Renamed Supplier Ltd"
+    product = copy.deepcopy(catalog)
+    product["products"][product_id]["signatures"]["distributor"] = "0xfeed"
+    distributor = copy.deepcopy(catalog)
+    distributor["distributors"][distributor_id]["name"] = "Renamed Distributor"
+    registered = copy.deepcopy(catalog)
+    registered["retailers"]["39999"] = {"name": "New Retailer"}
+    return [
+        (f"supplier {supplier_id} tier", tier),
+        (f"supplier {supplier_id} name", renamed),
+        (f"product {product_id} signature", product),
+        (f"distributor {distributor_id} name", distributor),
+        ("new retailer registered", registered),
+    ]
+
+
+def main():
+    catalog = build_synthetic_catalog(N_PRODUCTS)
+    cases = edits(catalog)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "manifest.json"
+        manifest = ProofManifest(path)
+        initial, first_plan = timed(manifest.plan, catalog)
+        _, first_commit = timed(manifest.commit, initial)
+        size_mb = path.stat().st_size / 1e6
+
+        rows = []
+        for description, edited in cases:
+            baseline = ProofManifest(path)
+            plan, seconds = timed(baseline.plan, edited)
+            candidates = len(plan.to_prove) + len(plan.refreshed)
+            saved = (N_PRODUCTS - len(plan)) * SECONDS_PER_PROOF / 3600
+            rows.append([description, f"{candidates:,}", f"{len(plan):,}", str(plan.roots_changed),
+                         f"{seconds:.2f}", f"{saved:,.1f}"])
+
+        description, edited = cases[0]
+        manifest = ProofManifest(path)
+        plan = manifest.plan(edited)
+        queue = ProofJobQueue(workers=4)
+        jobs = requeue(plan, queue, lambda product_id, inputs: {'product_id': product_id})
+        done = [product_id for product_id, job_id in jobs.items() if queue.result(job_id, timeout=10)]
+        manifest.commit(plan, done)
+        queue.shutdown()
+        after = ProofManifest(path).plan(edited)
+
+    print(f"{N_PRODUCTS:,} products, {len(catalog['suppliers']):,} suppliers; "
+          f"initial plan {first_plan:.2f} s ({len(initial):,} proofs), commit {first_commit:.2f} s, "
+          f"manifest {size_mb:.1f} MB\n")
+    print_table(["edit", "candidates", "re-proved", "roots moved", "plan s", "prover h saved"], rows)
+    print(f"\n'{description}': {len(jobs)} proofs re-queued and committed; "
+          f"next plan re-proves {len(after)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_k_shortest.py
+# Yen k-shortest loopless routes for k = 1..20 on the app's hub network and
+# on a large synthetic hub network. Yen's search is incremental, so each k
+# is timed as a fresh query for the first k routes.
+#   python -m benchmarks.bench_k_shortest
+
+import itertools
+import random
+import time
+
+from benchmarks._common import print_table
+from benchmarks._synthetic_network import build_synthetic_hub_network
+from chainflow.geography import COUNTRIES
+from chainflow.routing import default_hub_network
+
+K_VALUES = (1, 2, 5, 10, 15, 20)
+
+
+def measure(network, pairs, k):
+    latencies, found = [], 0
+    for origin, destination in pairs:
+        network._bounds_cache.clear()  # include the destination bounds in every query
+        start = time.perf_counter()
+        found += len(network.k_shortest_paths(origin, destination, k))
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return [
+        f"{sum(latencies) / len(latencies) * 1e3:.2f}",
+        f"{latencies[int(len(latencies) * 0.95)] * 1e3:.2f}",
+        f"{found / len(pairs):.1f}",
+    ]
+
+
+def main():
+    networks = [("app", default_hub_network(), COUNTRIES, 300)]
+    for n_hubs in (1000, 2000):
+        network, countries = build_synthetic_hub_network(n_hubs=n_hubs, n_countries=200)
+        networks.append(("synthetic", network, countries, 50))
+
+    rows = []
+    for name, network, countries, n_pairs in networks:
+        pairs = random.Random(0).sample(list(itertools.permutations(countries, 2)), n_pairs)
+        for k in K_VALUES:
+            rows.append([name, len(network.labels), network.edge_count, k, *measure(network, pairs, k)])
+
+    print_table(["network", "nodes", "edges", "k", "mean ms", "p95 ms", "mean routes"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_merkle.py
+# Supplier registry Merkle tree at a million suppliers: bulk build, root
+# recomputation after single-leaf updates and appends (vs rebuilding the
+# tree), and batch generation of Prover.toml inclusion paths.
+#   python -m benchmarks.bench_merkle
+
+import random
+import time
+
+from benchmarks._common import print_table, timed
+from chainflow.merkle import DEFAULT_DEPTH, MerkleTree, SupplierRegistryTree
+
+N_SUPPLIERS = 1_000_000
+N_UPDATES = 10_000
+N_PATHS = 100_000
+
+
+def supplier_registry(n, seed=0):
+    rng = random.Random(seed)
+    return {
+        str(100_000 + i): {'tier': rng.choice([1, 2, 3]), 'certification_hash': f"0x{rng.getrandbits(128):032x}"}
+        for i in range(n)
+    }
+
+
+def main():
+    suppliers = supplier_registry(N_SUPPLIERS)
+    registry, build = timed(SupplierRegistryTree, suppliers, DEFAULT_DEPTH)
+    tree = registry.tree
+    leaves = [tree.leaf(i) for i in range(len(tree))]
+    _, rebuild = timed(lambda: MerkleTree(DEFAULT_DEPTH).extend(leaves))
+
+    rng = random.Random(1)
+    ids = rng.sample(list(suppliers), N_UPDATES)
+    start = time.perf_counter()
+    for supplier_id in ids:
+        record = dict(suppliers[supplier_id], tier=rng.choice([1, 2, 3]))
+        registry.upsert(supplier_id, record)
+    update = (time.perf_counter() - start) / N_UPDATES
+
+    start = time.perf_counter()
+    for i in range(N_UPDATES):
+        registry.upsert(f"new-{i}", {'tier': 2, 'certification_hash': f"0x{i + 1:x}"})
+    append = (time.perf_counter() - start) / N_UPDATES
+
+    path_ids = rng.sample(list(suppliers), N_PATHS)
+    indices = [registry.index_of[s] for s in path_ids]
+    _, gather = timed(tree.paths, indices, repeat=3)
+    proofs, toml_ready = timed(registry.inclusion_proofs, path_ids[:10_000])
+    sample = path_ids[0]
+    elements, bits = tree.path(registry.index_of[sample])
+    valid = tree.verify(tree.leaf(registry.index_of[sample]), elements, bits)
+
+    rows = [
+        ["build registry (leaf + tree hashes)", f"{build:.2f} s", ""],
+        ["rebuild tree from leaves", f"{rebuild:.2f} s", "1x"],
+        ["single-leaf update -> new root", f"{update * 1e6:,.0f} µs", f"{rebuild / update:,.0f}x"],
+        ["single-leaf append -> new root", f"{append * 1e6:,.0f} µs", f"{rebuild / append:,.0f}x"],
+        [f"{N_PATHS:,} inclusion paths (arrays)", f"{gather * 1e3:,.0f} ms", f"{N_PATHS / gather:,.0f} paths/s"],
+        ["10,000 Prover.toml path dicts (hex)", f"{toml_ready * 1e3:,.0f} ms", f"{10_000 / toml_ready:,.0f} paths/s"],
+    ]
+    print(f"{N_SUPPLIERS:,} suppliers (+{N_UPDATES:,} appended), depth {DEFAULT_DEPTH}, SHA-256 node hash\n")
+    print_table(["operation", "time", "vs rebuild / rate"], rows)
+    print(f"\nsample path verifies against the root: {valid}")
+
+
+if __name__ == "__main__":
+    main()
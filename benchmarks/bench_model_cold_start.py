@@ -0,0 +1,48 @@
+# benchmarks/bench_model_cold_start.py
+# Cold-start time of train_fraud_detection_model in a fresh process,
+# with an empty artifact directory (train + save) and a warm one (load).
+#   python -m benchmarks.bench_model_cold_start
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks._common import print_table
+
+PROBE = """
+import json, os, time
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+start = time.perf_counter()
+import streamlit_app
+imported = time.perf_counter()
+streamlit_app.train_fraud_detection_model()
+done = time.perf_counter()
+print(json.dumps({"import": imported - start, "model": done - imported}))
+"""
+
+
+def run_probe(artifact_dir):
+    env = dict(os.environ, CHAINFLOW_MODEL_DIR=artifact_dir)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(runs=3):
+    rows = []
+    with tempfile.TemporaryDirectory() as artifact_dir:
+        cold = run_probe(artifact_dir)  # trains and writes the artifact
+        rows.append(["no artifact (train + save)", f"{cold['import']:.2f}", f"{cold['model']:.3f}"])
+        warm = min((run_probe(artifact_dir) for _ in range(runs)), key=lambda r: r["model"])
+        rows.append(["artifact on disk (load)", f"{warm['import']:.2f}", f"{warm['model']:.3f}"])
+        artifacts = os.listdir(artifact_dir)
+
+    print_table(["cold start", "import s", "model ready s"], rows)
+    print(f"\nartifact: {artifacts[0]}  speed-up: {cold['model'] / warm['model']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_nargo_runner.py
+# nargo runner against the frontend server's pattern, using
+# benchmarks/fake_nargo.py (no Noir toolchain needed): every request
+# compiling and executing in one shared project directory, one at a time
+# since they share Prover.toml, versus the cached runner with isolated job
+# directories and a bounded pool. Also repeated status (check + info) calls.
+#   python -m benchmarks.bench_nargo_runner
+
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._common import print_table, timed
+from chainflow.nargo import NargoRunner
+from chainflow.witness import format_prover_toml
+
+FAKE_NARGO = Path(__file__).resolve().parent / "fake_nargo.py"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+N_JOBS = 40
+N_STATUS = 10
+WORKERS = 4
+
+
+def job_inputs(i):
+    return {'product_id': str(1000 + i), 'merkle_root': f"0x{i:064x}", 'path_indices': ["0", "1"] * 10}
+
+
+def shared_directory_baseline(project, n_jobs, n_status):
+    """What server.js does: nargo compile + execute per request, check + info per status"""
+    def nargo(*args):
+        subprocess.run([str(FAKE_NARGO), *args], cwd=project, check=True, capture_output=True)
+
+    start = time.perf_counter()
+    for i in range(n_jobs):
+        (project / "Prover.toml").write_text(format_prover_toml(job_inputs(i)))
+        nargo("compile")
+        nargo("execute")
+    jobs = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(n_status):
+        nargo("check")
+        nargo("info")
+    return jobs, time.perf_counter() - start
+
+
+def run_jobs(runner, n_jobs):
+    job_ids = [runner.submit(job_inputs(i), label=str(i)) for i in range(n_jobs)]
+    return [runner.result(job_id, timeout=120) for job_id in job_ids]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        project = Path(directory) / "project"
+        project.mkdir()
+        shutil.copy2(PROJECT_ROOT / "Nargo.toml", project / "Nargo.toml")
+        shutil.copytree(PROJECT_ROOT / "src", project / "src")
+        baseline_jobs, baseline_status = shared_directory_baseline(project, N_JOBS, N_STATUS)
+
+        runner = NargoRunner(project, nargo=FAKE_NARGO, workers=WORKERS, cache_dir=Path(directory) / "cache")
+        results, cold = timed(run_jobs, runner, N_JOBS)
+        _, warm = timed(run_jobs, runner, N_JOBS)
+        _, status = timed(lambda: [runner.status() for _ in range(N_STATUS)])
+        stats = runner.stats()
+        runner.shutdown()
+
+    distinct = len({result['witness'] for result in results})
+    print(f"{N_JOBS} proving jobs, {N_STATUS} status calls, fake nargo (compile 0.5 s, execute 0.1 s)\n")
+    print_table(["approach", "jobs s", "jobs/s", "status s"], [
+        ["shared dir, compile every request", f"{baseline_jobs:.2f}", f"{N_JOBS / baseline_jobs:.1f}",
+         f"{baseline_status:.2f}"],
+        [f"runner, {WORKERS} workers, cold cache", f"{cold:.2f}", f"{N_JOBS / cold:.1f}", f"{status:.2f}"],
+        [f"runner, {WORKERS} workers, warm cache", f"{warm:.2f}", f"{N_JOBS / warm:.1f}", "-"],
+    ])
+    print(f"\ncompiles: {stats['compiles']}, compile cache hits: {stats['compile_hits']}, "
+          f"distinct witnesses: {distinct}/{N_JOBS}\n")
+    print_table(["stage", "runs", "mean s"], [
+        [stage, s['runs'], f"{s['mean']:.3f}"] for stage, s in stats['stages'].items()
+    ])
+    first = results[0]['timings']
+    print("\nfirst job timings: " + ", ".join(f"{stage} {seconds:.3f} s" for stage, seconds in first.items()))
+
+
+if __name__ == "__main__":
+    main()
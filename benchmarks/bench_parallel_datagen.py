@@ -0,0 +1,38 @@
+# benchmarks/bench_parallel_datagen.py
+# Scaling of the parallel fraud / trust dataset builders over 1, 2, 4 and 8
+# worker processes, plus a bit-identical rerun check for each worker count.
+#   python -m benchmarks.bench_parallel_datagen [fraud_rows] [suppliers]
+
+import sys
+
+import pandas as pd
+
+from benchmarks._common import print_table, timed
+from chainflow.parallel import default_workers
+from chainflow.synthetic import generate_fraud_dataset_parallel, generate_trust_dataset_parallel
+
+
+def main(fraud_rows=20_000_000, suppliers=5_000_000, worker_counts=(1, 2, 4, 8)):
+    rows = []
+    for name, builder, n in (
+        ("fraud", generate_fraud_dataset_parallel, fraud_rows),
+        ("trust", generate_trust_dataset_parallel, suppliers),
+    ):
+        baseline = None
+        for workers in worker_counts:
+            frame, seconds = timed(builder, n, 7, workers)
+            baseline = baseline or seconds
+            rerun = builder(min(n, 200_000), 7, workers)
+            pd.testing.assert_frame_equal(rerun, builder(min(n, 200_000), 7, workers))
+            rows.append([
+                name, f"{len(frame):,}", workers, f"{seconds:.2f}",
+                f"{len(frame) / seconds:,.0f}", f"{baseline / seconds:.2f}x",
+            ])
+            del frame
+    print(f"CPUs available: {default_workers()}\n")
+    print_table(["dataset", "rows", "workers", "seconds", "rows/sec", "speed-up"], rows)
+    print("\nreruns with the same seed and worker count were bit-identical")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,49 @@
+# benchmarks/bench_pareto_routes.py
+# Pareto-frontier route search (label-setting with dominance pruning) on the
+# app's hub network and on synthetic networks with hundreds of hubs.
+#   python -m benchmarks.bench_pareto_routes
+
+import itertools
+import random
+import time
+
+from benchmarks._common import print_table
+from benchmarks._synthetic_network import build_synthetic_hub_network
+from chainflow.geography import COUNTRIES
+from chainflow.routing import default_hub_network
+
+
+def measure(network, pairs, max_stops):
+    latencies, sizes = [], []
+    for origin, destination in pairs:
+        start = time.perf_counter()
+        frontier = network.pareto_routes(origin, destination, max_stops=max_stops)
+        latencies.append(time.perf_counter() - start)
+        sizes.append(len(frontier))
+    latencies.sort()
+    return [
+        f"{sum(latencies) / len(latencies) * 1e3:.2f}",
+        f"{latencies[int(len(latencies) * 0.95)] * 1e3:.2f}",
+        f"{sum(sizes) / len(sizes):.1f}",
+        max(sizes),
+    ]
+
+
+def main():
+    rows = []
+    app_network = default_hub_network()
+    app_pairs = random.Random(0).sample(list(itertools.product(COUNTRIES, COUNTRIES)), 1000)
+    for max_stops in (2, 4, 8):
+        rows.append(["app", len(app_network.labels), max_stops, *measure(app_network, app_pairs, max_stops)])
+
+    for n_hubs in (200, 400):
+        network, countries = build_synthetic_hub_network(n_hubs=n_hubs)
+        pairs = random.Random(1).sample(list(itertools.permutations(countries, 2)), 100)
+        for max_stops in (12, 24):
+            rows.append(["synthetic", len(network.labels), max_stops, *measure(network, pairs, max_stops)])
+
+    print_table(["network", "nodes", "max stops", "mean ms", "p95 ms", "mean frontier", "max frontier"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_pedersen.py
+# Off-circuit Pedersen hash: cross-check against Noir/barretenberg vectors,
+# generator table build vs disk load, single-hash throughput of the windowed
+# tables at several widths vs double-and-add, and bulk supplier-leaf hashing
+# plus a Pedersen supplier registry tree.
+#   python -m benchmarks.bench_pedersen
+
+import random
+import tempfile
+
+from benchmarks._common import print_table, timed
+from chainflow.merkle import SupplierRegistryTree, supplier_leaf_inputs
+from chainflow.pedersen import (DEFAULT_DOMAIN_SEPARATOR, LENGTH_DOMAIN_SEPARATOR, P, PedersenHasher,
+                                _add_affine, _to_affine, cross_check, derive_generators, scalar_mul)
+
+N_HASHES = 2_000
+N_REFERENCE = 50
+N_SUPPLIERS = 20_000
+TREE_DEPTH = 16
+
+
+def reference_hash(inputs):
+    """Double-and-add pedersen_hash, no tables"""
+    generators = derive_generators(DEFAULT_DOMAIN_SEPARATOR, len(inputs))
+    terms = [scalar_mul(g, v) for g, v in zip(generators, inputs)]
+    terms.append(scalar_mul(derive_generators(LENGTH_DOMAIN_SEPARATOR, 1)[0], len(inputs)))
+    acc = (0, 1, 0)
+    for point in terms:
+        if point is not None:
+            acc = _add_affine(*acc, *point)
+    return _to_affine([acc])[0][0] if acc[2] else 0
+
+
+def supplier_registry(n, seed=0):
+    rng = random.Random(seed)
+    return {
+        str(100_000 + i): {'tier': rng.choice([1, 2, 3]), 'certification_hash': f"0x{rng.getrandbits(128):032x}"}
+        for i in range(n)
+    }
+
+
+def hash_rate(hasher, rows):
+    _, seconds = timed(lambda: [hasher.hash(row) for row in rows])
+    return len(rows) / seconds
+
+
+def main():
+    checks = cross_check(PedersenHasher(cache_dir=None))
+    print("cross-check vectors")
+    print_table(["vector", "match"], [[name, "ok" if ok else "MISMATCH"] for name, ok in checks])
+
+    rng = random.Random(0)
+    rows = [[rng.randrange(P) for _ in range(3)] for _ in range(N_HASHES)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _, build = timed(PedersenHasher(cache_dir=cache_dir).warm, 3)
+        _, load = timed(PedersenHasher(cache_dir=cache_dir).warm, 3)
+    print(f"\n4 generator tables (3 inputs + length), w=8: build {build:.2f} s, load from disk {load * 1e3:.0f} ms\n")
+
+    results = []
+    for window_bits in (4, 6, 8, 10):
+        hasher = PedersenHasher(window_bits, cache_dir=None)
+        _, warm = timed(hasher.warm, 3)
+        results.append([f"windowed, w={window_bits}", f"{warm:.2f} s", f"{hash_rate(hasher, rows):,.0f}"])
+    _, reference = timed(lambda: [reference_hash(row) for row in rows[:N_REFERENCE]])
+    results.append(["double-and-add", "-", f"{N_REFERENCE / reference:,.0f}"])
+    hasher = PedersenHasher(cache_dir=None)
+    agree = all(hasher.hash(row) == reference_hash(row) for row in rows[:10])
+    print_table(["method", "table build", "3-input hashes/s"], results)
+    print(f"windowed and double-and-add agree: {agree}\n")
+
+    suppliers = supplier_registry(N_SUPPLIERS)
+    leaf_rows = [supplier_leaf_inputs(s, record) for s, record in suppliers.items()]
+    _, single = timed(lambda: [hasher.hash(row) for row in leaf_rows])
+    _, batch = timed(hasher.hash_many, leaf_rows)
+    hasher.warm(2)
+    _, tree = timed(SupplierRegistryTree, suppliers, TREE_DEPTH, hasher.pair, hasher.leaf)
+    print_table(["supplier registry", "time", "rate"], [
+        [f"{N_SUPPLIERS:,} leaves, hash()", f"{single:.2f} s", f"{N_SUPPLIERS / single:,.0f} leaves/s"],
+        [f"{N_SUPPLIERS:,} leaves, hash_many()", f"{batch:.2f} s", f"{N_SUPPLIERS / batch:,.0f} leaves/s"],
+        [f"Pedersen tree, depth {TREE_DEPTH}", f"{tree:.2f} s", f"{N_SUPPLIERS / tree:,.0f} suppliers/s"],
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_preflight.py
+# Pre-flight evaluation of main.nr assertions on a 100k-product catalogue
+# with ~8% bad records (out-of-range supplier tiers, missing signatures,
+# stale product hashes, unlisted categories scoring under 70). Compares the
+# evaluator's cost with the prover time the rejected inputs would have
+# wasted, at an assumed PROVER_SECONDS per nargo execute + prove.
+#   python -m benchmarks.bench_preflight
+
+import random
+
+from benchmarks._common import print_table, timed
+from benchmarks._synthetic_catalog import build_synthetic_catalog
+from chainflow.preflight import ASSERTIONS, preflight
+from chainflow.witness import WitnessBuilder
+
+N_PRODUCTS = 100_000
+PROVER_SECONDS = 2.0  # assumed per-proof prover time for main.nr
+
+
+def inject_failures(catalog, seed=0):
+    """Corrupt ~8% of products the ways real catalogue edits go wrong"""
+    rng = random.Random(seed)
+    suppliers = list(catalog["suppliers"].values())
+    for supplier in rng.sample(suppliers, len(suppliers) // 100):
+        supplier["tier"] = rng.choice([0, 4])  # ~1% of products via their supplier
+    products = list(catalog["products"].values())
+    for product in rng.sample(products, len(products) * 3 // 100):
+        product["signatures"].pop(rng.choice(["manufacturer", "distributor"]))
+    for product in rng.sample(products, len(products) * 2 // 100):
+        product["category"] = 4  # unlisted category: no risk bonus
+        catalog["suppliers"][product["supplier_id"]]["tier"] = 3
+    return rng
+
+
+def main():
+    catalog = build_synthetic_catalog(N_PRODUCTS)
+    rng = inject_failures(catalog)
+    builder = WitnessBuilder(catalog)
+    witnesses, build = timed(lambda: list(builder.witnesses()))
+    for _, inputs in rng.sample(witnesses, N_PRODUCTS * 2 // 100):
+        inputs["expected_product_hash"] += 1  # hash recorded before a batch edit
+
+    report, seconds = timed(preflight, witnesses, repeat=3)
+    rejected = int((~report['passed']).sum())
+    by_assertion = report['failed_assertion'].value_counts()
+    rows = [[name, f"{int(by_assertion.get(name, 0)):,}"] for name, _ in ASSERTIONS if by_assertion.get(name, 0)]
+
+    print(f"{N_PRODUCTS:,} products, witnesses built in {build:.2f}s\n")
+    print_table(["first failing assertion", "products"], rows)
+    wasted = rejected * PROVER_SECONDS
+    print(f"\npre-flight: {seconds:.2f}s ({N_PRODUCTS / seconds:,.0f} products/s), "
+          f"{rejected:,} rejected ({rejected / N_PRODUCTS:.1%})")
+    print(f"prover time avoided at {PROVER_SECONDS:.1f}s/proof: {wasted / 3600:,.1f} h "
+          f"({wasted / (N_PRODUCTS * PROVER_SECONDS):.1%} of the full run) "
+          f"for {seconds:.2f}s of checking ({wasted / seconds:,.0f}x return)")
+
+
+if __name__ == "__main__":
+    main()
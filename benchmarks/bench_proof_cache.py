@@ -0,0 +1,85 @@
+# benchmarks/bench_proof_cache.py
+# Content-addressed proof cache: repeat verifications of an unchanged
+# catalogue served cold (deterministic generation + disk write), from memory,
+# and from disk in a fresh process-like cache, plus a check that editing any
+# product field produces a new key and a new proof.
+#   python -m benchmarks.bench_proof_cache
+
+import copy
+import random
+import tempfile
+import time
+
+from benchmarks._common import load_app, print_table
+from chainflow.proof_cache import ProofCache
+
+N_VARIANTS = 200  # catalogue SKUs per sample product
+REPEATS = 5
+
+
+def catalogue(products, seed=0):
+    """Sample products cloned into distinct SKUs"""
+    rng = random.Random(seed)
+    skus = []
+    for product in products:
+        for i in range(N_VARIANTS):
+            sku = copy.deepcopy(product)
+            sku['id'] = f"{product['id']}-{i:04d}"
+            sku['batch'] = f"B{rng.randrange(10**6):06d}"
+            skus.append(sku)
+    return skus
+
+
+def verify_all(app, cache, skus):
+    start = time.perf_counter()
+    for sku in skus:
+        key = app.zk_proof_key(sku['id'], "authenticity", "standard", sku)
+        cache.get_or_compute(key, lambda: app.generate_zk_proof(sku['id'], "authenticity", "standard", sku,
+                                                                deterministic=True))
+    return (time.perf_counter() - start) / len(skus)
+
+
+def main():
+    app = load_app()
+    products, _ = app.load_sample_data()
+    skus = catalogue(products)
+
+    start = time.perf_counter()
+    for sku in skus:
+        app.generate_zk_proof(sku['id'], "authenticity", "standard", sku)
+    uncached = (time.perf_counter() - start) / len(skus)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ProofCache(directory, maxsize=len(skus))
+        cold = verify_all(app, cache, skus)
+        memory = min(verify_all(app, cache, skus) for _ in range(REPEATS))
+        disk = verify_all(app, ProofCache(directory, maxsize=len(skus)), skus)
+        stats = cache.stats()
+
+        rows = [
+            ["uncached (random)", f"{uncached * 1e6:,.1f}", "1.0x"],
+            ["cold (generate + write)", f"{cold * 1e6:,.1f}", f"{uncached / cold:.1f}x"],
+            ["disk hit (new cache)", f"{disk * 1e6:,.1f}", f"{uncached / disk:.1f}x"],
+            ["memory hit", f"{memory * 1e6:,.1f}", f"{uncached / memory:.1f}x"],
+        ]
+        print(f"{len(skus):,} SKUs, best of {REPEATS} warm passes\n")
+        print_table(["verification", "µs/proof", "vs uncached"], rows)
+        print(f"\ncache: {stats['generated']:,} generated, {stats['memory_hits']:,} memory hits")
+
+        # Every field is part of the content address
+        sku = skus[0]
+        base_key = app.zk_proof_key(sku['id'], "authenticity", "standard", sku)
+        changed = 0
+        for field in sku:
+            edited = copy.deepcopy(sku)
+            edited[field] = f"{edited[field]}*"
+            changed += app.zk_proof_key(sku['id'], "authenticity", "standard", edited) != base_key
+        repeat = app.generate_zk_proof(sku['id'], "authenticity", "standard", sku, deterministic=True)
+        first = cache.get(base_key)
+        same = all(repeat[k] == first[k] for k in repeat if k != 'timestamp')
+        print(f"editing any one of {len(sku)} fields changes the key: {changed}/{len(sku)}; "
+              f"deterministic regeneration matches cached proof: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_proof_queue.py
+# Proof job queue: a burst of proof requests across the sample catalogue,
+# generated inline one after another vs through ProofJobQueue with pools of
+# increasing size, plus per-priority queue wait and cancellation of queued
+# jobs. Each proof holds its worker for its reported generation time
+# (scaled by PROVER_SCALE), standing in for an external prover process.
+#   python -m benchmarks.bench_proof_queue
+
+import random
+import statistics
+import time
+
+from benchmarks._common import load_app, print_table
+from chainflow.jobs import PRIORITIES, JobCancelled, ProofJobQueue, proof_priority
+
+N_PROOFS = 200
+PROVER_SCALE = 0.02  # ~10-70 ms per proof
+
+
+def proof_requests(products, seed=0):
+    rng = random.Random(seed)
+    return [(product, rng.choice(["authenticity", "origin", "quality"]), rng.choice(["standard", "high", "maximum"]))
+            for product in rng.choices(products, k=N_PROOFS)]
+
+
+def make_prover(app):
+    def prove(product_id, proof_type, privacy_level, product_data):
+        proof = app.generate_zk_proof(product_id, proof_type, privacy_level, product_data)
+        time.sleep(float(proof['verification_time'].rstrip('s')) * PROVER_SCALE)
+        return proof
+    return prove
+
+
+def run_queue(prove, requests, workers):
+    queue = ProofJobQueue(workers)
+    start = time.perf_counter()
+    jobs = [(queue.submit(prove, product['id'], proof_type, privacy, product,
+                          priority=proof_priority(product.get('category'))), proof_priority(product.get('category')))
+            for product, proof_type, privacy in requests]
+    waits = {priority: [] for priority in PRIORITIES}
+    for job_id, priority in jobs:
+        queue.result(job_id)
+        waits[priority].append(queue.status(job_id)['waited'])
+    seconds = time.perf_counter() - start
+    queue.shutdown()
+    return seconds, waits
+
+
+def run_cancellation(prove, requests, workers):
+    queue = ProofJobQueue(workers)
+    jobs = [(queue.submit(prove, product['id'], proof_type, privacy, product,
+                          priority=proof_priority(product.get('category'))), proof_priority(product.get('category')))
+            for product, proof_type, privacy in requests]
+    start = time.perf_counter()
+    withdrawn = sum(queue.cancel(job_id) for job_id, priority in jobs if priority == "standard")
+    served = 0
+    for job_id, _ in jobs:
+        try:
+            queue.result(job_id)
+            served += 1
+        except JobCancelled:
+            pass
+    seconds = time.perf_counter() - start
+    queue.shutdown()
+    return withdrawn, served, seconds
+
+
+def main():
+    app = load_app()
+    products, _ = app.load_sample_data()
+    requests = proof_requests(products)
+    prove = make_prover(app)
+
+    start = time.perf_counter()
+    for product, proof_type, privacy in requests:
+        prove(product['id'], proof_type, privacy, product)
+    inline = time.perf_counter() - start
+
+    rows = [["inline", f"{inline:.2f}", f"{N_PROOFS / inline:,.0f}", "1.00x", "-", "-", "-"]]
+    for workers in (1, 2, 4, 8, 16):
+        seconds, waits = run_queue(prove, requests, workers)
+        p50 = {p: f"{statistics.median(w) * 1000:,.0f}" if w else "-" for p, w in waits.items()}
+        rows.append([f"queue x{workers}", f"{seconds:.2f}", f"{N_PROOFS / seconds:,.0f}", f"{inline / seconds:.2f}x",
+                     p50["military"], p50["healthcare"], p50["standard"]])
+
+    counts = {p: sum(proof_priority(product.get('category')) == p for product, _, _ in requests) for p in PRIORITIES}
+    print(f"{N_PROOFS} proof requests ({', '.join(f'{n} {p}' for p, n in counts.items())}), "
+          f"prover time scaled by {PROVER_SCALE}\n")
+    print_table(["mode", "seconds", "proofs/s", "speedup", "military p50 wait ms", "healthcare p50 wait ms",
+                 "standard p50 wait ms"], rows)
+
+    withdrawn, served, seconds = run_cancellation(prove, requests, 4)
+    print(f"\nCancelling every standard job right after a burst (4 workers): {withdrawn} cancelled, "
+          f"{served} proofs served in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/bench_region_index.py
+# Country -> region lookups for bulk lane planning: the original nested
+# get_region (lists rebuilt per call, linear scans, silent "Asia" default)
+# vs the frozen index built at import.
+#   python -m benchmarks.bench_region_index
+
+import itertools
+
+from benchmarks._common import print_table, timed
+from chainflow.geography import COUNTRIES, COUNTRY_REGION_INDEX, hubs_for, region_of
+
+
+def legacy_get_region(country):
+    asia_countries = ["China", "India", "Japan", "Singapore", "Thailand", "Vietnam", "Malaysia", "Indonesia", "South Korea", "Philippines"]
+    europe_countries = ["Germany", "France", "United Kingdom", "Italy", "Spain", "Netherlands", "Belgium", "Switzerland", "Austria", "Sweden", "Norway", "Denmark"]
+    americas_countries = ["United States", "Canada", "Brazil", "Mexico", "Argentina", "Chile", "Colombia", "Peru"]
+    africa_countries = ["South Africa", "Nigeria", "Egypt", "Kenya", "Ghana", "Morocco", "Ethiopia"]
+
+    if country in asia_countries: return "Asia"
+    elif country in europe_countries: return "Europe"
+    elif country in americas_countries: return "Americas"
+    elif country in africa_countries: return "Africa"
+    else: return "Asia"  # Default
+
+
+def lookup_all(pairs, lookup):
+    for origin, destination in pairs:
+        lookup(origin)
+        lookup(destination)
+
+
+def main():
+    pairs = list(itertools.product(COUNTRIES, COUNTRIES)) * 10
+    rows = []
+    for name, lookup in [("legacy get_region", legacy_get_region), ("region_of", region_of),
+                         ("COUNTRY_REGION_INDEX[...]", COUNTRY_REGION_INDEX.__getitem__), ("hubs_for", hubs_for)]:
+        _, seconds = timed(lookup_all, pairs, lookup, repeat=3)
+        rows.append([name, f"{seconds * 1e3:.1f}", f"{seconds / (2 * len(pairs)) * 1e9:.0f}"])
+
+    wrong = [c for c in COUNTRIES if legacy_get_region(c) != COUNTRY_REGION_INDEX[c]]
+    print(f"{2 * len(pairs):,} lookups over {len(pairs):,} lanes\n")
+    print_table(["lookup", "total ms", "ns/lookup"], rows)
+    print(f"\nlegacy lookup misassigns {len(wrong)} of {len(COUNTRIES)} countries, e.g. {', '.join(wrong[:5])}")
+
+
+if __name__ == "__main__":
+    main()
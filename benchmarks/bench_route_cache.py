@@ -0,0 +1,83 @@
+# benchmarks/bench_route_cache.py
+# Route result cache: a day of planner queries drawn (Zipf-like) from a few
+# hundred lanes, served uncached vs through RouteCache at several sizes, and
+# single-flight behaviour under concurrent identical requests.
+#   python -m benchmarks.bench_route_cache
+
+import random
+import threading
+import time
+
+from benchmarks._common import load_app, print_table
+from chainflow.cache import RouteCache
+from chainflow.geography import COUNTRIES
+
+N_LANES = 300
+N_QUERIES = 20_000
+AVOID_CHOICES = [(), ("High Risk Areas",), ("Port Congestion",)]
+
+
+def planner_queries(seed=0):
+    rng = random.Random(seed)
+    lanes = []
+    while len(lanes) < N_LANES:
+        origin, destination = rng.sample(COUNTRIES, 2)
+        lanes.append((origin, destination, rng.choice(["Cost", "Time", "Sustainability"]), 4,
+                      rng.choice(AVOID_CHOICES), "Standard"))
+    weights = [1 / (rank + 1) for rank in range(N_LANES)]
+    return rng.choices(lanes, weights=weights, k=N_QUERIES)
+
+
+def replay(app, queries, cache):
+    start = time.perf_counter()
+    for query in queries:
+        if cache is None:
+            app.compute_optimized_route(*query)
+        else:
+            cache.get_or_compute(app.route_cache_key(*query), lambda: app.compute_optimized_route(*query))
+    return time.perf_counter() - start
+
+
+def main():
+    app = load_app()
+    queries = planner_queries()
+
+    rows = []
+    uncached_s = replay(app, queries[:2000], None) * (len(queries) / 2000)
+    rows.append(["uncached (extrapolated)", "-", f"{uncached_s:.2f}", f"{uncached_s / len(queries) * 1e6:.0f}", "-", "-"])
+    for maxsize in (64, 128, 512):
+        cache = RouteCache(maxsize=maxsize, ttl=3600)
+        seconds = replay(app, queries, cache)
+        stats = cache.stats()
+        rows.append([f"RouteCache({maxsize})", maxsize, f"{seconds:.2f}", f"{seconds / len(queries) * 1e6:.0f}",
+                     f"{stats['hit_rate']:.1%}", stats['evictions']])
+    print(f"{N_QUERIES:,} queries over {N_LANES} lanes\n")
+    print_table(["mode", "size", "total s", "us/query", "hit rate", "evictions"], rows)
+
+    # 32 sessions ask for the same uncached lane at once; 50 ms of simulated
+    # I/O makes the requests overlap the computation
+    cache = RouteCache()
+    computed = []
+
+    def compute():
+        computed.append(1)
+        time.sleep(0.05)
+        return app.compute_optimized_route(*queries[0])
+
+    barrier = threading.Barrier(32)
+
+    def request():
+        barrier.wait()
+        cache.get_or_compute("lane", compute)
+
+    threads = [threading.Thread(target=request) for _ in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"\n32 concurrent identical requests -> {len(computed)} computation, "
+          f"{cache.stats()['coalesced']} coalesced waiters, {cache.stats()['hits']} hits")
+
+
+if __name__ == "__main__":
+    main()
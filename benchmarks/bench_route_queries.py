@@ -0,0 +1,43 @@
+# benchmarks/bench_route_queries.py
+# Hub network build time and per-query shortest-path latency over every
+# origin/destination country pair for each optimization priority.
+#   python -m benchmarks.bench_route_queries
+
+import itertools
+import time
+
+from benchmarks._common import print_table, timed
+from chainflow.geography import COUNTRIES
+from chainflow.routing import PRIORITY_METRICS, build_hub_network
+
+
+def main():
+    network, build_seconds = timed(build_hub_network, repeat=5)
+    print(f"network: {len(network.labels)} nodes, {network.edge_count} directed edges, "
+          f"built in {build_seconds * 1e3:.2f} ms\n")
+
+    pairs = list(itertools.product(COUNTRIES, COUNTRIES))
+    rows = []
+    for priority in PRIORITY_METRICS:
+        latencies = []
+        for origin, destination in pairs:
+            start = time.perf_counter()
+            network.shortest_path(origin, destination, priority)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        rows.append([
+            priority, len(pairs),
+            f"{sum(latencies) / len(latencies) * 1e6:.0f}",
+            f"{latencies[len(latencies) // 2] * 1e6:.0f}",
+            f"{latencies[int(len(latencies) * 0.99)] * 1e6:.0f}",
+        ])
+    print_table(["priority", "queries", "mean us", "p50 us", "p99 us"], rows)
+
+    first = [network.shortest_path(a, b, "Cost")["path"] for a, b in pairs[:500]]
+    again = [build_hub_network().shortest_path(a, b, "Cost")["path"] for a, b in pairs[:500]]
+    assert first == again, "routes differ between builds"
+    print("\nroutes identical across independent network builds")
+
+
+if __name__ == "__main__":
+    main()
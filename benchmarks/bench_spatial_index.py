@@ -0,0 +1,77 @@
+# benchmarks/bench_spatial_index.py
+# Driver dispatch lookups over 1M delivery points and drivers in a metro
+# area: bulk build, k-nearest and radius queries through GridIndex vs a
+# brute-force haversine scan, and the cost of drivers moving (incremental
+# move/insert/remove).
+#   python -m benchmarks.bench_spatial_index
+
+import time
+
+import numpy as np
+
+from benchmarks._common import print_table, timed
+from chainflow.spatial import GridIndex, _haversine_to
+
+N_POINTS = 1_000_000
+N_QUERIES = 2_000
+# Bay Area bounding box (lat, lon)
+BOX = ((37.2, 38.1), (-122.6, -121.7))
+
+
+def metro_points(n, rng):
+    lats = rng.uniform(*BOX[0], n)
+    lons = rng.uniform(*BOX[1], n)
+    return lats, lons
+
+
+def run_queries(index, queries, query):
+    for lat, lon in queries:
+        query(index, lat, lon)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    lats, lons = metro_points(N_POINTS, rng)
+    queries = np.column_stack(metro_points(N_QUERIES, rng)).tolist()
+
+    index = GridIndex(cell_km=0.5)
+    _, build_s = timed(index.insert_many, range(N_POINTS), lats, lons)
+    print(f"{N_POINTS:,} points, {len(index._cells):,} cells of {index.cell_km} km, built in {build_s:.2f}s\n")
+
+    rows = []
+    brute_queries = queries[:50]
+    _, seconds = timed(run_queries, None, brute_queries,
+                       lambda _, lat, lon: np.argpartition(_haversine_to(lat, lon, lats, lons), 9)[:10])
+    rows.append(["brute-force 10-nearest", f"{seconds / len(brute_queries) * 1e3:.2f}", f"{len(brute_queries) / seconds:,.0f}"])
+    for name, query in [("nearest(k=1)", lambda ix, lat, lon: ix.nearest(lat, lon, 1)),
+                        ("nearest(k=10)", lambda ix, lat, lon: ix.nearest(lat, lon, 10)),
+                        ("within(0.5 km)", lambda ix, lat, lon: ix.within(lat, lon, 0.5)),
+                        ("within(2 km)", lambda ix, lat, lon: ix.within(lat, lon, 2.0))]:
+        _, seconds = timed(run_queries, index, queries, query)
+        rows.append([f"GridIndex.{name}", f"{seconds / len(queries) * 1e3:.2f}", f"{len(queries) / seconds:,.0f}"])
+    print_table(["query", "ms/query", "queries/s"], rows)
+
+    # Every driver in a 10k fleet reports a new position, then shifts change
+    fleet = rng.choice(N_POINTS, 10_000, replace=False).tolist()
+    new_lats, new_lons = metro_points(len(fleet), rng)
+    start = time.perf_counter()
+    for key, lat, lon in zip(fleet, new_lats.tolist(), new_lons.tolist()):
+        index.move(key, lat, lon)
+    move_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in fleet:
+        index.remove(key)
+    remove_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for key, lat, lon in zip(fleet, new_lats.tolist(), new_lons.tolist()):
+        index.insert(key, lat, lon)
+    insert_s = time.perf_counter() - start
+    print()
+    print_table(["update", "us/op", "ops/s"], [
+        [name, f"{seconds / len(fleet) * 1e6:.1f}", f"{len(fleet) / seconds:,.0f}"]
+        for name, seconds in [("move", move_s), ("remove", remove_s), ("insert", insert_s)]
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_trust_scoring.py
+# Throughput of calculate_trust_scores over a large supplier registry versus
+# calling calculate_trust_score row by row, with an exact-match check.
+#   python -m benchmarks.bench_trust_scoring [n_suppliers]
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import load_app, print_table, timed
+
+
+def main(n_suppliers=2_000_000, loop_rows=20_000):
+    app = load_app()
+
+    base = app.generate_trust_scoring_dataset()
+    registry = base.sample(n=n_suppliers, replace=True, random_state=0).reset_index(drop=True)
+
+    records = registry.head(loop_rows).to_dict("records")
+    loop_scores, loop_seconds = timed(lambda: [app.calculate_trust_score(r) for r in records])
+
+    batch_scores, batch_seconds = timed(app.calculate_trust_scores, registry, repeat=3)
+
+    assert np.array_equal(batch_scores.to_numpy()[:loop_rows], np.asarray(loop_scores, dtype=float))
+    assert isinstance(batch_scores, pd.Series) and len(batch_scores) == n_suppliers
+
+    loop_rate = loop_rows / loop_seconds
+    batch_rate = n_suppliers / batch_seconds
+    print_table(
+        ["mode", "suppliers", "seconds", "suppliers/sec"],
+        [
+            ["calculate_trust_score loop", loop_rows, f"{loop_seconds:.3f}", f"{loop_rate:,.0f}"],
+            ["calculate_trust_scores", n_suppliers, f"{batch_seconds:.3f}", f"{batch_rate:,.0f}"],
+        ],
+    )
+    print(f"\nspeed-up: {batch_rate / loop_rate:,.0f}x (scores identical on the overlapping rows)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
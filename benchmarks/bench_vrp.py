@@ -0,0 +1,38 @@
+# benchmarks/bench_vrp.py
+# Last-mile CVRPTW on synthetic city instances (clustered stops around one
+# depot, 2-hour/4-hour/same-day windows, priority deadlines): savings
+# construction vs after local search, vans used, solve time, and an
+# independent check that every route meets capacity and time windows.
+#   python -m benchmarks.bench_vrp
+
+from benchmarks._common import print_table
+from chainflow.vrp import VAN_CAPACITY_KG, solve_vrptw, synthetic_city_stops
+
+SIZES = [500, 1000, 2000, 5000]
+
+
+def violations(stops, plan):
+    """Routes over capacity plus stops served outside their window"""
+    schedule = plan['schedule']
+    over = sum(stops.loc[route, 'weight_kg'].sum() > VAN_CAPACITY_KG + 1e-6 for route in plan['routes'])
+    start = schedule['start_min']
+    late = ((start > stops.loc[schedule.index, 'due_min'] + 0.05)
+            | (start < stops.loc[schedule.index, 'ready_min'] - 0.05)).sum()
+    return int(over + late)
+
+
+def main():
+    rows = []
+    for n_stops in SIZES:
+        stops = synthetic_city_stops(n_stops, seed=1)
+        plan = solve_vrptw(stops, time_limit=30.0)
+        construction, final = plan['construction_km'], plan['distance_km']
+        rows.append([f"{n_stops:,}", f"{plan['baseline_km']:,.0f}", f"{construction:,.0f}", f"{final:,.0f}",
+                     f"{1 - final / construction:.1%}", plan['vehicles'], len(plan['unserved']),
+                     f"{plan['seconds']:.2f}", violations(stops, plan)])
+    print_table(["stops", "out-and-back km", "savings km", "final km", "improved", "vans", "unserved",
+                 "seconds", "violations"], rows)
+
+
+if __name__ == "__main__":
+    main()
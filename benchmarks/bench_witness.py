@@ -0,0 +1,45 @@
+# benchmarks/bench_witness.py
+# Batch Prover.toml / witness generation for a 100k-product catalogue:
+# mapping products to main.nr Field inputs, then streaming them to one
+# Prover.toml per product and to a single packed JSONL file.
+#   python -m benchmarks.bench_witness
+
+import tempfile
+from pathlib import Path
+
+from benchmarks._common import print_table, timed
+from benchmarks._synthetic_catalog import build_synthetic_catalog
+from chainflow.witness import WitnessBuilder, read_packed, write_packed, write_prover_tomls
+
+N_PRODUCTS = 100_000
+N_TOML_FILES = 20_000
+
+
+def main():
+    catalog = build_synthetic_catalog(N_PRODUCTS)
+    builder, setup = timed(WitnessBuilder, catalog)
+    witnesses, build = timed(lambda: list(builder.witnesses()))
+    subset = dict(list(catalog["products"].items())[:N_TOML_FILES])
+
+    with tempfile.TemporaryDirectory() as directory:
+        _, tomls = timed(write_prover_tomls, builder.witnesses(subset), Path(directory) / "provers")
+        packed_path = Path(directory) / "witnesses.jsonl"
+        _, packed = timed(write_packed, builder.witnesses(), packed_path)
+        size_mb = packed_path.stat().st_size / 1e6
+        _, reread = timed(lambda: sum(1 for _ in read_packed(packed_path)))
+        first = next(read_packed(packed_path))
+
+    rows = [
+        ["builder setup (registry roots)", "-", f"{setup:.2f}", "-"],
+        ["map to Field inputs", f"{N_PRODUCTS:,}", f"{build:.2f}", f"{N_PRODUCTS / build:,.0f}"],
+        ["one Prover.toml per product", f"{N_TOML_FILES:,}", f"{tomls:.2f}", f"{N_TOML_FILES / tomls:,.0f}"],
+        [f"packed JSONL ({size_mb:,.0f} MB)", f"{N_PRODUCTS:,}", f"{packed:.2f}", f"{N_PRODUCTS / packed:,.0f}"],
+        ["read packed JSONL back", f"{N_PRODUCTS:,}", f"{reread:.2f}", f"{N_PRODUCTS / reread:,.0f}"],
+    ]
+    print(f"{N_PRODUCTS:,} products, {len(catalog['suppliers']):,} suppliers\n")
+    print_table(["stage", "products", "seconds", "products/s"], rows)
+    print(f"\nround trip matches: {first == witnesses[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# benchmarks/fake_nargo.py
+# Stand-in for the nargo CLI so the prover runner can be exercised without a
+# Noir toolchain. Implements compile, execute, check and info in the current
+# directory with nargo's file layout (target/<package>.json, target/<name>.gz)
+# and sleeps to imitate their cost. Like nargo, execute recompiles unless
+# target/ holds an artifact whose hash matches the sources.
+#   CHAINFLOW_NARGO=benchmarks/fake_nargo.py
+#   FAKE_NARGO_COMPILE_SECONDS (default 0.5), FAKE_NARGO_EXECUTE_SECONDS (0.1),
+#   FAKE_NARGO_CHECK_SECONDS (0.3)
+#   FAKE_NARGO_FAIL: comma-separated commands that exit with an error
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+import tomllib
+from pathlib import Path
+
+
+def seconds(stage, default):
+    return float(os.environ.get(f"FAKE_NARGO_{stage.upper()}_SECONDS", default))
+
+
+def package():
+    with open("Nargo.toml", "rb") as f:
+        return tomllib.load(f)["package"]["name"]
+
+
+def source_hash():
+    return hashlib.sha256(Path("src/main.nr").read_bytes() + Path("Nargo.toml").read_bytes()).hexdigest()
+
+
+def artifact_path():
+    return Path("target") / f"{package()}.json"
+
+
+def compile_():
+    time.sleep(seconds("compile", 0.5))
+    path = artifact_path()
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps({"noir_version": "fake", "hash": source_hash(), "abi": {}, "bytecode": ""}))
+
+
+def compiled():
+    try:
+        return json.loads(artifact_path().read_text())["hash"] == source_hash()
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def execute(name):
+    if not compiled():
+        compile_()
+    try:
+        inputs = Path("Prover.toml").read_bytes()
+    except OSError:
+        sys.exit("error: Prover.toml not found")
+    time.sleep(seconds("execute", 0.1))
+    witness = Path("target") / f"{name}.gz"
+    witness.write_bytes(gzip.compress(hashlib.sha256(inputs).digest()))
+    print(f"[{package()}] Circuit witness successfully solved")
+    print(f"[{package()}] Witness saved to {witness.resolve()}")
+
+
+def main(args):
+    command = args[0] if args else None
+    if command in os.environ.get("FAKE_NARGO_FAIL", "").split(","):
+        sys.exit(f"error: fake nargo {command} failure")
+    if command == "compile":
+        compile_()
+    elif command == "execute":
+        execute(args[1] if len(args) > 1 else package())
+    elif command in ("check", "info"):
+        if not compiled():
+            compile_()
+        time.sleep(seconds("check", 0.3))
+        if command == "check" and not Path("Prover.toml").exists():
+            Path("Prover.toml").write_text("")
+        if command == "info":
+            print("+---------+----------+----------------------+--------------+")
+            print("| Package | Function | Expression Width     | ACIR Opcodes |")
+            print("+---------+----------+----------------------+--------------+")
+            print(f"| {package()} | main     | Bounded {{ width: 4 }} | 42           |")
+            print("+---------+----------+----------------------+--------------+")
+    else:
+        sys.exit(f"fake nargo: unsupported command {command!r}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
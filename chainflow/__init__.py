@@ -0,0 +1,6 @@
+"""
+ChainFlow Python services used by streamlit_app.py.
+
+Modules here have no Streamlit dependency so they can be imported from
+worker processes, batch jobs and benchmarks as well as from the app.
+"""
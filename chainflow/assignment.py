@@ -0,0 +1,160 @@
+"""
+Batch assignment of packages to verified drivers at shift start.
+
+Each driver offers ``capacity`` package slots. A package may only go to a
+driver whose security clearance is at least the package's required level,
+and the assignment serves as many packages as possible with the least
+total driver-to-package travel (great-circle km). It is solved exactly
+with the Hungarian method in its successive-shortest-path form, run over
+drivers rather than individual slots: each augmenting path is a Dijkstra
+search across the (few hundred) drivers with one vectorized relaxation per
+full driver, instead of one per package slot.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from chainflow.distances import haversine_matrix
+
+CLEARANCE_LEVELS = ["Standard", "Enhanced", "Military-Grade"]
+CLEARANCE_RANK = {level: rank for rank, level in enumerate(CLEARANCE_LEVELS)}
+
+def clearance_rank(levels):
+    """Integer rank of clearance level names"""
+    try:
+        return np.array([CLEARANCE_RANK[level] for level in levels], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"Unknown clearance level: {e.args[0]}") from None
+
+def clearance_mask(package_levels, driver_levels):
+    """(packages, drivers) bool array: may each driver carry each package?"""
+    return clearance_rank(driver_levels)[None, :] >= clearance_rank(package_levels)[:, None]
+
+def min_cost_assignment(cost, feasible=None, capacity=None):
+    """
+    Minimum-cost assignment of rows to columns that each take up to
+    `capacity` rows (default 1).
+
+    `cost` is an (n, m) array of non-negative costs and `feasible` an
+    optional bool mask of allowed pairs. As many rows as possible are
+    assigned, at minimum total cost among those plans; rows that cannot be
+    served get -1. Returns the column of each row.
+    """
+    cost = np.asarray(cost, dtype=float)
+    n, m = cost.shape
+    feasible = np.ones((n, m), dtype=bool) if feasible is None else np.asarray(feasible, dtype=bool)
+    capacity = np.ones(m, dtype=np.int64) if capacity is None else np.asarray(capacity, dtype=np.int64)
+    if n == 0 or m == 0 or not feasible.any():
+        return np.full(n, -1, dtype=np.int64)
+
+    # Column m is "no column", open to every row at a cost above any plan
+    # that serves one more row
+    unserved = n * cost[feasible].max() + 1
+    costs = np.empty((n, m + 1))
+    costs[:, :m] = np.where(feasible, cost, np.inf)
+    costs[:, m] = unserved
+    capacity = np.append(capacity, n)
+
+    # Successive shortest augmenting paths (Hungarian method) over columns:
+    # u, v are dual potentials keeping reduced costs non-negative, and a
+    # full column is left through any of the rows it holds
+    u = np.zeros(n)
+    v = np.zeros(m + 1)
+    column_of = np.full(n, -1, dtype=np.int64)
+    members = [[] for _ in range(m + 1)]
+    load = np.zeros(m + 1, dtype=np.int64)
+    columns = np.arange(m + 1)
+    for i in range(n):
+        # Tentative path costs to unvisited columns; visited ones are +inf
+        label = costs[i] - v
+        source = np.full(m + 1, i)
+        visited = np.zeros(m + 1, dtype=bool)
+        path = []
+        while True:
+            j = int(label.argmin())
+            dist = label[j]
+            if load[j] < capacity[j]:
+                break
+            label[j] = np.inf
+            visited[j] = True
+            path.append((j, dist))
+            rows = members[j]
+            if not rows:
+                continue
+            if len(rows) == 1:
+                row = rows[0]
+                candidate = costs[row] - (u[row] - dist) - v
+                candidate[visited] = np.inf
+                np.putmask(source, candidate < label, row)
+            else:
+                reduced = costs[rows] - u[rows, None]
+                best = reduced.argmin(axis=0)
+                candidate = reduced[best, columns] + dist - v
+                candidate[visited] = np.inf
+                better = candidate < label
+                source[better] = np.asarray(rows)[best[better]]
+            np.minimum(label, candidate, out=label)
+
+        for k, reached in path:
+            v[k] -= dist - reached
+            u[members[k]] += dist - reached
+        u[i] += dist
+
+        # Shift rows along the path: each takes the column it was reached
+        # through and frees its previous one, ending at row i
+        load[j] += 1
+        while True:
+            row = source[j]
+            previous = column_of[row]
+            column_of[row] = j
+            members[j].append(row)
+            if row == i:
+                break
+            members[previous].remove(row)
+            j = previous
+
+    column_of[column_of == m] = -1
+    return column_of
+
+def assign_packages(drivers, packages, capacity=1):
+    """
+    Assign packages to drivers at shift start.
+
+    `drivers` has driver_id, lat, lon, clearance and optionally capacity
+    (package slots, default `capacity`); `packages` has package_id, lat,
+    lon and clearance (the minimum level required). Travel is measured
+    from each driver's position to the package pickup, one trip per slot.
+    Returns (assignments, summary): one row per package with its driver
+    (None if no cleared driver had a free slot) and distance_km, plus
+    totals and solve time.
+    """
+    started = time.perf_counter()
+    slots = drivers['capacity'].fillna(capacity).astype(int) if 'capacity' in drivers else \
+        pd.Series(capacity, index=drivers.index)
+
+    distance = haversine_matrix(packages[['lat', 'lon']].to_numpy(float), drivers[['lat', 'lon']].to_numpy(float))
+    allowed = clearance_mask(packages['clearance'], drivers['clearance'])
+    driver_of = min_cost_assignment(distance, allowed, slots.to_numpy())
+
+    assigned = driver_of >= 0
+    km = np.where(assigned, distance[np.arange(len(packages)), np.maximum(driver_of, 0)], np.nan)
+    driver_ids = drivers['driver_id'].to_numpy(object)
+    assignments = pd.DataFrame({
+        'package_id': packages['package_id'].to_numpy(),
+        'clearance': packages['clearance'].to_numpy(),
+        'driver_id': np.where(assigned, driver_ids[np.maximum(driver_of, 0)], None),
+        'distance_km': np.round(km, 3)
+    }, index=packages.index)
+    summary = {
+        'packages': len(packages),
+        'drivers': len(drivers),
+        'slots': int(slots.sum()),
+        'assigned': int(assigned.sum()),
+        'unassigned': int((~assigned).sum()),
+        'total_km': float(np.nansum(km)),
+        'mean_km': float(np.nanmean(km)) if assigned.any() else 0.0,
+        'seconds': time.perf_counter() - started
+    }
+    return assignments, summary
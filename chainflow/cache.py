@@ -0,0 +1,149 @@
+"""
+Bounded in-process result cache for ChainFlow route planning.
+
+Streamlit serves every session from threads of one process, so the cache
+is thread-safe and single-flights misses: concurrent requests for the same
+key wait for the first caller's computation instead of repeating it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+class _Flight:
+    """A computation in progress that other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.abandoned = False
+
+class RouteCache:
+    """
+    LRU cache with a per-entry time-to-live and hit/miss/eviction counters.
+
+    ``maxsize`` bounds the number of entries (least recently used evicted
+    first); ``ttl`` is in seconds, None for no expiry. Failed computations
+    are not cached. An Exception is raised to every waiting caller. A
+    BaseException (a Streamlit rerun/stop, KeyboardInterrupt, a cancellation)
+    belongs to the leader's own session, so it is raised only there and the
+    waiters retry the computation themselves. Cached values are shared
+    between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize=512, ttl=3600.0, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def get_or_compute(self, key, compute):
+        """Cached value for `key`, calling `compute()` once on a miss"""
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+                flight = self._inflight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._inflight[key] = _Flight()
+                    self.misses += 1
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                break
+            flight.done.wait()
+            if flight.abandoned:
+                continue
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = compute()
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+            raise
+        except BaseException:
+            flight.abandoned = True
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._inflight[key]
+        flight.value = value
+        flight.done.set()
+        return value
+
+    def __contains__(self, key):
+        """True if `key` holds a live entry (does not touch recency or counters)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Drop every entry; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters plus current size and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'coalesced': self.coalesced,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def _expired(self, entry):
+        return entry[0] is not None and entry[0] <= self._clock()
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if self._expired(entry):
+            del self._entries[key]
+            self.expirations += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key, value):
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
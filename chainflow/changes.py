@@ -0,0 +1,237 @@
+"""
+Incremental re-proving when ``database/products.json`` changes.
+
+Every product, supplier, distributor and retailer record gets a content hash
+(canonical JSON, so key order does not matter). A ProofManifest stores the
+hashes and each product's circuit-input hash as of the last proven state.
+When the catalogue changes, only the changed records are diffed. Their
+dependants come from a DependencyMap (supplier -> products, distributor ->
+products, retailer -> products). Witnesses are rebuilt only for those
+candidate products, and a product is re-queued only if its main.nr inputs
+actually differ. For example, renaming a supplier re-queues nothing, while
+changing its tier re-queues only that supplier's products.
+
+``trusted_supplier_root`` and ``supply_chain_root`` are left out of the
+per-product input hash by default. They change with any registry edit, and
+an existing proof stays valid against the root it was generated for. The
+manifest records the roots, and a plan reports when they moved. Pass
+``include_roots=True`` to re-prove everything whenever a root changes.
+Circuit-wide inputs (circuit_id, proof_version, zkverify_chain_id) always
+re-queue the whole catalogue when they change.
+"""
+
+import json
+from pathlib import Path
+
+from chainflow.proof_cache import canonical_hash
+from chainflow.storage import atomic_write
+from chainflow.witness import WitnessBuilder
+
+MANIFEST_FORMAT = 1
+RECORD_KINDS = ("products", "suppliers", "distributors", "retailers")
+ROOT_INPUTS = ("trusted_supplier_root", "supply_chain_root")
+GLOBAL_INPUTS = ("circuit_id", "proof_version", "zkverify_chain_id")
+
+def record_hashes(catalog):
+    """{kind: {record_id: content hash}} for every catalogue record"""
+    return {
+        kind: {str(record_id): canonical_hash(record) for record_id, record in catalog.get(kind, {}).items()}
+        for kind in RECORD_KINDS
+    }
+
+def diff_hashes(old, new):
+    """(added, modified, removed) record IDs between two {record_id: hash} maps"""
+    added = {record_id for record_id in new if record_id not in old}
+    removed = {record_id for record_id in old if record_id not in new}
+    modified = {record_id for record_id, digest in new.items() if record_id in old and old[record_id] != digest}
+    return added, modified, removed
+
+def input_hash(inputs, exclude=ROOT_INPUTS):
+    """Content hash of one product's circuit inputs, without the `exclude` fields"""
+    return canonical_hash({name: value for name, value in inputs.items() if name not in exclude})
+
+class DependencyMap:
+    """
+    Which products each supplier, distributor and retailer feeds into, as the
+    witness builder joins them: the product's supplier_id, its supply chain
+    intermediates and its destination.
+    """
+
+    def __init__(self, catalog):
+        self.dependents = {kind: {} for kind in RECORD_KINDS[1:]}
+        for product_id, product in catalog.get("products", {}).items():
+            for kind, record_id in self.links(product):
+                self.dependents[kind].setdefault(record_id, set()).add(product_id)
+
+    @staticmethod
+    def links(product):
+        """(kind, record_id) pairs a product depends on"""
+        links = [("suppliers", str(product.get("supplier_id")))]
+        chain = product.get("supply_chain", {})
+        links += [("distributors", str(location)) for location in chain.get("intermediates", []) if location]
+        destination = chain.get("destination")
+        if destination is not None:
+            links.append(("retailers", str(destination)))
+        return links
+
+    def affected(self, kind, record_ids):
+        """Products depending on any of `record_ids` of registry `kind`"""
+        products = set()
+        for record_id in record_ids:
+            products |= self.dependents[kind].get(str(record_id), set())
+        return products
+
+class ReprovePlan:
+    """
+    What a catalogue edit requires. ``to_prove`` maps product IDs to their
+    new inputs; ``refreshed`` lists candidates whose records changed but whose
+    inputs did not. ``reasons`` says why each candidate was considered, and
+    ``changed_records`` gives {kind: (added, modified, removed)}.
+    """
+
+    def __init__(self, record_hashes, changed_records, to_prove, refreshed, removed, reasons, roots, globals_,
+                 roots_changed, input_hashes):
+        self.record_hashes = record_hashes
+        self.changed_records = changed_records
+        self.to_prove = to_prove
+        self.refreshed = refreshed
+        self.removed = removed
+        self.reasons = reasons
+        self.roots = roots
+        self.globals = globals_
+        self.roots_changed = roots_changed
+        self.input_hashes = input_hashes
+
+    def __len__(self):
+        return len(self.to_prove)
+
+    def summary(self):
+        return {
+            'to_prove': len(self.to_prove),
+            'refreshed': len(self.refreshed),
+            'removed': len(self.removed),
+            'roots_changed': self.roots_changed,
+            'changed_records': {kind: sum(len(ids) for ids in changes)
+                                for kind, changes in self.changed_records.items()}
+        }
+
+class ProofManifest:
+    """
+    The last proven state of a catalogue, stored as one JSON file at `path`
+    (None for memory only). ``plan`` diffs a catalogue against it, and
+    ``commit`` records the outcome once the queued proofs have run. Products
+    whose proofs did not complete stay out of the manifest and are picked
+    up again by the next plan.
+    """
+
+    def __init__(self, path=None, include_roots=False):
+        self.path = None if path is None else Path(path)
+        self.include_roots = include_roots
+        self.records = {kind: {} for kind in RECORD_KINDS}
+        self.inputs = {}
+        self.roots = {}
+        self.globals = {}
+        if self.path is not None:
+            self._load()
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(state, dict) or state.get('format') != MANIFEST_FORMAT:
+            return
+        self.records = {kind: dict(state.get('records', {}).get(kind, {})) for kind in RECORD_KINDS}
+        self.inputs = dict(state.get('inputs', {}))
+        self.roots = dict(state.get('roots', {}))
+        self.globals = dict(state.get('globals', {}))
+
+    def save(self):
+        """Atomically write the manifest"""
+        if self.path is None:
+            return
+        state = {
+            'format': MANIFEST_FORMAT,
+            'records': self.records,
+            'inputs': self.inputs,
+            'roots': self.roots,
+            'globals': self.globals
+        }
+        atomic_write(self.path, json.dumps(state, separators=(",", ":")))
+
+    def plan(self, catalog, builder=None, **builder_kwargs):
+        """ReprovePlan for `catalog` against the last proven state"""
+        builder = builder or WitnessBuilder(catalog, **builder_kwargs)
+        hashes = record_hashes(catalog)
+        changed = {kind: diff_hashes(self.records.get(kind, {}), hashes[kind]) for kind in RECORD_KINDS}
+        products = catalog.get("products", {})
+
+        roots = {name: str(getattr(builder, name)) for name in ROOT_INPUTS}
+        globals_ = {name: str(getattr(builder, name)) for name in GLOBAL_INPUTS}
+        roots_changed = bool(self.roots) and roots != self.roots
+        everything = globals_ != self.globals or (self.include_roots and roots != self.roots)
+
+        reasons = {}
+        if everything:
+            for product_id in products:
+                reasons[product_id] = ["circuit-wide inputs"]
+        else:
+            added, modified, _ = changed["products"]
+            for product_id in added | modified:
+                reasons.setdefault(product_id, []).append("product added" if product_id in added else "product")
+            for product_id in products:
+                if product_id not in self.inputs:
+                    reasons.setdefault(product_id, []).append("not proven")
+            dependencies = DependencyMap(catalog)
+            for kind in RECORD_KINDS[1:]:
+                for record_id in set().union(*changed[kind]):
+                    for product_id in dependencies.affected(kind, [record_id]):
+                        reasons.setdefault(product_id, []).append(f"{kind[:-1]} {record_id}")
+
+        exclude = () if self.include_roots else ROOT_INPUTS
+        to_prove, refreshed, input_hashes = {}, [], {}
+        for product_id in reasons:
+            inputs = builder.build(product_id, products[product_id])
+            digest = input_hashes[product_id] = input_hash(inputs, exclude)
+            if self.inputs.get(product_id) == digest:
+                refreshed.append(product_id)
+            else:
+                to_prove[product_id] = inputs
+        removed = sorted(product_id for product_id in self.inputs if product_id not in products)
+        return ReprovePlan(hashes, changed, to_prove, refreshed, removed, reasons, roots, globals_,
+                           roots_changed, input_hashes)
+
+    def commit(self, plan, proven=None):
+        """
+        Record `plan` as applied. `proven` lists the re-queued products whose
+        proofs completed (default: all of them); the rest stay pending.
+        """
+        proven = set(plan.to_prove) if proven is None else set(proven)
+        self.records = plan.record_hashes
+        self.roots = plan.roots
+        self.globals = plan.globals
+        for product_id in plan.removed:
+            self.inputs.pop(product_id, None)
+        for product_id in plan.refreshed:
+            self.inputs[product_id] = plan.input_hashes[product_id]
+        for product_id in plan.to_prove:
+            if product_id in proven:
+                self.inputs[product_id] = plan.input_hashes[product_id]
+            else:
+                self.inputs.pop(product_id, None)
+        self.save()
+
+def requeue(plan, queue, prove, priority="standard"):
+    """
+    Submit ``prove(product_id, inputs)`` to a ProofJobQueue for every product
+    in the plan; returns {product_id: job_id}. The queue's max_queued
+    bounds how large a plan can be submitted at once.
+    """
+    return {
+        product_id: queue.submit(prove, product_id, inputs, priority=priority, label=product_id)
+        for product_id, inputs in plan.to_prove.items()
+    }
@@ -0,0 +1,121 @@
+"""
+Great-circle distances between the ChainFlow countries and shipping hubs.
+
+Every location gets a fixed row/column in one haversine distance matrix
+(km), computed in a single vectorized pass. The matrix is cached in memory
+per process and on disk under a key derived from the coordinate table, so
+editing a coordinate invalidates the file automatically.
+"""
+
+import hashlib
+import io
+from functools import lru_cache
+
+import numpy as np
+
+from chainflow.geography import COUNTRY_COORDINATES, HUB_COORDINATES
+from chainflow.storage import ARTIFACT_DIR, atomic_write
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Shares the fitted-model cache directory used by streamlit_app.py
+DISTANCE_CACHE_DIR = ARTIFACT_DIR
+
+# Matrix order: every country, then every hub. Keyed by (name, hub) since
+# some names (e.g. Singapore) are both a country and a hub.
+LOCATIONS = [(name, False) for name in COUNTRY_COORDINATES] + [(name, True) for name in HUB_COORDINATES]
+LOCATION_INDEX = {location: i for i, location in enumerate(LOCATIONS)}
+HUB_INDICES = np.array([i for i, (_, hub) in enumerate(LOCATIONS) if hub])
+
+def location_index(name, hub=False):
+    """Row/column of a country (or hub) in the distance matrix"""
+    try:
+        return LOCATION_INDEX[(name, hub)]
+    except KeyError:
+        kind = "hub" if hub else "country"
+        raise ValueError(f"No coordinates for {kind}: {name}") from None
+
+def coordinate_array():
+    """(n, 2) float array of (latitude, longitude) in LOCATIONS order"""
+    return np.array(
+        [(HUB_COORDINATES if hub else COUNTRY_COORDINATES)[name] for name, hub in LOCATIONS],
+        dtype=float
+    )
+
+def haversine_matrix(coordinates, other=None):
+    """
+    Pairwise great-circle distances (km) between (lat, lon) rows of
+    `coordinates` and of `other` (defaults to `coordinates`).
+    """
+    other = coordinates if other is None else other
+    lat1, lon1 = np.radians(coordinates).T
+    lat2, lon2 = np.radians(other).T
+    
+    dlat = lat2[None, :] - lat1[:, None]
+    dlon = lon2[None, :] - lon1[:, None]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1)[:, None] * np.cos(lat2)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def distance_matrix_key():
+    """Content hash of the location order and coordinates"""
+    digest = hashlib.sha256(repr(LOCATIONS).encode())
+    digest.update(coordinate_array().tobytes())
+    digest.update(repr(EARTH_RADIUS_KM).encode())
+    return digest.hexdigest()
+
+def distance_matrix_path(key=None):
+    key = key or distance_matrix_key()
+    return DISTANCE_CACHE_DIR / f"distances-{key[:16]}.npy"
+
+@lru_cache(maxsize=None)
+def distance_matrix():
+    """
+    Read-only (n, n) float64 distance matrix in km, loaded from the disk
+    cache when present and written there (atomically) otherwise.
+    """
+    n = len(LOCATIONS)
+    path = distance_matrix_path()
+    try:
+        matrix = np.load(path, allow_pickle=False)
+        if matrix.shape != (n, n):
+            matrix = None
+    except (OSError, ValueError):
+        matrix = None
+    
+    if matrix is None:
+        matrix = haversine_matrix(coordinate_array())
+        _save_matrix(path, matrix)
+    
+    matrix.setflags(write=False)
+    return matrix
+
+def _save_matrix(path, matrix):
+    """Best-effort atomic write; an unwritable cache directory is not an error"""
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+    try:
+        atomic_write(path, buffer.getvalue())
+    except OSError:
+        pass
+
+def distance_km(a, b, a_hub=False, b_hub=False):
+    """Great-circle distance between two locations, an O(1) matrix lookup"""
+    return float(distance_matrix()[location_index(a, a_hub), location_index(b, b_hub)])
+
+@lru_cache(maxsize=None)
+def _hubs_by_distance():
+    """For every location, the matrix indices of all hubs sorted nearest first"""
+    return HUB_INDICES[np.argsort(distance_matrix()[:, HUB_INDICES], axis=1, kind='stable')]
+
+def nearest_hubs(name, n=1, hub=False, candidates=None):
+    """The `n` hubs nearest to a location, optionally only among `candidates`"""
+    allowed = None if candidates is None else set(candidates)
+    nearest = []
+    for index in _hubs_by_distance()[location_index(name, hub)]:
+        hub_name, _ = LOCATIONS[index]
+        if (hub and hub_name == name) or (allowed is not None and hub_name not in allowed):
+            continue
+        nearest.append(hub_name)
+        if len(nearest) == n:
+            break
+    return nearest
@@ -0,0 +1,55 @@
+"""
+BN254 scalar field helpers for circuit inputs.
+
+Noir's ``Field`` is an integer modulo the BN254 scalar field order. Values
+from the catalogue (IDs, tiers, hex hashes, free-text markers) are mapped
+to field elements here so every module encodes them the same way.
+"""
+
+import hashlib
+
+BN254_MODULUS = 21888242871839275222246405745257275088548364400416034343698204186575808495617
+FIELD_BYTES = 32
+# Clearing the top three bits of a 256-bit digest leaves a value below
+# 2**253 < BN254_MODULUS, i.e. always a canonical field element
+_TOP_BYTE_MASK = 0x1F
+
+def to_field(value):
+    """
+    Field element for a catalogue value: integers and decimal or 0x-hex
+    strings are read as numbers (reduced modulo the field), any other text
+    is hashed with hash_to_field. None and "" map to 0.
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value % BN254_MODULUS
+    text = str(value).strip()
+    try:
+        if text[:2].lower() == "0x":
+            return int(text[2:], 16) % BN254_MODULUS
+        return int(text) % BN254_MODULUS
+    except ValueError:
+        return hash_to_field(text.encode())
+
+def hash_to_field(data):
+    """Field element from SHA-256 of `data` (bytes)"""
+    return int.from_bytes(sha256_field_bytes(data), "big")
+
+def sha256_field_bytes(data):
+    """SHA-256 of `data` masked to a 32-byte big-endian field element"""
+    digest = bytearray(hashlib.sha256(data).digest())
+    digest[0] &= _TOP_BYTE_MASK
+    return bytes(digest)
+
+def field_bytes(element):
+    """32-byte big-endian encoding of a field element"""
+    return int(element).to_bytes(FIELD_BYTES, "big")
+
+def field_hex(element):
+    """0x-prefixed, zero-padded hex of a field element (int or 32 bytes)"""
+    if isinstance(element, (bytes, bytearray, memoryview)):
+        return "0x" + bytes(element).hex()
+    return f"0x{int(element):064x}"
@@ -0,0 +1,273 @@
+"""
+Streaming geofences for GPS location verification.
+
+Delivery-zone polygons ((lat, lon) rings; extra rings are holes under the
+even-odd rule) are rasterized once into a uniform grid. Each grid cell
+lists the zones it may belong to and whether it lies entirely inside
+them, so most pings are resolved by a cell lookup and only pings in
+cells crossed by a zone boundary need a point-in-polygon test.
+
+Pings (driver_id, lat, lon, ts) are evaluated in batches with NumPy. The
+engine remembers which zones each driver was last inside, so batches can
+be cut anywhere in the stream: a driver's pings are taken in arrival
+order and produce an "enter" event at the first ping inside a zone and
+an "exit" event at the first ping outside it.
+"""
+
+import json
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+
+from chainflow.spatial import KM_PER_DEGREE
+
+PING_COLUMNS = ['driver_id', 'lat', 'lon', 'ts']
+EVENT_COLUMNS = ['ts', 'driver_id', 'zone_id', 'event', 'lat', 'lon']
+
+def regular_zone(lat, lon, radius_km, sides=12):
+    """A regular polygon ring of `sides` vertices around (lat, lon)"""
+    angles = np.linspace(0, 2 * np.pi, sides, endpoint=False)
+    dlat = radius_km / KM_PER_DEGREE * np.sin(angles)
+    dlon = radius_km / (KM_PER_DEGREE * math.cos(math.radians(lat))) * np.cos(angles)
+    return np.column_stack([lat + dlat, lon + dlon])
+
+def _rings(polygon):
+    """A polygon given as one ring or a list of rings, as a list of (k, 2) arrays"""
+    if np.ndim(polygon[0]) == 1:
+        polygon = [polygon]
+    rings = [np.asarray(ring, dtype=float) for ring in polygon]
+    for ring in rings:
+        if ring.ndim != 2 or ring.shape[1] != 2 or len(ring) < 3:
+            raise ValueError("A zone ring needs at least three (lat, lon) vertices")
+    return rings
+
+def _edges(rings):
+    """(lat1, lon1, lat2, lon2, dlon/dlat) arrays of every ring edge"""
+    starts = np.concatenate(rings)
+    ends = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+    lat1, lon1 = starts.T
+    lat2, lon2 = ends.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(lat1 != lat2, (lon2 - lon1) / (lat2 - lat1), 0.0)
+    return lat1, lon1, lat2, lon2, slope
+
+def _contains(edges, lats, lons):
+    """Even-odd ray casting (towards +lon) of points against polygon edges"""
+    lat1, lon1, lat2, _, slope = edges
+    lats, lons = lats[:, None], lons[:, None]
+    straddles = (lat1 > lats) != (lat2 > lats)
+    crossing = lon1 + (lats - lat1) * slope
+    return np.count_nonzero(straddles & (lons < crossing), axis=1) % 2 == 1
+
+class GeofenceEngine:
+    """
+    Delivery zones indexed on a grid of `cell_deg` degree cells, plus the
+    zones each driver is currently inside.
+
+    `zones` maps zone IDs to polygons. Pick `cell_deg` well below the zone
+    size (the default is about 500 m) so most cells are wholly inside or
+    outside a zone. Methods are thread-safe.
+    """
+
+    def __init__(self, zones, cell_deg=0.005):
+        if not zones:
+            raise ValueError("At least one zone is required")
+        self.cell_deg = cell_deg
+        self.zone_ids = list(zones)
+        self._edges = [_edges(_rings(polygon)) for polygon in zones.values()]
+
+        lat1 = np.concatenate([edges[0] for edges in self._edges])
+        lon1 = np.concatenate([edges[1] for edges in self._edges])
+        self._lat0, self._lon0 = lat1.min(), lon1.min()
+        self._rows = int((lat1.max() - self._lat0) // cell_deg) + 1
+        self._columns = int((lon1.max() - self._lon0) // cell_deg) + 1
+
+        cells, owners, full = [], [], []
+        for z, edges in enumerate(self._edges):
+            boundary, interior = self._rasterize(edges)
+            cells += [boundary, interior]
+            owners += [np.full(len(boundary) + len(interior), z)]
+            full += [np.zeros(len(boundary), dtype=bool), np.ones(len(interior), dtype=bool)]
+        cells, owners, full = np.concatenate(cells), np.concatenate(owners), np.concatenate(full)
+
+        # Cell -> (zone, wholly inside) entries in CSR form, by cell id
+        order = np.argsort(cells, kind='stable')
+        self._cell_keys, first = np.unique(cells[order], return_index=True)
+        self._offsets = np.append(first, len(order))
+        self._entry_zone = owners[order]
+        self._entry_full = full[order]
+
+        self._inside = {}  # driver_id -> zone indices of the last ping
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_geojson(cls, collection, id_property='zone_id', cell_deg=0.005):
+        """Zones from a GeoJSON FeatureCollection of Polygon / MultiPolygon features ([lon, lat] order)"""
+        zones = {}
+        for number, feature in enumerate(collection['features']):
+            geometry = feature['geometry']
+            parts = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+            rings = [np.asarray(ring, dtype=float)[:, ::-1] for part in parts for ring in part]
+            zones[feature.get('properties', {}).get(id_property, number)] = rings
+        return cls(zones, cell_deg)
+
+    def _cell_range(self, lo, hi, origin):
+        return int((lo - origin) // self.cell_deg), int((hi - origin) // self.cell_deg)
+
+    def _rasterize(self, edges):
+        """Cell ids crossed by the zone's boundary, and cell ids wholly inside it"""
+        lat1, lon1, lat2, lon2, _ = edges
+        boundary = set()
+        for a, b, c, d in zip(np.minimum(lat1, lat2), np.maximum(lat1, lat2),
+                              np.minimum(lon1, lon2), np.maximum(lon1, lon2)):
+            row_lo, row_hi = self._cell_range(a, b, self._lat0)
+            col_lo, col_hi = self._cell_range(c, d, self._lon0)
+            for row in range(row_lo, row_hi + 1):
+                boundary.update(range(row * self._columns + col_lo, row * self._columns + col_hi + 1))
+
+        # Cells of the bounding box that no edge touches are wholly inside
+        # or wholly outside; their centres decide which
+        row_lo, row_hi = self._cell_range(lat1.min(), lat1.max(), self._lat0)
+        col_lo, col_hi = self._cell_range(lon1.min(), lon1.max(), self._lon0)
+        rows, cols = np.meshgrid(np.arange(row_lo, row_hi + 1), np.arange(col_lo, col_hi + 1), indexing='ij')
+        box = (rows * self._columns + cols).ravel()
+        boundary = np.fromiter(boundary, dtype=np.int64, count=len(boundary))
+        rest = ~np.isin(box, boundary)
+        centre_lat = self._lat0 + (rows.ravel()[rest] + 0.5) * self.cell_deg
+        centre_lon = self._lon0 + (cols.ravel()[rest] + 0.5) * self.cell_deg
+        interior = box[rest][_contains(edges, centre_lat, centre_lon)]
+        return boundary, interior
+
+    def locate(self, lats, lons):
+        """(ping index, zone index) pairs for every zone containing each point"""
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        with np.errstate(invalid='ignore'):
+            rows = np.floor((lats - self._lat0) / self.cell_deg)
+            cols = np.floor((lons - self._lon0) / self.cell_deg)
+            on_grid = (rows >= 0) & (rows < self._rows) & (cols >= 0) & (cols < self._columns)
+        points = np.flatnonzero(on_grid)
+        cells = rows[points].astype(np.int64) * self._columns + cols[points].astype(np.int64)
+        position = np.searchsorted(self._cell_keys, cells)
+        position[position == len(self._cell_keys)] = 0
+        listed = self._cell_keys[position] == cells
+        points, position = points[listed], position[listed]
+
+        # Expand each point into its cell's entries
+        starts = self._offsets[position]
+        counts = self._offsets[position + 1] - starts
+        point = np.repeat(points, counts)
+        entry = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+        zone = self._entry_zone[entry]
+        hit = self._entry_full[entry].copy()
+
+        # Boundary cells: point-in-polygon per zone
+        check = np.flatnonzero(~hit)
+        if len(check):
+            order = check[np.argsort(zone[check], kind='stable')]
+            zones, first = np.unique(zone[order], return_index=True)
+            for z, group in zip(zones.tolist(), np.split(order, first[1:])):
+                hit[group] = _contains(self._edges[z], lats[point[group]], lons[point[group]])
+        return point[hit], zone[hit]
+
+    def zones_at(self, lat, lon):
+        """IDs of the zones containing one point"""
+        _, zones = self.locate([lat], [lon])
+        return [self.zone_ids[z] for z in sorted(zones.tolist())]
+
+    def inside(self, driver_id):
+        """IDs of the zones a driver was inside at their last ping"""
+        return [self.zone_ids[z] for z in self._inside.get(driver_id, ())]
+
+    def forget(self, driver_id):
+        """Drop a driver's state so their next ping starts a new trail"""
+        with self._lock:
+            self._inside.pop(driver_id, None)
+
+    def process(self, pings):
+        """
+        Evaluate a batch of pings (DataFrame or mapping with PING_COLUMNS)
+        and return the enter/exit events as a DataFrame with EVENT_COLUMNS,
+        in ping order.
+        """
+        drivers = np.asarray(pings['driver_id'])
+        lats = np.asarray(pings['lat'], dtype=float)
+        lons = np.asarray(pings['lon'], dtype=float)
+        n = len(drivers)
+        if n == 0:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+        hit_ping, hit_zone = self.locate(lats, lons)
+        n_zones = len(self.zone_ids)
+
+        # Each driver's pings in arrival order, chained by previous/next;
+        # ping n + c stands for driver c's state before this batch
+        codes, uniques = pd.factorize(drivers)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        first = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+        last = np.r_[first[1:], True]
+        previous = np.empty(n, dtype=np.int64)
+        previous[order] = np.where(first, n + sorted_codes, np.roll(order, 1))
+        following = np.full(n + len(uniques), -1, dtype=np.int64)
+        following[order[~last]] = order[np.flatnonzero(~last) + 1]
+        following[n + sorted_codes[first]] = order[first]
+
+        with self._lock:
+            carried = [(n + c, z) for c, driver in enumerate(uniques) for z in self._inside.get(driver, ())]
+            carried_ping = np.array([p for p, _ in carried], dtype=np.int64)
+            carried_zone = np.array([z for _, z in carried], dtype=np.int64)
+            all_ping = np.concatenate([hit_ping, carried_ping])
+            all_zone = np.concatenate([hit_zone, carried_zone])
+            keys = np.sort(all_ping * n_zones + all_zone)
+
+            def member(ping, zone):
+                wanted = ping * n_zones + zone
+                position = np.minimum(np.searchsorted(keys, wanted), max(len(keys) - 1, 0))
+                return keys[position] == wanted if len(keys) else np.zeros(len(wanted), dtype=bool)
+
+            # Enter: inside now but not at the previous ping; exit: inside
+            # at a ping but not at the driver's next one
+            enter = ~member(previous[hit_ping], hit_zone)
+            successor = following[all_ping]
+            leave = successor >= 0
+            leave[leave] = ~member(successor[leave], all_zone[leave])
+
+            # Remember where each driver ended up
+            is_last = np.empty(n, dtype=bool)
+            is_last[order] = last
+            ended_in = is_last[hit_ping]
+            for c in range(len(uniques)):
+                self._inside.pop(uniques[c], None)
+            for ping, z in zip(hit_ping[ended_in].tolist(), hit_zone[ended_in].tolist()):
+                driver = drivers[ping]
+                self._inside[driver] = self._inside.get(driver, ()) + (z,)
+
+        event_ping = np.concatenate([successor[leave], hit_ping[enter]])
+        event_zone = np.concatenate([all_zone[leave], hit_zone[enter]])
+        kind = np.concatenate([np.zeros(leave.sum(), dtype=np.int8), np.ones(enter.sum(), dtype=np.int8)])
+        order = np.lexsort((kind, event_ping))
+        event_ping, event_zone, kind = event_ping[order], event_zone[order], kind[order]
+        zone_ids = np.asarray(self.zone_ids, dtype=object)
+        return pd.DataFrame({
+            'ts': np.asarray(pings['ts'])[event_ping],
+            'driver_id': drivers[event_ping],
+            'zone_id': zone_ids[event_zone],
+            'event': np.where(kind == 1, 'enter', 'exit'),
+            'lat': lats[event_ping],
+            'lon': lons[event_ping]
+        }, columns=EVENT_COLUMNS)
+
+    def replay(self, path, batch_size=50_000):
+        """Evaluate a JSONL file of pings in batches, yielding each batch's events"""
+        with open(path) as f:
+            batch = []
+            for line in f:
+                if line.strip():
+                    batch.append(json.loads(line))
+                if len(batch) == batch_size:
+                    yield self.process(pd.DataFrame(batch, columns=PING_COLUMNS))
+                    batch = []
+            if batch:
+                yield self.process(pd.DataFrame(batch, columns=PING_COLUMNS))
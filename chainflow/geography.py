@@ -0,0 +1,156 @@
+"""
+Reference geography for ChainFlow route planning: the selectable
+countries, the major shipping hubs per region and how they relate.
+
+The country -> region -> hub lookups are built once at import as frozen
+mappings, and building them fails loudly if any selectable country lacks
+a region, so lookups never fall back to a default region.
+"""
+
+from types import MappingProxyType
+
+# Countries offered in the route optimizer
+COUNTRIES = [
+    "Afghanistan", "Albania", "Algeria", "Argentina", "Armenia", "Australia", "Austria", "Azerbaijan",
+    "Bahrain", "Bangladesh", "Belarus", "Belgium", "Bolivia", "Brazil", "Bulgaria", "Cambodia",
+    "Canada", "Chile", "China", "Colombia", "Croatia", "Czech Republic", "Denmark", "Ecuador",
+    "Egypt", "Estonia", "Ethiopia", "Finland", "France", "Georgia", "Germany", "Ghana",
+    "Greece", "Hungary", "Iceland", "India", "Indonesia", "Iran", "Iraq", "Ireland",
+    "Israel", "Italy", "Japan", "Jordan", "Kazakhstan", "Kenya", "Kuwait", "Latvia",
+    "Lebanon", "Lithuania", "Luxembourg", "Madagascar", "Malaysia", "Mexico", "Morocco", "Netherlands",
+    "New Zealand", "Nigeria", "Norway", "Pakistan", "Peru", "Philippines", "Poland", "Portugal",
+    "Qatar", "Romania", "Russia", "Saudi Arabia", "Singapore", "Slovakia", "Slovenia", "South Africa",
+    "South Korea", "Spain", "Sri Lanka", "Sweden", "Switzerland", "Thailand", "Turkey", "UAE",
+    "Ukraine", "United Kingdom", "United States", "Uruguay", "Venezuela", "Vietnam", "Yemen", "Zimbabwe"
+]
+
+# Major shipping hubs by region
+SHIPPING_HUBS = {
+    "Asia": ["Singapore", "Shanghai", "Hong Kong", "Dubai", "Mumbai"],
+    "Europe": ["Rotterdam", "Hamburg", "Antwerp", "London", "Barcelona"],
+    "Americas": ["Los Angeles", "New York", "Miami", "Vancouver", "Santos"],
+    "Africa": ["Cape Town", "Lagos", "Cairo", "Casablanca", "Durban"],
+    "Oceania": ["Sydney", "Melbourne", "Auckland", "Brisbane"]
+}
+
+# Country each hub city sits in
+HUB_COUNTRIES = {
+    "Singapore": "Singapore", "Shanghai": "China", "Hong Kong": "China", "Dubai": "UAE", "Mumbai": "India",
+    "Rotterdam": "Netherlands", "Hamburg": "Germany", "Antwerp": "Belgium", "London": "United Kingdom",
+    "Barcelona": "Spain", "Los Angeles": "United States", "New York": "United States", "Miami": "United States",
+    "Vancouver": "Canada", "Santos": "Brazil", "Cape Town": "South Africa", "Lagos": "Nigeria", "Cairo": "Egypt",
+    "Casablanca": "Morocco", "Durban": "South Africa", "Sydney": "Australia", "Melbourne": "Australia",
+    "Auckland": "New Zealand", "Brisbane": "Australia"
+}
+
+# Shipping region served for every country (the Middle East and Central
+# Asia are served through the Asia hubs, including Dubai)
+COUNTRY_REGIONS = {
+    # Asia
+    "Afghanistan": "Asia", "Armenia": "Asia", "Azerbaijan": "Asia", "Bahrain": "Asia", "Bangladesh": "Asia",
+    "Cambodia": "Asia", "China": "Asia", "Georgia": "Asia", "India": "Asia", "Indonesia": "Asia",
+    "Iran": "Asia", "Iraq": "Asia", "Israel": "Asia", "Japan": "Asia", "Jordan": "Asia",
+    "Kazakhstan": "Asia", "Kuwait": "Asia", "Lebanon": "Asia", "Malaysia": "Asia", "Pakistan": "Asia",
+    "Philippines": "Asia", "Qatar": "Asia", "Saudi Arabia": "Asia", "Singapore": "Asia",
+    "South Korea": "Asia", "Sri Lanka": "Asia", "Thailand": "Asia", "UAE": "Asia", "Vietnam": "Asia",
+    "Yemen": "Asia",
+    # Europe
+    "Albania": "Europe", "Austria": "Europe", "Belarus": "Europe", "Belgium": "Europe", "Bulgaria": "Europe",
+    "Croatia": "Europe", "Czech Republic": "Europe", "Denmark": "Europe", "Estonia": "Europe",
+    "Finland": "Europe", "France": "Europe", "Germany": "Europe", "Greece": "Europe", "Hungary": "Europe",
+    "Iceland": "Europe", "Ireland": "Europe", "Italy": "Europe", "Latvia": "Europe", "Lithuania": "Europe",
+    "Luxembourg": "Europe", "Netherlands": "Europe", "Norway": "Europe", "Poland": "Europe",
+    "Portugal": "Europe", "Romania": "Europe", "Russia": "Europe", "Slovakia": "Europe",
+    "Slovenia": "Europe", "Spain": "Europe", "Sweden": "Europe", "Switzerland": "Europe",
+    "Turkey": "Europe", "Ukraine": "Europe", "United Kingdom": "Europe",
+    # Americas
+    "Argentina": "Americas", "Bolivia": "Americas", "Brazil": "Americas", "Canada": "Americas",
+    "Chile": "Americas", "Colombia": "Americas", "Ecuador": "Americas", "Mexico": "Americas",
+    "Peru": "Americas", "United States": "Americas", "Uruguay": "Americas", "Venezuela": "Americas",
+    # Africa
+    "Algeria": "Africa", "Egypt": "Africa", "Ethiopia": "Africa", "Ghana": "Africa", "Kenya": "Africa",
+    "Madagascar": "Africa", "Morocco": "Africa", "Nigeria": "Africa", "South Africa": "Africa",
+    "Zimbabwe": "Africa",
+    # Oceania
+    "Australia": "Oceania", "New Zealand": "Oceania"
+}
+
+# (latitude, longitude) in degrees of each country's capital
+COUNTRY_COORDINATES = {
+    "Afghanistan": (34.53, 69.17), "Albania": (41.33, 19.82), "Algeria": (36.75, 3.06),
+    "Argentina": (-34.60, -58.38), "Armenia": (40.18, 44.51), "Australia": (-35.28, 149.13),
+    "Austria": (48.21, 16.37), "Azerbaijan": (40.41, 49.87), "Bahrain": (26.23, 50.59),
+    "Bangladesh": (23.81, 90.41), "Belarus": (53.90, 27.57), "Belgium": (50.85, 4.35),
+    "Bolivia": (-16.50, -68.15), "Brazil": (-15.79, -47.88), "Bulgaria": (42.70, 23.32),
+    "Cambodia": (11.56, 104.92), "Canada": (45.42, -75.70), "Chile": (-33.45, -70.67),
+    "China": (39.90, 116.41), "Colombia": (4.71, -74.07), "Croatia": (45.81, 15.98),
+    "Czech Republic": (50.08, 14.44), "Denmark": (55.68, 12.57), "Ecuador": (-0.18, -78.47),
+    "Egypt": (30.04, 31.24), "Estonia": (59.44, 24.75), "Ethiopia": (9.03, 38.74),
+    "Finland": (60.17, 24.94), "France": (48.86, 2.35), "Georgia": (41.72, 44.78),
+    "Germany": (52.52, 13.40), "Ghana": (5.60, -0.19), "Greece": (37.98, 23.73),
+    "Hungary": (47.50, 19.04), "Iceland": (64.15, -21.94), "India": (28.61, 77.21),
+    "Indonesia": (-6.21, 106.85), "Iran": (35.69, 51.39), "Iraq": (33.32, 44.36),
+    "Ireland": (53.35, -6.26), "Israel": (31.77, 35.21), "Italy": (41.90, 12.50),
+    "Japan": (35.68, 139.69), "Jordan": (31.95, 35.93), "Kazakhstan": (51.17, 71.45),
+    "Kenya": (-1.29, 36.82), "Kuwait": (29.38, 47.99), "Latvia": (56.95, 24.11),
+    "Lebanon": (33.89, 35.50), "Lithuania": (54.69, 25.28), "Luxembourg": (49.61, 6.13),
+    "Madagascar": (-18.88, 47.51), "Malaysia": (3.14, 101.69), "Mexico": (19.43, -99.13),
+    "Morocco": (34.02, -6.84), "Netherlands": (52.37, 4.90), "New Zealand": (-41.29, 174.78),
+    "Nigeria": (9.08, 7.40), "Norway": (59.91, 10.75), "Pakistan": (33.68, 73.05),
+    "Peru": (-12.05, -77.04), "Philippines": (14.60, 120.98), "Poland": (52.23, 21.01),
+    "Portugal": (38.72, -9.14), "Qatar": (25.29, 51.53), "Romania": (44.43, 26.10),
+    "Russia": (55.76, 37.62), "Saudi Arabia": (24.71, 46.68), "Singapore": (1.35, 103.82),
+    "Slovakia": (48.15, 17.11), "Slovenia": (46.06, 14.51), "South Africa": (-25.75, 28.19),
+    "South Korea": (37.57, 126.98), "Spain": (40.42, -3.70), "Sri Lanka": (6.93, 79.86),
+    "Sweden": (59.33, 18.07), "Switzerland": (46.95, 7.45), "Thailand": (13.76, 100.50),
+    "Turkey": (39.93, 32.86), "UAE": (24.45, 54.38), "Ukraine": (50.45, 30.52),
+    "United Kingdom": (51.51, -0.13), "United States": (38.91, -77.04), "Uruguay": (-34.90, -56.16),
+    "Venezuela": (10.48, -66.90), "Vietnam": (21.03, 105.85), "Yemen": (15.37, 44.19),
+    "Zimbabwe": (-17.83, 31.05)
+}
+
+# (latitude, longitude) in degrees of each hub's port
+HUB_COORDINATES = {
+    "Singapore": (1.26, 103.84), "Shanghai": (31.23, 121.47), "Hong Kong": (22.32, 114.17),
+    "Dubai": (25.01, 55.06), "Mumbai": (18.95, 72.95),
+    "Rotterdam": (51.92, 4.48), "Hamburg": (53.55, 9.99), "Antwerp": (51.22, 4.40),
+    "London": (51.51, -0.13), "Barcelona": (41.39, 2.17),
+    "Los Angeles": (33.74, -118.27), "New York": (40.71, -74.01), "Miami": (25.76, -80.19),
+    "Vancouver": (49.28, -123.12), "Santos": (-23.96, -46.33),
+    "Cape Town": (-33.92, 18.42), "Lagos": (6.45, 3.39), "Cairo": (30.04, 31.24),
+    "Casablanca": (33.57, -7.59), "Durban": (-29.86, 31.02),
+    "Sydney": (-33.87, 151.21), "Melbourne": (-37.81, 144.96), "Auckland": (-36.85, 174.76),
+    "Brisbane": (-27.47, 153.03)
+}
+
+def _build_region_index():
+    """Validate the tables and freeze country -> region, region -> hubs and country -> hubs"""
+    missing = [country for country in COUNTRIES if country not in COUNTRY_REGIONS]
+    if missing:
+        raise ValueError(f"No shipping region for: {', '.join(missing)}")
+    unserved = sorted(set(COUNTRY_REGIONS.values()) - set(SHIPPING_HUBS))
+    if unserved:
+        raise ValueError(f"No shipping hubs in region: {', '.join(unserved)}")
+    
+    region_hubs = {region: tuple(hubs) for region, hubs in SHIPPING_HUBS.items()}
+    return (
+        MappingProxyType(dict(COUNTRY_REGIONS)),
+        MappingProxyType(region_hubs),
+        MappingProxyType({country: region_hubs[region] for country, region in COUNTRY_REGIONS.items()})
+    )
+
+COUNTRY_REGION_INDEX, REGION_HUB_INDEX, COUNTRY_HUB_INDEX = _build_region_index()
+
+def region_of(country):
+    """Shipping region serving a country; raises ValueError for unknown countries"""
+    try:
+        return COUNTRY_REGION_INDEX[country]
+    except KeyError:
+        raise ValueError(f"Unknown country: {country}") from None
+
+def hubs_for(country):
+    """Hubs of the region serving a country, as a tuple"""
+    try:
+        return COUNTRY_HUB_INDEX[country]
+    except KeyError:
+        raise ValueError(f"Unknown country: {country}") from None
@@ -0,0 +1,255 @@
+"""
+Prioritized background job queue for ZK proof generation.
+
+Streamlit runs each session's script on its own thread, so a proof that
+runs inline holds that session until it finishes. Jobs submitted here run
+on a small bounded pool of worker threads instead; the caller gets a job
+ID back immediately and polls ``status`` (or blocks on ``result``).
+Queued jobs start in priority order (military, then healthcare, then
+standard) and first-in first-out within a priority. A queued job can be
+cancelled; a running one is left to finish and its result discarded. A job
+interrupted by a BaseException that is not an Exception (SystemExit,
+Streamlit's rerun) is recorded as cancelled and its worker carries on.
+"""
+
+import heapq
+import itertools
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+PRIORITIES = {"military": 0, "healthcare": 1, "standard": 2}
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+def proof_priority(*labels):
+    """
+    Priority name for a proof from its product category, use case or
+    privacy level labels, e.g. ("Military", "Defense Logistics") -> "military"
+    """
+    text = " ".join(str(label) for label in labels if label).lower()
+    if "military" in text or "defense" in text:
+        return "military"
+    if "healthcare" in text or "medical" in text:
+        return "healthcare"
+    return "standard"
+
+class JobCancelled(Exception):
+    """Raised by ProofJobQueue.result for a cancelled job"""
+
+class _Job:
+    def __init__(self, job_id, fn, args, kwargs, priority, label):
+        self.id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.label = label
+        self.rank = None
+        self.state = QUEUED
+        self.value = None
+        self.error = None
+        self.cancel_requested = False
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+
+class ProofJobQueue:
+    """
+    Bounded worker pool running submitted callables by priority.
+
+    ``workers`` threads are started on first submit. At most ``max_queued``
+    jobs may wait (RuntimeError beyond that); the last ``keep_finished``
+    finished jobs stay queryable, older ones are forgotten.
+    """
+
+    def __init__(self, workers=2, max_queued=1000, keep_finished=1000):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.max_queued = max_queued
+        self.keep_finished = keep_finished
+        self._heap = []  # ((priority rank, sequence), job id, job)
+        self._sequence = itertools.count()
+        self._jobs = {}
+        self._finished = OrderedDict()  # job id -> None, oldest first
+        self._queued = 0
+        self._running = 0
+        self._threads = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    def submit(self, fn, *args, priority="standard", label=None, **kwargs):
+        """Queue `fn(*args, **kwargs)` and return its job ID"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job queue is shut down")
+            if self._queued >= self.max_queued:
+                raise RuntimeError(f"Job queue is full ({self.max_queued} jobs waiting)")
+            job = _Job(f"job_{secrets.token_hex(8)}", fn, args, kwargs, priority, label)
+            job.rank = (PRIORITIES[priority], next(self._sequence))
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (job.rank, job.id, job))
+            self._queued += 1
+            self._start_workers()
+            self._wakeup.notify()
+        return job.id
+
+    def status(self, job_id):
+        """State, priority, position in the queue and timings of a job"""
+        with self._lock:
+            job = self._job(job_id)
+            position = None
+            if job.state == QUEUED:
+                position = 1 + sum(1 for rank, _, other in self._heap
+                                   if other.state == QUEUED and rank < job.rank)
+            now = time.monotonic()
+            return {
+                'id': job.id,
+                'label': job.label,
+                'state': job.state,
+                'priority': job.priority,
+                'position': position,
+                'waited': (job.started or job.finished or now) - job.submitted,
+                'ran': None if job.started is None else (job.finished or now) - job.started,
+                'error': None if job.error is None else repr(job.error)
+            }
+
+    def result(self, job_id, timeout=None):
+        """
+        Wait up to `timeout` seconds for a job and return its value. Raises
+        TimeoutError if it is still pending, JobCancelled if it was
+        cancelled, or the job's own exception if it failed.
+        """
+        with self._lock:
+            job = self._job(job_id)
+        if not job.done.wait(timeout):
+            raise TimeoutError(f"Job {job_id} still {job.state}")
+        if job.state == CANCELLED:
+            raise JobCancelled(job_id)
+        if job.error is not None:
+            raise job.error
+        return job.value
+
+    def cancel(self, job_id):
+        """
+        Cancel a job. Returns True if it will not produce a result, False if
+        it had already finished.
+        """
+        with self._lock:
+            job = self._job(job_id)
+            if job.state in FINISHED:
+                return job.state == CANCELLED
+            job.cancel_requested = True
+            if job.state == QUEUED:
+                # Left in the heap and skipped when it reaches the top
+                self._queued -= 1
+                self._finish(job, CANCELLED)
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled
+            }
+
+    def shutdown(self, wait=True, cancel_queued=False):
+        """Stop accepting jobs; workers exit once the queue is drained"""
+        with self._lock:
+            self._closed = True
+            if cancel_queued:
+                for _, _, job in self._heap:
+                    if job.state == QUEUED:
+                        self._queued -= 1
+                        self._finish(job, CANCELLED)
+                self._heap.clear()
+            self._wakeup.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _job(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        return job
+
+    def _start_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"proof-worker-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _finish(self, job, state):
+        job.state = state
+        job.finished = time.monotonic()
+        job.fn = job.args = job.kwargs = None
+        if state == DONE:
+            self.completed += 1
+        elif state == FAILED:
+            self.failed += 1
+        else:
+            self.cancelled += 1
+        job.done.set()
+        self._finished[job.id] = None
+        while len(self._finished) > self.keep_finished:
+            old, _ = self._finished.popitem(last=False)
+            del self._jobs[old]
+
+    def _next_job(self):
+        with self._lock:
+            while True:
+                while self._heap and self._heap[0][2].state != QUEUED:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    job = heapq.heappop(self._heap)[2]
+                    self._queued -= 1
+                    self._running += 1
+                    job.state = RUNNING
+                    job.started = time.monotonic()
+                    return job
+                if self._closed:
+                    return None
+                self._wakeup.wait()
+
+    def _work(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            value, error = None, None
+            try:
+                value = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                # SystemExit or Streamlit's rerun/stop exceptions end the job,
+                # not the worker; the job counts as cancelled
+                error = e
+            with self._lock:
+                self._running -= 1
+                if job.cancel_requested:
+                    self._finish(job, CANCELLED)
+                else:
+                    job.value, job.error = value, error
+                    if error is None:
+                        self._finish(job, DONE)
+                    else:
+                        self._finish(job, FAILED if isinstance(error, Exception) else CANCELLED)
@@ -0,0 +1,121 @@
+"""
+Bulk lane planning for ChainFlow route optimization.
+
+A lane table (origin, destination and optional priority, max_stops,
+avoid_regions, cargo_type columns) is split into chunks that are planned
+across a process pool with ``plan_route``. Each worker builds the hub
+network once and memoizes repeated lanes, so quarterly plans with tens of
+thousands of pairs mostly hit the per-worker memo.
+"""
+
+from concurrent.futures import as_completed
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from chainflow.parallel import default_workers, process_pool
+from chainflow.routing import plan_route
+
+LANE_COLUMNS = ['origin', 'destination', 'priority', 'max_stops', 'avoid_regions', 'cargo_type']
+LANE_DEFAULTS = {'priority': "Cost", 'max_stops': None, 'avoid_regions': (), 'cargo_type': "Standard"}
+
+def _avoid_tuple(value):
+    """Avoided regions from a list/tuple or a ';'-separated string (as read from CSV)"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ()
+    if isinstance(value, str):
+        value = value.split(';')
+    return tuple(sorted({region.strip() for region in value if region.strip()}))
+
+def _stop_limit(value):
+    if value is None or pd.isna(value):
+        return None
+    return int(value)
+
+def normalize_lanes(lanes):
+    """Lane table as a DataFrame with every LANE_COLUMNS column filled in"""
+    frame = lanes.copy() if isinstance(lanes, pd.DataFrame) else pd.DataFrame(list(lanes))
+    missing = [column for column in ('origin', 'destination') if column not in frame]
+    if missing:
+        raise ValueError(f"Lane table is missing columns: {', '.join(missing)}")
+
+    for column, default in LANE_DEFAULTS.items():
+        if column not in frame:
+            frame[column] = [default] * len(frame)
+    frame['priority'] = frame['priority'].fillna(LANE_DEFAULTS['priority'])
+    frame['cargo_type'] = frame['cargo_type'].fillna(LANE_DEFAULTS['cargo_type'])
+    frame['max_stops'] = pd.Series([_stop_limit(v) for v in frame['max_stops']], index=frame.index, dtype=object)
+    frame['avoid_regions'] = pd.Series([_avoid_tuple(v) for v in frame['avoid_regions']], index=frame.index, dtype=object)
+    return frame[LANE_COLUMNS]
+
+@lru_cache(maxsize=65536)
+def plan_lane(origin, destination, priority="Cost", max_stops=None, avoid_regions=(), cargo_type="Standard"):
+    """
+    One result row for a lane. Infeasible or malformed lanes (unknown
+    countries or priorities, unusable stop limits) get status 'error'
+    instead of raising, so one bad row does not fail the whole table.
+    """
+    try:
+        plan = plan_route(origin, destination, priority, max_stops, avoid_regions, cargo_type)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+    except (LookupError, TypeError) as e:
+        return {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+    route = plan['route']
+    return {
+        'status': 'ok',
+        'error': None,
+        'path': " → ".join(route['path']),
+        'modes': ", ".join(leg['mode'] for leg in route['legs']),
+        'stops': route['stops'],
+        'cost': round(route['cost'], 2),
+        'time_days': round(route['time'], 1),
+        'carbon_tons': round(route['carbon'], 2),
+        'risk_score': route['risk_score'],
+        'alternatives': len(plan['alternatives'])
+    }
+
+def _plan_chunk(chunk):
+    """Worker task: (chunk index, [lane tuples]) -> (chunk index, [result rows])"""
+    index, lanes = chunk
+    return index, [plan_lane(*lane) for lane in lanes]
+
+def plan_lanes(lanes, workers=None, chunk_size=500, progress=None):
+    """
+    Plan every lane of a table and return one row of route metrics per lane.
+
+    Lanes are chunked and planned across `workers` processes (all CPUs by
+    default; 1 plans inline). `progress(done, total)` is called after each
+    chunk completes. The result keeps the input index and lane columns and
+    adds status/error plus path, modes, stops, cost, time_days,
+    carbon_tons, risk_score and the number of Pareto alternatives.
+    """
+    frame = normalize_lanes(lanes)
+    tasks = list(frame.itertuples(index=False, name=None))
+    chunks = [(i, tasks[start:start + chunk_size]) for i, start in enumerate(range(0, len(tasks), chunk_size))]
+    workers = min(workers or default_workers(), max(1, len(chunks)))
+
+    results = [None] * len(chunks)
+    done = 0
+    if workers == 1:
+        completed = map(_plan_chunk, chunks)
+    else:
+        pool = process_pool(workers)
+        completed = (future.result() for future in as_completed([pool.submit(_plan_chunk, c) for c in chunks]))
+    try:
+        for index, rows in completed:
+            results[index] = rows
+            done += len(rows)
+            if progress is not None:
+                progress(done, len(tasks))
+    finally:
+        if workers != 1:
+            pool.shutdown(cancel_futures=True)
+
+    rows = [row for chunk_rows in results for row in chunk_rows]
+    planned = pd.DataFrame(rows, index=frame.index, columns=[
+        'status', 'error', 'path', 'modes', 'stops', 'cost', 'time_days', 'carbon_tons', 'risk_score', 'alternatives'
+    ])
+    return pd.concat([frame, planned], axis=1)
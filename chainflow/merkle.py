@@ -0,0 +1,273 @@
+"""
+Incremental Merkle tree over the supplier registry.
+
+``src/main.nr`` checks a supplier leaf, H(supplier_id, tier,
+certification_hash), against a public ``trusted_supplier_root``, and the
+frontend's Prover.toml carries ``merkle_root``, ``path_elements`` and
+``path_indices`` for it. The tree has a fixed depth (circuit paths are
+fixed-length arrays), and absent leaves are the precomputed roots of empty
+subtrees. Every level is kept as one bytearray of 32-byte nodes, so an
+insert or update rehashes only the ``depth`` nodes above its leaf and a
+batch of inclusion paths is a NumPy gather per level.
+
+The pair hash is pluggable; the default is SHA-256 masked into the BN254
+field. The circuit uses Pedersen, so a root proven in-circuit must be built
+with a matching ``hash_pair``: chainflow.pedersen.PedersenHasher's ``pair``
+and ``leaf``.
+"""
+
+import threading
+
+import numpy as np
+
+from chainflow.fields import FIELD_BYTES, field_bytes, field_hex, sha256_field_bytes, to_field
+
+DEFAULT_DEPTH = 20  # 1,048,576 leaves
+
+def sha256_pair(left, right):
+    """Default node hash: SHA-256 of two 32-byte nodes, as a field element"""
+    return sha256_field_bytes(left + right)
+
+def sha256_leaf(*elements):
+    """Default leaf hash of field elements"""
+    return sha256_field_bytes(b"".join(field_bytes(e) for e in elements))
+
+def supplier_leaf_inputs(supplier_id, supplier):
+    """(supplier_id, supplier_tier, supplier_certification_hash) field elements, as hashed by main.nr"""
+    return to_field(supplier_id), to_field(supplier.get('tier')), to_field(supplier.get('certification_hash'))
+
+class MerkleTree:
+    """
+    Fixed-depth binary Merkle tree with appends, in-place updates and
+    batch inclusion paths. Leaves and nodes are 32-byte big-endian field
+    elements. ``hash_pair(left, right)`` must return 32 bytes. All methods
+    are thread-safe.
+    """
+
+    def __init__(self, depth=DEFAULT_DEPTH, hash_pair=sha256_pair, empty_leaf=bytes(FIELD_BYTES)):
+        if not 1 <= depth <= 40:
+            raise ValueError("depth must be between 1 and 40")
+        self.depth = depth
+        self.hash_pair = hash_pair
+        # zeros[h] is the root of an empty subtree of height h
+        self.zeros = [bytes(empty_leaf)]
+        for _ in range(depth):
+            self.zeros.append(hash_pair(self.zeros[-1], self.zeros[-1]))
+        self._levels = [bytearray() for _ in range(depth + 1)]
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._levels[0]) // FIELD_BYTES
+
+    @property
+    def capacity(self):
+        return 1 << self.depth
+
+    @property
+    def root(self):
+        top = self._levels[self.depth]
+        return bytes(top) if top else self.zeros[self.depth]
+
+    def leaf(self, index):
+        with self._lock:
+            if not 0 <= index < len(self):
+                raise IndexError(f"Leaf {index} out of range")
+            return self._node(0, index)
+
+    def _node(self, level, index):
+        nodes = self._levels[level]
+        start = index * FIELD_BYTES
+        if start >= len(nodes):
+            return self.zeros[level]
+        return bytes(nodes[start:start + FIELD_BYTES])
+
+    def _set(self, level, index, node):
+        nodes = self._levels[level]
+        start = index * FIELD_BYTES
+        if start == len(nodes):
+            nodes += node
+        else:
+            nodes[start:start + FIELD_BYTES] = node
+
+    @staticmethod
+    def _check_node(node):
+        node = bytes(node)
+        if len(node) != FIELD_BYTES:
+            raise ValueError(f"Nodes must be {FIELD_BYTES} bytes")
+        return node
+
+    # -- updates -----------------------------------------------------------
+
+    def update(self, index, leaf):
+        """Set leaf `index` (an existing index, or len(self) to append) and rehash its path"""
+        leaf = self._check_node(leaf)
+        with self._lock:
+            if not 0 <= index <= len(self):
+                raise IndexError(f"Leaf {index} out of range")
+            if index >= self.capacity:
+                raise ValueError(f"Tree of depth {self.depth} is full")
+            self._set(0, index, leaf)
+            node = leaf
+            for level in range(self.depth):
+                if index & 1:
+                    node = self.hash_pair(self._node(level, index - 1), node)
+                else:
+                    node = self.hash_pair(node, self._node(level, index + 1))
+                index >>= 1
+                self._set(level + 1, index, node)
+            return self.root
+
+    def append(self, leaf):
+        """Add a leaf; returns its index"""
+        with self._lock:
+            index = len(self)
+            self.update(index, leaf)
+            return index
+
+    def extend(self, leaves):
+        """
+        Append many leaves, hashing each affected parent once (about n
+        hashes in total instead of n * depth). Returns the first new index.
+        """
+        leaves = [self._check_node(leaf) for leaf in leaves]
+        with self._lock:
+            first = len(self)
+            if first + len(leaves) > self.capacity:
+                raise ValueError(f"Tree of depth {self.depth} is full")
+            if not leaves:
+                return first
+            self._levels[0] += b"".join(leaves)
+            start, end = first, first + len(leaves)
+            hash_pair = self.hash_pair
+            for level in range(self.depth):
+                nodes = self._levels[level]
+                start >>= 1
+                end = (end + 1) >> 1
+                zero = self.zeros[level]
+                parents = bytearray()
+                for parent in range(start, end):
+                    offset = 2 * parent * FIELD_BYTES
+                    left = bytes(nodes[offset:offset + FIELD_BYTES])
+                    right = bytes(nodes[offset + FIELD_BYTES:offset + 2 * FIELD_BYTES]) or zero
+                    parents += hash_pair(left, right)
+                above = self._levels[level + 1]
+                del above[start * FIELD_BYTES:]
+                above += parents
+            return first
+
+    # -- inclusion paths ---------------------------------------------------
+
+    def path(self, index):
+        """(path_elements, path_indices) of one leaf, leaf level first"""
+        elements, indices = self.paths([index])
+        return [bytes(e) for e in elements[0]], indices[0].tolist()
+
+    def paths(self, indices):
+        """
+        Inclusion paths of many leaves at once: a (k, depth, 32) uint8 array
+        of sibling nodes and a (k, depth) array of path indices: 0 where the
+        node on the path is a left child (its sibling on the right), 1 where
+        it is a right child.
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        with self._lock:
+            if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+                raise IndexError("Leaf index out of range")
+            elements = np.empty((len(indices), self.depth, FIELD_BYTES), dtype=np.uint8)
+            bits = np.empty((len(indices), self.depth), dtype=np.uint8)
+            position = indices.copy()
+            for level in range(self.depth):
+                bits[:, level] = position & 1
+                sibling = position ^ 1
+                nodes = np.frombuffer(self._levels[level], dtype=np.uint8).reshape(-1, FIELD_BYTES)
+                present = sibling < len(nodes)
+                elements[:, level] = np.frombuffer(self.zeros[level], dtype=np.uint8)
+                elements[present, level] = nodes[sibling[present]]
+                del nodes  # release the buffer so the level can grow again
+                position >>= 1
+            return elements, bits
+
+    def verify(self, leaf, elements, indices, root=None):
+        """True if `leaf` with this path hashes to `root` (default: the current root)"""
+        node = self._check_node(leaf)
+        for sibling, bit in zip(elements, indices):
+            sibling = bytes(sibling)
+            node = self.hash_pair(sibling, node) if int(bit) else self.hash_pair(node, sibling)
+        return node == (self.root if root is None else bytes(root))
+
+class SupplierRegistryTree:
+    """
+    Merkle tree of the catalogue's suppliers, one leaf per supplier ID in
+    insertion order. ``leaf_hash(*elements)`` hashes the leaf inputs of
+    supplier_leaf_inputs; pass Pedersen leaf and pair hashes for roots the
+    circuit can check.
+    """
+
+    def __init__(self, suppliers=None, depth=DEFAULT_DEPTH, hash_pair=sha256_pair, leaf_hash=sha256_leaf):
+        self.tree = MerkleTree(depth, hash_pair)
+        self.leaf_hash = leaf_hash
+        self.index_of = {}
+        self._lock = threading.Lock()
+        if suppliers:
+            self.upsert_many(suppliers)
+
+    def __len__(self):
+        return len(self.index_of)
+
+    def __contains__(self, supplier_id):
+        return str(supplier_id) in self.index_of
+
+    @property
+    def root(self):
+        return self.tree.root
+
+    def leaf(self, supplier_id, supplier):
+        return self.leaf_hash(*supplier_leaf_inputs(supplier_id, supplier))
+
+    def upsert(self, supplier_id, supplier):
+        """Add or update one supplier record; returns the new root"""
+        supplier_id = str(supplier_id)
+        leaf = self.leaf(supplier_id, supplier)
+        with self._lock:
+            index = self.index_of.get(supplier_id)
+            if index is None:
+                index = self.index_of[supplier_id] = len(self.tree)
+            return self.tree.update(index, leaf)
+
+    def upsert_many(self, suppliers):
+        """Add or update a {supplier_id: record} mapping; new suppliers are appended in one batch"""
+        new_ids, new_leaves = [], []
+        with self._lock:
+            for supplier_id, supplier in suppliers.items():
+                supplier_id = str(supplier_id)
+                leaf = self.leaf(supplier_id, supplier)
+                index = self.index_of.get(supplier_id)
+                if index is None:
+                    new_ids.append(supplier_id)
+                    new_leaves.append(leaf)
+                else:
+                    self.tree.update(index, leaf)
+            first = self.tree.extend(new_leaves)
+            for offset, supplier_id in enumerate(new_ids):
+                self.index_of[supplier_id] = first + offset
+        return self.root
+
+    def inclusion_proofs(self, supplier_ids):
+        """
+        {supplier_id: {'merkle_root', 'path_elements', 'path_indices'}} as the
+        0x-hex / "0"-"1" strings the frontend writes into Prover.toml
+        """
+        supplier_ids = [str(s) for s in supplier_ids]
+        indices = [self.index_of[s] for s in supplier_ids]
+        elements, bits = self.tree.paths(indices)
+        root = field_hex(self.root)
+        depth = self.tree.depth
+        hexed = ["0x" + node.hex() for node in (bytes(row) for row in elements.reshape(-1, FIELD_BYTES))]
+        return {
+            supplier_id: {
+                'merkle_root': root,
+                'path_elements': hexed[k * depth:(k + 1) * depth],
+                'path_indices': [str(b) for b in bits[k].tolist()]
+            }
+            for k, supplier_id in enumerate(supplier_ids)
+        }
@@ -0,0 +1,288 @@
+"""
+Cached, concurrent runner for the ``nargo`` CLI.
+
+``frontend/server.js`` runs ``nargo compile``, ``execute``, ``check`` and
+``info`` in the project root on every request. Each of those recompiles the
+circuit, and concurrent requests overwrite the same Prover.toml. Here the
+compiled artifact (``target/<package>.json``) is cached per
+circuit_version, a hash of src/main.nr and Nargo.toml, so it is built at
+most once per circuit edit. ``check`` and ``info`` output is cached the same
+way. Every job runs in its own scratch copy of the project, with the cached
+artifact in its ``target/`` directory. nargo then skips recompiling, and no
+two jobs share a Prover.toml or a witness file. A bounded number of nargo
+processes run at once, and every stage is timed.
+
+The binary is ``$CHAINFLOW_NARGO`` (default ``nargo`` on PATH);
+benchmarks/fake_nargo.py is a stand-in for running without a Noir toolchain.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import tomllib
+from pathlib import Path
+
+from chainflow.jobs import ProofJobQueue
+from chainflow.proof_cache import circuit_version
+from chainflow.storage import ARTIFACT_DIR, REPO_ROOT, atomic_write
+from chainflow.witness import format_prover_toml
+
+NARGO = os.environ.get('CHAINFLOW_NARGO', 'nargo')
+ARTIFACT_CACHE_DIR = ARTIFACT_DIR / 'nargo'
+STAGES = ("compile", "execute", "check", "info")
+
+class NargoError(RuntimeError):
+    """
+    A nargo stage failed: a non-zero exit, a timeout or a binary that could
+    not be started (``returncode`` is None for the last two)
+    """
+
+    def __init__(self, stage, returncode, stdout="", stderr="", reason=None):
+        reason = reason or f"exit code {returncode}"
+        detail = (stderr or "").strip() or (stdout or "").strip()
+        super().__init__(f"nargo {stage} failed ({reason})" + (f": {detail}" if detail else ""))
+        self.stage = stage
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+def package_name(project_root=REPO_ROOT):
+    """[package] name from Nargo.toml, which names the target/ artifact"""
+    with open(Path(project_root) / "Nargo.toml", "rb") as f:
+        return tomllib.load(f)["package"]["name"]
+
+def resolve_nargo(nargo):
+    """
+    Absolute path of the nargo binary: commands run inside job directories,
+    so relative paths are resolved against the current directory and bare
+    names against PATH (left as-is if not found; running them then fails)
+    """
+    nargo = str(nargo)
+    if os.sep in nargo or (os.altsep and os.altsep in nargo):
+        return str(Path(nargo).resolve())
+    return shutil.which(nargo) or nargo
+
+class NargoRunner:
+    """
+    Runs nargo stages for the circuit in ``project_root``.
+
+    At most ``workers`` nargo processes run at once across all callers.
+    ``execute`` and ``status`` are synchronous. ``submit`` queues an execute
+    on a ProofJobQueue of the same size and returns a job ID for ``result``.
+    Compiled artifacts and check/info output go to ``cache_dir``. None
+    keeps them in a temporary directory for the runner's lifetime. Job
+    directories are created under ``work_dir`` (default: the system temp
+    directory) and removed afterwards unless ``keep_workdirs``.
+    """
+
+    def __init__(self, project_root=REPO_ROOT, nargo=NARGO, workers=2, cache_dir=ARTIFACT_CACHE_DIR,
+                 work_dir=None, timeout=600, keep_workdirs=False):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.project_root = Path(project_root)
+        self.nargo = resolve_nargo(nargo)
+        self.workers = workers
+        self.package = package_name(self.project_root)
+        self._scratch = None
+        if cache_dir is None:
+            self._scratch = tempfile.TemporaryDirectory(prefix="nargo-cache-")
+            cache_dir = self._scratch.name
+        self.cache_dir = Path(cache_dir)
+        self.work_dir = None if work_dir is None else Path(work_dir)
+        self.timeout = timeout
+        self.keep_workdirs = keep_workdirs
+        self._slots = threading.BoundedSemaphore(workers)
+        self._compile_lock = threading.Lock()
+        self._stage_locks = {}  # (circuit version, stage) -> lock held while that stage runs
+        self._lock = threading.Lock()
+        self._queue = None
+        self._outputs = {}
+        self.compile_hits = 0
+        self.compiles = 0
+        self._timings = {stage: [0, 0.0] for stage in STAGES}
+
+    # -- nargo processes ---------------------------------------------------
+
+    def _run(self, stage, args, cwd):
+        """Run one nargo command in `cwd`; returns (stdout, seconds)"""
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                completed = subprocess.run([self.nargo, *args], cwd=cwd, capture_output=True, text=True,
+                                           timeout=self.timeout)
+            except subprocess.TimeoutExpired as error:
+                raise NargoError(stage, None, reason=f"timed out after {self.timeout} s") from error
+            except OSError as error:
+                raise NargoError(stage, None, reason=f"cannot run {self.nargo}: {error.strerror}") from error
+            seconds = time.perf_counter() - start
+        with self._lock:
+            self._timings[stage][0] += 1
+            self._timings[stage][1] += seconds
+        if completed.returncode != 0:
+            raise NargoError(stage, completed.returncode, completed.stdout, completed.stderr)
+        return completed.stdout, seconds
+
+    def _workdir(self, artifact=None):
+        """Fresh copy of the circuit sources, with the compiled artifact in target/ if given"""
+        if self.work_dir is not None:
+            self.work_dir.mkdir(parents=True, exist_ok=True)
+        directory = Path(tempfile.mkdtemp(prefix="nargo-job-", dir=self.work_dir))
+        shutil.copy2(self.project_root / "Nargo.toml", directory / "Nargo.toml")
+        shutil.copytree(self.project_root / "src", directory / "src")
+        if artifact is not None:
+            (directory / "target").mkdir()
+            shutil.copy2(artifact, directory / "target" / artifact.name)
+        return directory
+
+    def _cleanup(self, directory):
+        if not self.keep_workdirs:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    # -- cached stages -----------------------------------------------------
+
+    def compiled(self):
+        """
+        (artifact path, circuit version, compile seconds) for the current
+        sources, compiling only when this version has no cached artifact
+        (seconds is 0.0 then)
+        """
+        version = circuit_version(self.project_root)
+        path = self.cache_dir / version / f"{self.package}.json"
+        if path.exists():
+            with self._lock:
+                self.compile_hits += 1
+            return path, version, 0.0
+        with self._compile_lock:
+            if path.exists():
+                with self._lock:
+                    self.compile_hits += 1
+                return path, version, 0.0
+            directory = self._workdir()
+            try:
+                _, seconds = self._run("compile", ["compile"], directory)
+                atomic_write(path, (directory / "target" / path.name).read_bytes())
+            finally:
+                self._cleanup(directory)
+            with self._lock:
+                self.compiles += 1
+            return path, version, seconds
+
+    def _stored_output(self, version, stage):
+        """Cached stdout of a stage from memory or disk, or None"""
+        key = (version, stage)
+        with self._lock:
+            output = self._outputs.get(key)
+        if output is None:
+            path = self.cache_dir / version / f"{stage}.txt"
+            if path.exists():
+                output = path.read_text(encoding="utf-8")
+                with self._lock:
+                    self._outputs[key] = output
+        return output
+
+    def _cached_output(self, stage):
+        """
+        stdout of `nargo <stage>` for the current circuit, run once per
+        version: concurrent cold callers wait for the first one's run
+        """
+        artifact, version, _ = self.compiled()
+        output = self._stored_output(version, stage)
+        if output is not None:
+            return {'output': output, 'seconds': 0.0, 'cached': True}
+        with self._lock:
+            stage_lock = self._stage_locks.setdefault((version, stage), threading.Lock())
+        with stage_lock:
+            output = self._stored_output(version, stage)
+            if output is not None:
+                return {'output': output, 'seconds': 0.0, 'cached': True}
+            directory = self._workdir(artifact)
+            try:
+                output, seconds = self._run(stage, [stage], directory)
+            finally:
+                self._cleanup(directory)
+            atomic_write(self.cache_dir / version / f"{stage}.txt", output)
+            with self._lock:
+                self._outputs[(version, stage)] = output
+        return {'output': output, 'seconds': seconds, 'cached': False}
+
+    def check(self):
+        """{'output', 'seconds', 'cached'} of nargo check"""
+        return self._cached_output("check")
+
+    def info(self):
+        """{'output', 'seconds', 'cached'} of nargo info"""
+        return self._cached_output("info")
+
+    def status(self):
+        """What /api/status reports: check and info for the current circuit version"""
+        check = self.check()
+        return {'circuit_version': circuit_version(self.project_root), 'check': check, 'info': self.info()}
+
+    # -- proving jobs ------------------------------------------------------
+
+    def execute(self, inputs, witness_name=None):
+        """
+        Run ``nargo execute`` on `inputs` (a {name: value} dict or Prover.toml
+        text) in an isolated job directory. Returns the witness bytes, nargo's
+        output and per-stage timings in seconds.
+        """
+        started = time.perf_counter()
+        artifact, version, compile_seconds = self.compiled()
+        witness_name = witness_name or self.package
+        directory = self._workdir(artifact)
+        try:
+            prover_toml = inputs if isinstance(inputs, str) else format_prover_toml(inputs)
+            (directory / "Prover.toml").write_text(prover_toml, encoding="utf-8")
+            setup_seconds = time.perf_counter() - started - compile_seconds
+            output, execute_seconds = self._run("execute", ["execute", witness_name], directory)
+            witness = (directory / "target" / f"{witness_name}.gz").read_bytes()
+        finally:
+            self._cleanup(directory)
+        return {
+            'witness': witness,
+            'output': output,
+            'circuit_version': version,
+            'timings': {
+                'compile': compile_seconds,
+                'setup': setup_seconds,
+                'execute': execute_seconds,
+                'total': time.perf_counter() - started
+            }
+        }
+
+    def submit(self, inputs, witness_name=None, priority="standard", label=None):
+        """Queue an execute; returns a job ID for result()"""
+        with self._lock:
+            if self._queue is None:
+                self._queue = ProofJobQueue(self.workers)
+            queue = self._queue
+        return queue.submit(self.execute, inputs, witness_name, priority=priority, label=label)
+
+    def result(self, job_id, timeout=None):
+        """execute() result of a submitted job (see ProofJobQueue.result)"""
+        queue = self._queue
+        if queue is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        return queue.result(job_id, timeout)
+
+    def shutdown(self):
+        with self._lock:
+            queue, self._queue = self._queue, None
+        if queue is not None:
+            queue.shutdown()
+        if self._scratch is not None:
+            self._scratch.cleanup()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'compiles': self.compiles,
+                'compile_hits': self.compile_hits,
+                'stages': {
+                    stage: {'runs': runs, 'seconds': seconds, 'mean': seconds / runs if runs else 0.0}
+                    for stage, (runs, seconds) in self._timings.items()
+                }
+            }
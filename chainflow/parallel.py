@@ -0,0 +1,29 @@
+"""
+Process pool helpers shared by the ChainFlow batch jobs.
+
+Workers are started with the ``spawn`` method: the Streamlit server is
+multi-threaded, and forking a threaded process can deadlock the child.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def default_workers():
+    """Number of CPUs available to this process"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def process_pool(workers=None):
+    """ProcessPoolExecutor with `workers` spawned processes (all CPUs by default)"""
+    return ProcessPoolExecutor(
+        max_workers=workers or default_workers(),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+def split_evenly(total, parts):
+    """Split `total` items into `parts` contiguous block sizes differing by at most one"""
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
@@ -0,0 +1,377 @@
+"""
+Off-circuit Pedersen hash matching Noir's ``std::hash::pedersen_hash``.
+
+Noir hashes ``[Field; N]`` on the Grumpkin curve (y^2 = x^3 - 17 over the
+BN254 scalar field): the result is the x coordinate of
+
+    input[0] * G[0] + ... + input[N-1] * G[N-1] + N * H
+
+where G are the generators derived from the domain separator
+"DEFAULT_DOMAIN_SEPARATOR" (starting at index ``separator`` for
+pedersen_hash_with_separator) and H the single generator of
+"pedersen_hash_length". Generators follow barretenberg's derive_generators:
+hash-to-curve of a 64-byte preimage, the BLAKE3 digest of the separator
+followed by the big-endian generator index and zero padding.
+
+Every term is a fixed-base multiplication, so each generator gets a
+windowed table of ``d * 2**(w*i) * G`` in affine form. A hash is then about
+254 / w mixed additions per input and no doublings. Tables are built with
+batch inversion, kept per process and cached on disk as .npy files.
+"""
+
+import hashlib
+import io
+import struct
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from chainflow.fields import BN254_MODULUS, FIELD_BYTES, field_bytes
+from chainflow.storage import ARTIFACT_DIR, atomic_write
+
+# Grumpkin: y^2 = x^3 + B over the BN254 scalar field
+P = BN254_MODULUS
+B = P - 17
+SCALAR_BITS = 254
+DEFAULT_DOMAIN_SEPARATOR = b"DEFAULT_DOMAIN_SEPARATOR"
+LENGTH_DOMAIN_SEPARATOR = b"pedersen_hash_length"
+WINDOW_BITS = 8
+
+# (inputs, separator, expected hash) from barretenberg's and Noir's own test suites
+CROSS_CHECK_VECTORS = [
+    ([1, 1], 0, 0x07ebfbf4df29888c6cd6dca13d4bb9d1a923013ddbbcbdc3378ab8845463297b),
+    ([1, 1], 5, 0x1c446df60816b897cda124524e6b03f36df0cec333fad87617aab70d7861daa6),
+    ([1], 1, 0x1b3f4b1a83092a13d8d1a59f7acb62aba15e7002f4440f2275edb99ebbc2305f),
+    ([1, 2], 2, 0x26691c129448e9ace0c66d11f0a16d9014a9e8498ee78f4d69f0083168188255),
+]
+# First DEFAULT_DOMAIN_SEPARATOR generator and the length generator (x, y)
+CROSS_CHECK_GENERATORS = [
+    (DEFAULT_DOMAIN_SEPARATOR, 0, (0x083e7911d835097629f0067531fc15cafd79a89beecb39903f69572c636f4a5a,
+                                   0x1a7f5efaad7f315c25a918f30cc8d7333fccab7ad7c90f14de81bcc528f9935d)),
+    (LENGTH_DOMAIN_SEPARATOR, 0, (0x2df8b940e5890e4e1377e05373fae69a1d754f6935e6a780b666947431f2cdcd,
+                                  0x2ecd88d15967bc53b885912e0d16866154acb6aac2d3f85e27ca7eefb2c19083)),
+]
+
+# -- BLAKE3 (single chunk) ----------------------------------------------------
+
+_BLAKE3_IV = (0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19)
+_BLAKE3_PERMUTATION = (2, 6, 3, 10, 7, 0, 4, 13, 1, 11, 12, 5, 9, 14, 15, 8)
+_CHUNK_START, _CHUNK_END, _ROOT = 1, 2, 8
+_MASK32 = 0xFFFFFFFF
+
+def _rotr(x, n):
+    return ((x >> n) | (x << (32 - n))) & _MASK32
+
+def _g(s, a, b, c, d, mx, my):
+    s[a] = (s[a] + s[b] + mx) & _MASK32
+    s[d] = _rotr(s[d] ^ s[a], 16)
+    s[c] = (s[c] + s[d]) & _MASK32
+    s[b] = _rotr(s[b] ^ s[c], 12)
+    s[a] = (s[a] + s[b] + my) & _MASK32
+    s[d] = _rotr(s[d] ^ s[a], 8)
+    s[c] = (s[c] + s[d]) & _MASK32
+    s[b] = _rotr(s[b] ^ s[c], 7)
+
+def _compress(cv, block, block_len, flags):
+    m = list(struct.unpack("<16I", block))
+    s = list(cv) + list(_BLAKE3_IV[:4]) + [0, 0, block_len, flags]
+    for _ in range(7):
+        _g(s, 0, 4, 8, 12, m[0], m[1])
+        _g(s, 1, 5, 9, 13, m[2], m[3])
+        _g(s, 2, 6, 10, 14, m[4], m[5])
+        _g(s, 3, 7, 11, 15, m[6], m[7])
+        _g(s, 0, 5, 10, 15, m[8], m[9])
+        _g(s, 1, 6, 11, 12, m[10], m[11])
+        _g(s, 2, 7, 8, 13, m[12], m[13])
+        _g(s, 3, 4, 9, 14, m[14], m[15])
+        m = [m[i] for i in _BLAKE3_PERMUTATION]
+    return [s[i] ^ s[i + 8] for i in range(8)]
+
+def blake3(data):
+    """32-byte BLAKE3 digest of up to 1024 bytes (one chunk, all derivation needs)"""
+    data = bytes(data)
+    if len(data) > 1024:
+        raise ValueError("blake3 here supports inputs of at most 1024 bytes")
+    blocks = [data[i:i + 64] for i in range(0, len(data), 64)] or [b""]
+    cv = _BLAKE3_IV
+    for i, block in enumerate(blocks):
+        flags = (_CHUNK_START if i == 0 else 0) | (_CHUNK_END | _ROOT if i == len(blocks) - 1 else 0)
+        cv = _compress(cv, block.ljust(64, b"\0"), len(block), flags)
+    return struct.pack("<8I", *cv)
+
+# -- Grumpkin arithmetic ------------------------------------------------------
+
+def _sqrt(a):
+    """Square root modulo P (Tonelli-Shanks), or None"""
+    a %= P
+    if a == 0:
+        return 0
+    if pow(a, (P - 1) // 2, P) != 1:
+        return None
+    q, s = P - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    z = 5
+    while pow(z, (P - 1) // 2, P) != P - 1:
+        z += 1
+    m, c, t, r = s, pow(z, q, P), pow(a, q, P), pow(a, (q + 1) // 2, P)
+    while t != 1:
+        i, t2 = 1, t * t % P
+        while t2 != 1:
+            t2 = t2 * t2 % P
+            i += 1
+        b = pow(c, 1 << (m - i - 1), P)
+        m, c, t, r = i, b * b % P, t * b * b % P, r * b % P
+    return r
+
+def on_curve(point):
+    x, y = point
+    return (y * y - x * x * x - B) % P == 0
+
+def hash_to_curve(seed, attempt=0):
+    """barretenberg affine_element::hash_to_curve"""
+    hi = blake3(seed + bytes([attempt, 0]))
+    lo = blake3(seed + bytes([attempt, 1]))
+    x = (int.from_bytes(hi, "big") << 256 | int.from_bytes(lo, "big")) % P
+    y = _sqrt(x * x * x + B)
+    if y is None:
+        return hash_to_curve(seed, attempt + 1)
+    if (y & 1) != (hi[0] > 127):
+        y = P - y
+    return x, y
+
+def derive_generators(domain_separator, count, start=0):
+    """Affine generators start .. start+count-1 of a domain separator"""
+    domain_hash = blake3(domain_separator)
+    return [hash_to_curve(domain_hash + index.to_bytes(4, "big") + bytes(28))
+            for index in range(start, start + count)]
+
+def _double(X, Y, Z):
+    """Jacobian doubling for a = 0 (dbl-2009-l)"""
+    if Y == 0:
+        return 0, 1, 0
+    A = X * X % P
+    B_ = Y * Y % P
+    C = B_ * B_ % P
+    D = 2 * ((X + B_) * (X + B_) - A - C) % P
+    E = 3 * A % P
+    X3 = (E * E - 2 * D) % P
+    return X3, (E * (D - X3) - 8 * C) % P, 2 * Y * Z % P
+
+def _add_affine(X1, Y1, Z1, x2, y2):
+    """Jacobian + affine (madd-2007-bl); Z = 0 is the point at infinity"""
+    if Z1 == 0:
+        return x2, y2, 1
+    Z1Z1 = Z1 * Z1 % P
+    U2 = x2 * Z1Z1 % P
+    S2 = y2 * Z1 * Z1Z1 % P
+    H = (U2 - X1) % P
+    r = 2 * (S2 - Y1) % P
+    if H == 0:
+        return _double(X1, Y1, Z1) if r == 0 else (0, 1, 0)
+    HH = H * H % P
+    I = 4 * HH % P
+    J = H * I % P
+    V = X1 * I % P
+    X3 = (r * r - J - 2 * V) % P
+    Y3 = (r * (V - X3) - 2 * Y1 * J) % P
+    Z3 = ((Z1 + H) * (Z1 + H) - Z1Z1 - HH) % P
+    return X3, Y3, Z3
+
+def _batch_inverse(values):
+    """Inverses of non-zero field elements with a single modular inversion"""
+    prefix = [1] * (len(values) + 1)
+    for i, v in enumerate(values):
+        prefix[i + 1] = prefix[i] * v % P
+    inverse = pow(prefix[-1], -1, P)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = prefix[i] * inverse % P
+        inverse = inverse * values[i] % P
+    return result
+
+def _to_affine(points):
+    """Jacobian points (none at infinity) to affine, with one inversion"""
+    inverses = _batch_inverse([Z for _, _, Z in points])
+    out = []
+    for (X, Y, _), zi in zip(points, inverses):
+        zi2 = zi * zi % P
+        out.append((X * zi2 % P, Y * zi2 * zi % P))
+    return out
+
+def scalar_mul(point, scalar):
+    """Plain double-and-add (reference for the windowed tables)"""
+    acc = (0, 1, 0)
+    for bit in bin(scalar % (1 << SCALAR_BITS))[2:]:
+        acc = _double(*acc)
+        if bit == "1":
+            acc = _add_affine(*acc, *point)
+    if acc[2] == 0:
+        return None
+    return _to_affine([acc])[0]
+
+# -- windowed fixed-base tables -----------------------------------------------
+
+def _build_table(generator, window_bits):
+    """[window][digit - 1] = digit * 2**(window_bits * window) * generator, affine"""
+    windows = -(-SCALAR_BITS // window_bits)
+    size = (1 << window_bits) - 1
+    jacobian = []
+    base = generator
+    for _ in range(windows):
+        acc = (base[0], base[1], 1)
+        jacobian.append(acc)
+        for _ in range(size - 1):
+            acc = _add_affine(*acc, *base)
+            jacobian.append(acc)
+        # next window's base is 2**window_bits * base = acc + base
+        base = _to_affine([_add_affine(*acc, *base)])[0]
+    affine = _to_affine(jacobian)
+    return [affine[w * size:(w + 1) * size] for w in range(windows)]
+
+def _table_key(domain_separator, index, window_bits):
+    digest = hashlib.sha256(b"grumpkin-fixed-base-v1")
+    digest.update(domain_separator + b"\0" + index.to_bytes(4, "big") + bytes([window_bits]))
+    return digest.hexdigest()
+
+def _table_name(domain_separator, index, window_bits):
+    return f"pedersen-{_table_key(domain_separator, index, window_bits)[:16]}.npy"
+
+def _load_table(path, window_bits):
+    try:
+        raw = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    windows = -(-SCALAR_BITS // window_bits)
+    if raw.shape != (windows, (1 << window_bits) - 1, 2, FIELD_BYTES) or raw.dtype != np.uint8:
+        return None
+    flat = raw.reshape(-1, FIELD_BYTES).tobytes()
+    coords = [int.from_bytes(flat[i:i + FIELD_BYTES], "big") for i in range(0, len(flat), FIELD_BYTES)]
+    size = raw.shape[1]
+    return [[(coords[2 * (w * size + d)], coords[2 * (w * size + d) + 1]) for d in range(size)]
+            for w in range(windows)]
+
+def _save_table(path, table):
+    """Best-effort atomic write; an unwritable cache directory is not an error"""
+    raw = np.frombuffer(b"".join(field_bytes(c) for window in table for point in window for c in point),
+                        dtype=np.uint8).reshape(len(table), len(table[0]), 2, FIELD_BYTES)
+    buffer = io.BytesIO()
+    np.save(buffer, raw, allow_pickle=False)
+    try:
+        atomic_write(path, buffer.getvalue())
+    except OSError:
+        pass
+
+class PedersenHasher:
+    """
+    Noir-compatible pedersen_hash with windowed fixed-base tables.
+
+    A table per generator is built on first use, loaded from ``cache_dir``
+    when present and written there otherwise (None disables the disk
+    cache). Inputs are field elements (ints, reduced modulo the field like
+    Noir Fields). Thread-safe.
+    """
+
+    def __init__(self, window_bits=WINDOW_BITS, cache_dir=ARTIFACT_DIR):
+        if not 2 <= window_bits <= 16:
+            raise ValueError("window_bits must be between 2 and 16")
+        self.window_bits = window_bits
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def _table(self, domain_separator, index):
+        key = (domain_separator, index)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                path = None
+                if self.cache_dir is not None:
+                    path = self.cache_dir / _table_name(domain_separator, index, self.window_bits)
+                    table = _load_table(path, self.window_bits)
+                if table is None:
+                    generator = derive_generators(domain_separator, 1, index)[0]
+                    table = _build_table(generator, self.window_bits)
+                    if path is not None:
+                        _save_table(path, table)
+                self._tables[key] = table
+            return table
+
+    def warm(self, n_inputs, separator=0):
+        """Load or build the tables hashes of `n_inputs` inputs need"""
+        for index in range(separator, separator + n_inputs):
+            self._table(DEFAULT_DOMAIN_SEPARATOR, index)
+        self._table(LENGTH_DOMAIN_SEPARATOR, 0)
+
+    def _accumulate(self, inputs, separator):
+        """Jacobian sum of input[i] * G[separator + i] + N * H"""
+        bits, mask = self.window_bits, (1 << self.window_bits) - 1
+        X, Y, Z = 0, 1, 0
+        terms = [(self._table(DEFAULT_DOMAIN_SEPARATOR, separator + i), int(v) % P) for i, v in enumerate(inputs)]
+        terms.append((self._table(LENGTH_DOMAIN_SEPARATOR, 0), len(inputs)))
+        for table, scalar in terms:
+            window = 0
+            while scalar:
+                digit = scalar & mask
+                if digit:
+                    X, Y, Z = _add_affine(X, Y, Z, *table[window][digit - 1])
+                scalar >>= bits
+                window += 1
+        return X, Y, Z
+
+    def hash(self, inputs, separator=0):
+        """pedersen_hash_with_separator(inputs, separator) as an int"""
+        X, _, Z = self._accumulate(inputs, separator)
+        if Z == 0:
+            return 0
+        zi = pow(Z, -1, P)
+        return X * zi * zi % P
+
+    def hash_many(self, rows, separator=0):
+        """pedersen_hash of each row of inputs, sharing one inversion across the batch"""
+        points = [self._accumulate(row, separator) for row in rows]
+        finite = [i for i, (_, _, Z) in enumerate(points) if Z]
+        result = [0] * len(points)
+        for i, zi in zip(finite, _batch_inverse([points[i][2] for i in finite])):
+            result[i] = points[i][0] * zi * zi % P
+        return result
+
+    def pair(self, left, right):
+        """MerkleTree node hash: pedersen_hash([left, right]) of 32-byte nodes"""
+        return field_bytes(self.hash([int.from_bytes(left, "big"), int.from_bytes(right, "big")]))
+
+    def leaf(self, *elements):
+        """SupplierRegistryTree leaf hash: pedersen_hash(elements), as main.nr's supplier_leaf"""
+        return field_bytes(self.hash(elements))
+
+def cross_check(hasher=None):
+    """[(description, ok)] against the known generator and hash vectors"""
+    hasher = hasher or default_hasher()
+    results = []
+    for separator, index, expected in CROSS_CHECK_GENERATORS:
+        point = derive_generators(separator, 1, index)[0]
+        results.append((f"generator {separator.decode()}[{index}]", point == expected))
+    for inputs, separator, expected in CROSS_CHECK_VECTORS:
+        results.append((f"pedersen_hash_with_separator({inputs}, {separator})",
+                        hasher.hash(inputs, separator) == expected))
+    return results
+
+_default_hasher = None
+_default_lock = threading.Lock()
+
+def default_hasher():
+    """Process-wide PedersenHasher with the default settings"""
+    global _default_hasher
+    with _default_lock:
+        if _default_hasher is None:
+            _default_hasher = PedersenHasher()
+        return _default_hasher
+
+def pedersen_hash(inputs, separator=0):
+    """Noir std::hash::pedersen_hash (with_separator) of a list of field elements"""
+    return default_hasher().hash(inputs, separator)
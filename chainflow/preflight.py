@@ -0,0 +1,118 @@
+"""
+Pre-flight evaluation of ``src/main.nr`` assertions over whole catalogues.
+
+Running the prover on an input that fails an assertion wastes a full
+``nargo execute``. The circuit's checks are cheap arithmetic, so they are
+re-evaluated here column-wise with NumPy over many witnesses at once
+(WitnessBuilder output or read_packed records), reporting the first
+assertion each product would fail in circuit execution order. Casts follow
+Noir: ``x as u32`` keeps the low 32 bits of the field element, i.e. of the
+input reduced mod p.
+
+The ``product_hash`` check only catches hand-edited or externally built
+witnesses: WitnessBuilder derives ``expected_product_hash`` from the same
+four inputs the circuit sums, so its output always passes it.
+
+The ``pedersen_hash(..) != 0`` checks are not evaluated: they only fail on
+a hash collision with zero, which no catalogue input can be expected to hit.
+"""
+
+import numpy as np
+import pandas as pd
+
+from chainflow.fields import BN254_MODULUS
+
+# (name, condition that must hold), in the order main.nr asserts them
+ASSERTIONS = [
+    ("product_hash", "product_id + product_category + batch_number + manufacturing_date == expected_product_hash"),
+    ("supplier_tier_min", "supplier_tier as u32 >= 1"),
+    ("supplier_tier_max", "supplier_tier as u32 <= 3"),
+    ("certification_hash", "supplier_certification_hash != 0"),
+    ("origin_location", "origin_location != 0"),
+    ("final_destination", "final_destination != 0"),
+    ("manufacturer_signature", "manufacturer_signature != 0"),
+    ("distributor_signature", "distributor_signature != 0"),
+    ("proof_version", "proof_version != 0"),
+    ("circuit_id", "circuit_id != 0"),
+    ("zkverify_chain_id", "zkverify_chain_id != 0"),
+    ("risk_score", "compute_risk_assessment score >= 70"),
+]
+MIN_SCORE = 70
+_U32 = 0xFFFFFFFF
+
+def _column(witnesses, name):
+    return np.fromiter((w[name] for w in witnesses), dtype=object, count=len(witnesses))
+
+def _u32(column):
+    return (column % BN254_MODULUS & _U32).astype(np.int64)
+
+def _nonzero(column):
+    return (column % BN254_MODULUS != 0).astype(bool)
+
+def risk_assessment(tier, category, timestamp):
+    """compute_risk_assessment over u32 arrays: (score, risk) int arrays"""
+    score = np.full(len(tier), 50, dtype=np.int64)
+    score += np.select([tier == 1, tier == 2], [30, 20], 10)
+    score += np.select([category == 1, category == 2, category == 3], [15, 20, 10], 0)
+    score += np.where(timestamp > 1_700_000_000, 5, 0)
+    score = np.clip(score, 0, 100)
+    risk = np.select([score >= 80, score >= 60], [1, 2], 3)
+    return score, risk
+
+def assertion_matrix(witnesses):
+    """
+    (n, len(ASSERTIONS)) bool array, True where an assertion holds, plus the
+    (score, risk) arrays of compute_risk_assessment
+    """
+    witnesses = list(witnesses)
+    product_hash = (_column(witnesses, "product_id") + _column(witnesses, "product_category") +
+                    _column(witnesses, "batch_number") + _column(witnesses, "manufacturing_date")) % BN254_MODULUS
+    tier = _u32(_column(witnesses, "supplier_tier"))
+    score, risk = risk_assessment(tier, _u32(_column(witnesses, "product_category")),
+                                  _u32(_column(witnesses, "verification_timestamp")))
+    checks = [
+        (product_hash == _column(witnesses, "expected_product_hash") % BN254_MODULUS).astype(bool),
+        tier >= 1,
+        tier <= 3,
+        _nonzero(_column(witnesses, "supplier_certification_hash")),
+        _nonzero(_column(witnesses, "origin_location")),
+        _nonzero(_column(witnesses, "final_destination")),
+        _nonzero(_column(witnesses, "manufacturer_signature")),
+        _nonzero(_column(witnesses, "distributor_signature")),
+        _nonzero(_column(witnesses, "proof_version")),
+        _nonzero(_column(witnesses, "circuit_id")),
+        _nonzero(_column(witnesses, "zkverify_chain_id")),
+        score >= MIN_SCORE,
+    ]
+    return np.column_stack(checks) if witnesses else np.ones((0, len(ASSERTIONS)), dtype=bool), score, risk
+
+def preflight(witnesses):
+    """
+    Evaluate main.nr's assertions for (product_id, inputs) pairs. Returns
+    one row per product: passed, failed_assertion (the first one the circuit
+    would hit, None if it passes), failures (every failing assertion, ';'
+    separated), score and risk.
+    """
+    witnesses = list(witnesses)
+    product_ids = [product_id for product_id, _ in witnesses]
+    holds, score, risk = assertion_matrix([inputs for _, inputs in witnesses])
+    names = np.array([name for name, _ in ASSERTIONS], dtype=object)
+    failed = ~holds
+    passed = ~failed.any(axis=1)
+    first = np.where(passed, None, names[failed.argmax(axis=1)]) if len(witnesses) else np.array([], dtype=object)
+    failures = [";".join(names[row]) for row in failed]
+    return pd.DataFrame({
+        'product_id': product_ids,
+        'passed': passed,
+        'failed_assertion': first,
+        'failures': failures,
+        'score': score,
+        'risk': risk
+    })
+
+def split_viable(witnesses):
+    """(viable witnesses, report): drop the inputs the prover would reject"""
+    witnesses = list(witnesses)
+    report = preflight(witnesses)
+    viable = [witness for witness, ok in zip(witnesses, report['passed'].to_numpy()) if ok]
+    return viable, report
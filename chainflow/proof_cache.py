@@ -0,0 +1,141 @@
+"""
+Persistent content-addressed cache of ZK proofs.
+
+A proof is keyed on a canonical hash of everything it depends on: the full
+product record, proof type, privacy level and circuit version. Changing
+any input field (or the circuit) yields a different key, so a stale proof
+is never served and needs no explicit invalidation. Entries live in an
+in-memory LRU (a RouteCache, so concurrent misses for one key generate
+once) backed by one JSON file per key on disk, which survives restarts
+and is shared by every process pointed at the same directory.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from chainflow.cache import RouteCache
+from chainflow.storage import atomic_write
+
+CIRCUIT_FILES = ("src/main.nr", "Nargo.toml")
+
+def canonical_json(value):
+    """JSON text that is identical for equal values regardless of key order"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def canonical_hash(value):
+    """SHA-256 hex digest of canonical_json(value)"""
+    return hashlib.sha256(canonical_json(value).encode()).hexdigest()
+
+def circuit_version(root="."):
+    """Short hash of the circuit sources; missing files hash as empty"""
+    digest = hashlib.sha256()
+    for name in CIRCUIT_FILES:
+        digest.update(name.encode() + b"\0")
+        try:
+            digest.update(Path(root, name).read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+def proof_cache_key(product, proof_type, privacy_level, version):
+    """Content address of a product proof"""
+    return canonical_hash({
+        'product': product,
+        'proof_type': proof_type,
+        'privacy_level': privacy_level,
+        'circuit_version': version
+    })
+
+class ProofCache:
+    """
+    Two-level proof store: ``maxsize`` most recently used proofs in memory,
+    every proof on disk under ``directory`` (None for memory only). Proofs
+    must be JSON-serializable dicts and must not be mutated by callers.
+    Disk errors are treated as misses; the cache never fails a request.
+    """
+
+    def __init__(self, directory=None, maxsize=4096):
+        self.directory = None if directory is None else Path(directory)
+        self._memory = RouteCache(maxsize, ttl=None)
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.generated = 0
+        self.write_errors = 0
+
+    def __contains__(self, key):
+        return key in self._memory or (self.directory is not None and self._path(key).exists())
+
+    def get_or_compute(self, key, compute):
+        """Cached proof for `key`, calling `compute()` once if neither level has it"""
+        return self._memory.get_or_compute(key, lambda: self._load_or_compute(key, compute))
+
+    def get(self, key):
+        """Cached proof for `key`, or None"""
+        if key not in self:
+            return None
+        try:
+            return self.get_or_compute(key, lambda: None)
+        except KeyError:
+            return None
+
+    def clear(self, disk=False):
+        """Drop the in-memory entries, and the on-disk ones too if `disk`"""
+        self._memory.clear()
+        if disk and self.directory is not None:
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self):
+        memory = self._memory.stats()
+        with self._lock:
+            return {
+                'size': memory['size'],
+                'maxsize': memory['maxsize'],
+                'memory_hits': memory['hits'],
+                'disk_hits': self.disk_hits,
+                'generated': self.generated,
+                'coalesced': memory['coalesced'],
+                'write_errors': self.write_errors
+            }
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load_or_compute(self, key, compute):
+        proof = self._load(key)
+        if proof is not None:
+            with self._lock:
+                self.disk_hits += 1
+            return proof
+        proof = compute()
+        if proof is None:
+            raise KeyError(key)
+        with self._lock:
+            self.generated += 1
+        self._save(key, proof)
+        return proof
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        return entry.get('proof')
+
+    def _save(self, key, proof):
+        """Atomically write one entry; a failed write only costs a future regeneration"""
+        if self.directory is None:
+            return
+        try:
+            atomic_write(self._path(key), canonical_json({'key': key, 'proof': proof}))
+        except (OSError, TypeError, ValueError):
+            with self._lock:
+                self.write_errors += 1
@@ -0,0 +1,612 @@
+"""
+Hub network routing for the ChainFlow route optimizer.
+
+Countries and shipping hubs form a weighted multigraph. Every edge carries
+cost (USD per container), transit time (days) and carbon (tons CO2), derived
+from great-circle distances, and a route is the shortest path under the
+metric chosen by the user's priority. Countries are route endpoints only;
+transit always happens through hubs.
+
+For constrained planning the network also enumerates the Pareto frontier
+over (cost, time, carbon) with a label-setting search, honouring a transit
+stop limit, avoided areas/regions and cargo-specific restrictions. Ranked
+alternatives come from a Yen-style k-shortest loopless path search.
+"""
+
+import heapq
+from functools import lru_cache
+from itertools import islice
+
+from chainflow.distances import distance_km, nearest_hubs
+from chainflow.geography import COUNTRIES, SHIPPING_HUBS, region_of
+
+# Optimization priority -> edge metric minimised by the search
+PRIORITY_METRICS = {
+    "Cost": "cost",
+    "Time": "time",
+    "Sustainability": "carbon"
+}
+
+METRIC_INDEX = {"cost": 0, "time": 1, "carbon": 2}
+
+# How each priority picks a route off the Pareto frontier (lexicographic keys)
+ROUTE_PRIORITY_KEYS = {
+    "Cost": ('cost', 'time', 'carbon'),
+    "Time": ('time', 'cost', 'carbon'),
+    "Sustainability": ('carbon', 'cost', 'time'),
+    "Security": ('risk_score', 'time', 'cost')
+}
+
+# Hubs exposed to each avoidable condition offered in the route optimizer
+ROUTE_AVOIDANCE_AREAS = {
+    "High Risk Areas": ["Cairo", "Lagos", "Dubai"],
+    "Weather Affected": ["Hong Kong", "Shanghai", "Miami", "Mumbai", "Brisbane"],
+    "Port Congestion": ["Los Angeles", "Shanghai", "Rotterdam"]
+}
+
+# Security exposure added by transiting a hub under each condition
+AREA_RISK = {"High Risk Areas": 3, "Weather Affected": 1, "Port Congestion": 1}
+
+# Routing restrictions by cargo type: allowed leg modes, transit time cap
+# (days), stop cap and areas that must always be avoided
+CARGO_RULES = {
+    "Fragile": {'max_stops': 2},
+    "Perishable": {'max_time': 20},
+    "Hazardous": {'modes': ('road', 'regional', 'sea')},
+    "Medical Supplies": {'max_time': 25},
+    "Pharmaceuticals": {'max_time': 25},
+    "Defense Equipment": {'avoid': ("High Risk Areas",)}
+}
+
+# Distance-based leg models for one container: fixed handling cost (USD)
+# and days, USD and tons CO2 per great-circle km, and km covered per day.
+# Country <-> hub feeders run by road/rail to the country's nearest hubs.
+ROAD_FEEDER = {'base_cost': 200, 'cost_per_km': 0.5, 'handling_days': 1, 'km_per_day': 500, 'carbon_per_km': 0.0005}
+FEEDER_HUBS = 3
+
+# Hub <-> hub legs inside a region (short-sea / rail)
+REGIONAL_LINK = {'base_cost': 400, 'cost_per_km': 0.2, 'handling_days': 1, 'km_per_day': 600, 'carbon_per_km': 0.00015}
+
+# Deep-sea trunk lanes between hubs of different regions, with scheduled
+# transit days and USD rates: (hub, hub, days, USD)
+TRUNK_LANES = [
+    ("Shanghai", "Los Angeles", 16, 2600), ("Hong Kong", "Los Angeles", 17, 2700),
+    ("Shanghai", "Vancouver", 15, 2500), ("Singapore", "Los Angeles", 21, 3000),
+    ("Shanghai", "New York", 33, 4200), ("Singapore", "Santos", 32, 3600),
+    ("Shanghai", "Rotterdam", 32, 3100), ("Singapore", "Rotterdam", 26, 2800),
+    ("Dubai", "Rotterdam", 18, 2200), ("Mumbai", "Hamburg", 22, 2500),
+    ("Singapore", "Barcelona", 22, 2600), ("Dubai", "Barcelona", 15, 2000),
+    ("Rotterdam", "New York", 10, 1800), ("London", "New York", 9, 1900),
+    ("Hamburg", "New York", 11, 1800), ("Antwerp", "Santos", 16, 2300),
+    ("Barcelona", "Miami", 12, 2000), ("Cape Town", "Santos", 14, 2000),
+    ("Durban", "Singapore", 16, 2200), ("Durban", "Mumbai", 14, 2000),
+    ("Lagos", "Rotterdam", 14, 2100), ("Lagos", "New York", 15, 2300),
+    ("Cairo", "Barcelona", 6, 1300), ("Cairo", "Dubai", 7, 1400),
+    ("Casablanca", "Barcelona", 2, 600), ("Casablanca", "Miami", 11, 2000),
+    ("Cape Town", "Rotterdam", 19, 2500), ("Sydney", "Singapore", 10, 1700),
+    ("Brisbane", "Shanghai", 13, 1900), ("Sydney", "Los Angeles", 18, 2800),
+    ("Auckland", "Los Angeles", 16, 2700), ("Melbourne", "Durban", 14, 2300)
+]
+
+# Ocean carbon per great-circle km, with sailings running longer than the
+# great circle; air freight is priced off the sea rate and flies direct
+SEA_CARBON_PER_KM = 0.0002
+SEA_DETOUR_FACTOR = 1.3
+AIR_FREIGHT = {'cost_factor': 4.0, 'handling_days': 1, 'km_per_day': 8000, 'carbon_per_km': 0.0025}
+
+class HubNetwork:
+    """Weighted multigraph of countries and shipping hubs"""
+    
+    def __init__(self):
+        self.labels = []
+        self.is_hub = []
+        self.tags = []
+        self.risk = []
+        self.adjacency = []
+        self._nodes = {}
+        self._bounds_cache = {}
+    
+    def add_node(self, name, hub=False, tags=(), risk=0):
+        """
+        Add a country (hub=False) or hub node and return its index.
+        
+        ``tags`` name the regions/areas a hub belongs to so searches can
+        avoid it; ``risk`` is its security exposure when used for transit.
+        """
+        key = (hub, name)
+        if key not in self._nodes:
+            self._nodes[key] = len(self.labels)
+            self.labels.append(name)
+            self.is_hub.append(hub)
+            self.tags.append(frozenset(tags))
+            self.risk.append(risk)
+            self.adjacency.append([])
+        return self._nodes[key]
+    
+    def node(self, name, hub=False):
+        """Index of an existing node"""
+        try:
+            return self._nodes[(hub, name)]
+        except KeyError:
+            kind = "hub" if hub else "country"
+            raise ValueError(f"Unknown {kind}: {name}") from None
+    
+    def add_edge(self, a, b, cost, time, carbon, mode):
+        """Add a leg in both directions between node indices a and b"""
+        self.adjacency[a].append((b, cost, time, carbon, mode))
+        self.adjacency[b].append((a, cost, time, carbon, mode))
+    
+    @property
+    def edge_count(self):
+        return sum(len(edges) for edges in self.adjacency)
+    
+    def shortest_path(self, origin, destination, priority="Cost"):
+        """
+        Cheapest route between two countries under the priority's metric.
+        
+        Ties on the primary metric are broken on cost (or time when cost is
+        the primary metric) and then node index, so results are deterministic.
+        """
+        if priority not in PRIORITY_METRICS:
+            raise ValueError(f"Unknown priority: {priority}")
+        primary = 1 + METRIC_INDEX[PRIORITY_METRICS[priority]]
+        secondary = 2 if primary == 1 else 1
+        
+        source = self.node(origin)
+        target = self.node(destination)
+        is_hub = self.is_hub
+        adjacency = self.adjacency
+        
+        best = {source: (0.0, 0.0)}
+        previous = {}
+        heap = [(0.0, 0.0, source)]
+        while heap:
+            weight, tie, node = heapq.heappop(heap)
+            if node == target:
+                break
+            if best[node] < (weight, tie):
+                continue
+            for edge in adjacency[node]:
+                neighbour = edge[0]
+                if not is_hub[neighbour] and neighbour != target:
+                    continue
+                candidate = (weight + edge[primary], tie + edge[secondary])
+                if candidate < best.get(neighbour, (float('inf'), 0.0)):
+                    best[neighbour] = candidate
+                    previous[neighbour] = (node, edge)
+                    heapq.heappush(heap, (candidate[0], candidate[1], neighbour))
+        
+        if target not in best:
+            raise ValueError(f"No route from {origin} to {destination}")
+        
+        legs = []
+        node = target
+        while node != source:
+            node, edge = previous[node]
+            legs.append((node, edge))
+        legs.reverse()
+        return self._describe(source, legs)
+    
+    def pareto_routes(self, origin, destination, max_stops=None, avoid=(), modes=None, max_time=None):
+        """
+        All Pareto-optimal routes over (cost, time, carbon), cheapest first.
+        
+        Multi-objective label-setting: labels are settled in lexicographic
+        order of their optimistic totals (cost so far plus the exact
+        unconstrained remaining distance per metric). A label is pruned when
+        a settled label at the same node dominates it on every objective and
+        on stops used, when its optimistic totals are dominated by a route
+        already found, or when the destination is out of reach within the
+        stop limit. ``max_stops`` caps transit hubs, ``avoid`` excludes hubs
+        carrying any of those tags, ``modes`` restricts leg modes and
+        ``max_time`` caps transit days.
+        """
+        source = self.node(origin)
+        target = self.node(destination)
+        is_hub = self.is_hub
+        adjacency = self.adjacency
+        avoid = frozenset(avoid)
+        modes = None if modes is None else frozenset(modes)
+        blocked = [bool(avoid & tags) for tags in self.tags] if avoid else None
+        stop_limit = float('inf') if max_stops is None else max_stops
+        time_limit = float('inf') if max_time is None else max_time
+        
+        bound_cost, bound_time, bound_carbon, hops = self._bounds_to(target, avoid, modes)
+        if source not in hops:
+            return []
+        
+        # Label = (cost, time, carbon, stops, node, parent label, edge taken)
+        labels = [(0.0, 0.0, 0.0, 0, source, None, None)]
+        settled = [[] for _ in self.labels]
+        found = []
+        routes = []
+        heap = [(bound_cost[source], bound_time[source], bound_carbon[source], 0, 0)]
+        
+        while heap:
+            _, _, _, _, label_id = heapq.heappop(heap)
+            cost, time, carbon, stops, node = labels[label_id][:5]
+            if node == target:
+                if not _dominated((cost, time, carbon), found):
+                    found.append((cost, time, carbon))
+                    routes.append(label_id)
+                continue
+            if _dominated((cost, time, carbon, stops), settled[node]):
+                continue
+            settled[node].append((cost, time, carbon, stops))
+            
+            for edge in adjacency[node]:
+                neighbour, edge_cost, edge_time, edge_carbon, mode = edge
+                if neighbour not in hops:
+                    continue
+                if is_hub[neighbour]:
+                    next_stops = stops + 1
+                    if next_stops + hops[neighbour] > stop_limit or (blocked and blocked[neighbour]):
+                        continue
+                elif neighbour == target:
+                    next_stops = stops
+                else:
+                    continue
+                if modes is not None and mode not in modes:
+                    continue
+                
+                next_time = time + edge_time
+                estimate_time = next_time + bound_time[neighbour]
+                if estimate_time > time_limit:
+                    continue
+                next_cost = cost + edge_cost
+                next_carbon = carbon + edge_carbon
+                estimate = (next_cost + bound_cost[neighbour], estimate_time, next_carbon + bound_carbon[neighbour])
+                if _dominated(estimate, found):
+                    continue
+                if neighbour != target and _dominated((next_cost, next_time, next_carbon, next_stops), settled[neighbour]):
+                    continue
+                
+                labels.append((next_cost, next_time, next_carbon, next_stops, neighbour, label_id, (node, edge)))
+                heapq.heappush(heap, (*estimate, next_stops, len(labels) - 1))
+        
+        described = []
+        for label_id in routes:
+            legs = []
+            while labels[label_id][5] is not None:
+                legs.append(labels[label_id][6])
+                label_id = labels[label_id][5]
+            legs.reverse()
+            described.append(self._describe(source, legs))
+        return described
+    
+    def _bounds_to(self, target, avoid, modes):
+        """
+        Exact unconstrained remaining cost, time and carbon from every node
+        to `target`, plus the fewest further transit hubs needed. Nodes that
+        cannot reach the target are absent from the hop map. Cached per
+        (target, avoided tags, modes) since bulk planning repeats them.
+        """
+        key = (target, avoid, modes)
+        cached = self._bounds_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        usable = [
+            (is_hub and not (avoid & tags)) or node == target
+            for node, (is_hub, tags) in enumerate(zip(self.is_hub, self.tags))
+        ]
+        
+        def distances(metric):
+            dist = {target: 0.0}
+            heap = [(0.0, target)]
+            while heap:
+                d, node = heapq.heappop(heap)
+                if d > dist[node]:
+                    continue
+                for edge in self.adjacency[node]:
+                    neighbour = edge[0]
+                    if modes is not None and edge[4] not in modes:
+                        continue
+                    candidate = d + edge[metric]
+                    if candidate < dist.get(neighbour, float('inf')):
+                        dist[neighbour] = candidate
+                        if usable[neighbour]:
+                            heapq.heappush(heap, (candidate, neighbour))
+            return dist
+        
+        # Breadth-first over usable hubs: hubs next to the target need no
+        # further stop, their neighbours one more, and so on
+        hops = {target: 0}
+        frontier = [target]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                extra = 0 if node == target else hops[node] + 1
+                for edge in self.adjacency[node]:
+                    neighbour = edge[0]
+                    if neighbour in hops or (modes is not None and edge[4] not in modes):
+                        continue
+                    if usable[neighbour]:
+                        hops[neighbour] = extra
+                        next_frontier.append(neighbour)
+                    elif not self.is_hub[neighbour]:
+                        hops[neighbour] = extra  # a possible origin country; never expanded
+            frontier = next_frontier
+        
+        bounds = (distances(1), distances(2), distances(3), hops)
+        if len(self._bounds_cache) >= 4096:
+            self._bounds_cache.clear()
+        self._bounds_cache[key] = bounds
+        return bounds
+    
+    def iter_shortest_paths(self, origin, destination, metric="cost", avoid=(), modes=None):
+        """
+        Loopless routes between two countries in increasing order of `metric`.
+        
+        Yen's algorithm with Lawler's refinement: each accepted route is only
+        spurred from the leg where it deviated from its parent. Spur searches
+        are A* guided by the exact unrestricted distances to the destination,
+        which stay admissible once root nodes and edges are removed. Routes
+        using a different mode on the same lane count as distinct routes.
+        Ties are broken as in ``shortest_path``. Yields nothing when `avoid`
+        or `modes` cut the origin off, like an empty ``pareto_routes``.
+        """
+        if metric not in METRIC_INDEX:
+            raise ValueError(f"Unknown metric: {metric}")
+        primary = 1 + METRIC_INDEX[metric]
+        secondary = 2 if primary == 1 else 1
+        
+        source = self.node(origin)
+        target = self.node(destination)
+        avoid = frozenset(avoid)
+        modes = None if modes is None else frozenset(modes)
+        blocked = [bool(avoid & tags) for tags in self.tags] if avoid else None
+        bounds = self._bounds_to(target, avoid, modes)
+        heuristic = (bounds[primary - 1], bounds[secondary - 1])
+        
+        def spur_path(spur_node, removed_nodes, removed_edges):
+            return self._spur_path(
+                spur_node, target, primary, secondary, heuristic, blocked, modes, removed_nodes, removed_edges
+            )
+        
+        legs = spur_path(source, (), ())
+        if legs is None:
+            return
+        accepted = []
+        seen = {tuple(legs)}
+        candidates = []
+        deviation = 0
+        while True:
+            accepted.append(legs)
+            yield self._describe(source, [(node, self.adjacency[node][index]) for node, index in legs])
+            
+            for i in range(deviation, len(legs)):
+                root = legs[:i]
+                removed_edges = {other[i] for other in accepted if len(other) > i and other[:i] == root}
+                removed_nodes = {node for node, _ in root}
+                spur = spur_path(legs[i][0], removed_nodes, removed_edges)
+                if spur is None:
+                    continue
+                path = tuple(root + spur)
+                if path in seen:
+                    continue
+                seen.add(path)
+                weight = [0.0, 0.0]
+                for node, index in path:
+                    edge = self.adjacency[node][index]
+                    weight[0] += edge[primary]
+                    weight[1] += edge[secondary]
+                heapq.heappush(candidates, (weight[0], weight[1], path, i))
+            
+            if not candidates:
+                return
+            _, _, path, deviation = heapq.heappop(candidates)
+            legs = list(path)
+    
+    def k_shortest_paths(self, origin, destination, k=5, metric="cost", avoid=(), modes=None):
+        """The `k` best loopless routes under `metric` (fewer if the network runs out)"""
+        return list(islice(self.iter_shortest_paths(origin, destination, metric, avoid, modes), k))
+    
+    def _spur_path(self, source, target, primary, secondary, heuristic, blocked, modes, removed_nodes, removed_edges):
+        """
+        A* from `source` to `target` over unblocked hubs, skipping removed
+        nodes and (node, edge index) pairs. Returns the legs as
+        (node, edge index) or None when the target is cut off.
+        """
+        is_hub = self.is_hub
+        adjacency = self.adjacency
+        bound, tie_bound = heuristic
+        if source not in bound:
+            return None  # avoided hubs or excluded modes cut the source off
+        
+        best = {source: (0.0, 0.0)}
+        previous = {}
+        heap = [(bound[source], tie_bound[source], 0.0, 0.0, source)]
+        while heap:
+            _, _, weight, tie, node = heapq.heappop(heap)
+            if node == target:
+                break
+            if best[node] < (weight, tie):
+                continue
+            for index, edge in enumerate(adjacency[node]):
+                neighbour = edge[0]
+                # Nodes without a bound cannot reach the target at all
+                if neighbour not in bound or neighbour in removed_nodes or (node, index) in removed_edges:
+                    continue
+                if (not is_hub[neighbour] and neighbour != target) or (blocked and blocked[neighbour]):
+                    continue
+                if modes is not None and edge[4] not in modes:
+                    continue
+                candidate = (weight + edge[primary], tie + edge[secondary])
+                if candidate < best.get(neighbour, (float('inf'), 0.0)):
+                    best[neighbour] = candidate
+                    previous[neighbour] = (node, index)
+                    heapq.heappush(heap, (
+                        candidate[0] + bound[neighbour], candidate[1] + tie_bound[neighbour],
+                        candidate[0], candidate[1], neighbour
+                    ))
+        else:
+            return None
+        
+        legs = []
+        node = target
+        while node != source:
+            legs.append(previous[node])
+            node = previous[node][0]
+        legs.reverse()
+        return legs
+    
+    def _describe(self, source, legs):
+        """Turn a list of (from_node, edge) legs into a route dict"""
+        path = [self.labels[source]]
+        arrival_days = [0.0]
+        elapsed = 0.0
+        route_legs = []
+        risk_score = 0
+        for from_node, (to_node, cost, time, carbon, mode) in legs:
+            elapsed += time
+            if self.labels[to_node] != path[-1]:
+                path.append(self.labels[to_node])
+                arrival_days.append(elapsed)
+            elif len(path) > 1:
+                arrival_days[-1] = elapsed  # e.g. Singapore hub -> Singapore
+            if self.is_hub[to_node]:
+                risk_score += self.risk[to_node]
+            route_legs.append({
+                'from': self.labels[from_node],
+                'to': self.labels[to_node],
+                'mode': mode,
+                'cost': cost,
+                'time': time,
+                'carbon': carbon
+            })
+        return {
+            'path': path,
+            'arrival_days': arrival_days,
+            'legs': route_legs,
+            'stops': sum(1 for from_node, edge in legs if self.is_hub[edge[0]]),
+            'risk_score': risk_score,
+            'cost': sum(leg['cost'] for leg in route_legs),
+            'time': sum(leg['time'] for leg in route_legs),
+            'carbon': sum(leg['carbon'] for leg in route_legs)
+        }
+
+def _dominated(candidate, labels):
+    """True if any label is at least as good as candidate on every component"""
+    for label in labels:
+        for a, b in zip(label, candidate):
+            if a > b:
+                break
+        else:
+            return True
+    return False
+
+def distance_leg(km, model):
+    """Cost, time and carbon of a `km` leg under one of the distance-based leg models"""
+    return {
+        'cost': round(model['base_cost'] + model['cost_per_km'] * km),
+        'time': round(model['handling_days'] + km / model['km_per_day'], 1),
+        'carbon': round(model['carbon_per_km'] * km, 2)
+    }
+
+def build_hub_network(countries=COUNTRIES, hubs_by_region=SHIPPING_HUBS):
+    """Build the country/hub network with feeder, regional and trunk legs"""
+    network = HubNetwork()
+    hub_nodes = {}
+    for region, hubs in hubs_by_region.items():
+        for hub in hubs:
+            areas = [area for area, area_hubs in ROUTE_AVOIDANCE_AREAS.items() if hub in area_hubs]
+            risk = 1 + sum(AREA_RISK.get(area, 0) for area in areas)
+            hub_nodes[hub] = network.add_node(hub, hub=True, tags=[region, *areas], risk=risk)
+    
+    # Hubs inside a region are all linked to each other
+    for region, hubs in hubs_by_region.items():
+        for i, a in enumerate(hubs):
+            for b in hubs[i + 1:]:
+                km = distance_km(a, b, a_hub=True, b_hub=True)
+                network.add_edge(hub_nodes[a], hub_nodes[b], mode='regional', **distance_leg(km, REGIONAL_LINK))
+    
+    # Each trunk lane is served by sea and by air
+    for a, b, days, cost in TRUNK_LANES:
+        if a not in hub_nodes or b not in hub_nodes:
+            continue
+        km = distance_km(a, b, a_hub=True, b_hub=True)
+        network.add_edge(hub_nodes[a], hub_nodes[b], cost, days, round(km * SEA_DETOUR_FACTOR * SEA_CARBON_PER_KM, 2), 'sea')
+        network.add_edge(
+            hub_nodes[a], hub_nodes[b],
+            cost * AIR_FREIGHT['cost_factor'],
+            round(AIR_FREIGHT['handling_days'] + km / AIR_FREIGHT['km_per_day'], 1),
+            round(km * AIR_FREIGHT['carbon_per_km'], 2),
+            'air'
+        )
+    
+    # Countries feed into the nearest hubs of their region
+    for country in countries:
+        node = network.add_node(country)
+        region_hubs = hubs_by_region.get(region_of(country), [])
+        for hub in nearest_hubs(country, FEEDER_HUBS, candidates=region_hubs):
+            km = distance_km(country, hub, b_hub=True)
+            network.add_edge(node, hub_nodes[hub], mode='road', **distance_leg(km, ROAD_FEEDER))
+    
+    return network
+
+@lru_cache(maxsize=None)
+def default_hub_network():
+    """The network over the app's countries and hubs, built once per process"""
+    return build_hub_network()
+
+def route_constraints(max_stops=None, avoid_regions=(), cargo_type="Standard"):
+    """Merge the caller's stop limit and avoided areas/regions with the cargo type's rules"""
+    rules = CARGO_RULES.get(cargo_type, {})
+    stop_limits = [limit for limit in (max_stops, rules.get('max_stops')) if limit is not None]
+    return {
+        'max_stops': min(stop_limits) if stop_limits else None,
+        'avoid': frozenset(avoid_regions) | frozenset(rules.get('avoid', ())),
+        'modes': rules.get('modes'),
+        'max_time': rules.get('max_time')
+    }
+
+def plan_route(origin, destination, priority="Cost", max_stops=None, avoid_regions=(), cargo_type="Standard",
+               network=None):
+    """
+    Constrained route planning for one lane.
+    
+    Applies the cargo type's rules on top of the caller's stop limit and
+    avoided areas/regions, enumerates the Pareto frontier and picks the
+    route matching the priority. Returns {'route': ..., 'alternatives': [...]}
+    with the frontier ordered cheapest first. Raises ValueError when the
+    constraints leave no feasible route.
+    """
+    if priority not in ROUTE_PRIORITY_KEYS:
+        raise ValueError(f"Unknown priority: {priority}")
+    network = network or default_hub_network()
+    
+    frontier = network.pareto_routes(origin, destination, **route_constraints(max_stops, avoid_regions, cargo_type))
+    if not frontier:
+        raise ValueError(f"No route from {origin} to {destination} satisfies the routing constraints")
+    
+    keys = ROUTE_PRIORITY_KEYS[priority]
+    route = min(frontier, key=lambda r: tuple(r[k] for k in keys))
+    return {'route': route, 'alternatives': frontier}
+
+def ranking_metric(priority):
+    """Edge metric a priority ranks routes by: its first key that is summed along legs"""
+    return next(key for key in ROUTE_PRIORITY_KEYS[priority] if key in METRIC_INDEX)
+
+def ranked_routes(origin, destination, k=5, priority="Cost", max_stops=None, avoid_regions=(),
+                  cargo_type="Standard", network=None, scan_limit=200):
+    """
+    The `k` best loopless routes under the priority's leading edge metric
+    (time for Security) that satisfy the same constraints as ``plan_route``.
+    
+    Avoided hubs and allowed modes shape the k-shortest search itself; stop
+    and time limits are checked as routes come off it, examining at most
+    `scan_limit` routes, so fewer than `k` may be returned, and none when
+    the constraints cut the origin off from the destination.
+    """
+    if priority not in ROUTE_PRIORITY_KEYS:
+        raise ValueError(f"Unknown priority: {priority}")
+    network = network or default_hub_network()
+    constraints = route_constraints(max_stops, avoid_regions, cargo_type)
+    stop_limit = float('inf') if constraints['max_stops'] is None else constraints['max_stops']
+    time_limit = float('inf') if constraints['max_time'] is None else constraints['max_time']
+    metric = ranking_metric(priority)
+    
+    routes = network.iter_shortest_paths(origin, destination, metric, constraints['avoid'], constraints['modes'])
+    feasible = (r for r in islice(routes, scan_limit) if r['stops'] <= stop_limit and r['time'] <= time_limit)
+    return list(islice(feasible, k))
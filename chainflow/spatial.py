@@ -0,0 +1,258 @@
+"""
+Spatial index for driver positions and delivery points.
+
+Points are (latitude, longitude) pairs bucketed into a uniform grid of
+``cell_km`` cells (rows of equal latitude, columns of equal longitude that
+wrap at the antimeridian; the column width is rounded so a whole number of
+columns spans exactly 360 degrees). A query only scans the cells overlapping the
+bounding box of its search cap and measures great-circle distances to the
+points found there, so k-nearest and radius queries touch a few hundred
+points instead of all of them. Coordinates live in NumPy arrays indexed by
+slot; inserts, moves and removals update one cell list in O(cell size).
+"""
+
+import math
+import threading
+
+import numpy as np
+
+from chainflow.distances import EARTH_RADIUS_KM
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS_KM
+
+def _haversine_to(lat, lon, lats, lons):
+    """Great-circle distances (km) from one point to arrays of points"""
+    lat, lon = math.radians(lat), math.radians(lon)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + math.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+class GridIndex:
+    """
+    Mutable grid index of keyed (lat, lon) points with k-nearest and radius
+    queries.
+
+    Keys are any hashable (driver or stop IDs); inserting an existing key
+    moves it. ``cell_km`` should be close to the typical query radius:
+    smaller cells scan fewer points per cell but more cells per query. All
+    methods are thread-safe.
+    """
+
+    def __init__(self, cell_km=1.0, capacity=1024):
+        if cell_km <= 0:
+            raise ValueError("cell_km must be positive")
+        self.cell_km = cell_km
+        self._cell_deg = cell_km / KM_PER_DEGREE
+        # A whole number of columns must tile the circle exactly, or the
+        # modulo wrap would misplace cells next to the antimeridian
+        self._columns = max(1, math.floor(360 / self._cell_deg))
+        self._col_deg = 360 / self._columns
+        self._lat = np.empty(capacity)
+        self._lon = np.empty(capacity)
+        self._cell = np.empty(capacity, dtype=np.int64)
+        self._keys = [None] * capacity
+        self._used = 0  # slots below this have been handed out
+        self._free = []
+        self._slot = {}  # key -> slot
+        self._cells = {}  # cell id -> [slots]
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._slot)
+
+    def __contains__(self, key):
+        return key in self._slot
+
+    def position(self, key):
+        """(lat, lon) of a key"""
+        slot = self._slot[key]
+        return float(self._lat[slot]), float(self._lon[slot])
+
+    # -- updates -----------------------------------------------------------
+
+    def _cell_ids(self, lats, lons):
+        rows = np.floor((np.asarray(lats) + 90) / self._cell_deg).astype(np.int64)
+        cols = np.floor((np.asarray(lons) + 180) / self._col_deg).astype(np.int64) % self._columns
+        return rows * self._columns + cols
+
+    def _grow(self, needed):
+        capacity = len(self._lat)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for name in ('_lat', '_lon', '_cell'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._used] = old[:self._used]
+            setattr(self, name, new)
+        self._keys.extend([None] * (capacity - len(self._keys)))
+
+    @staticmethod
+    def _check_latitudes(lats):
+        lats = np.asarray(lats, dtype=float)
+        if lats.size and not (np.all(lats >= -90) and np.all(lats <= 90)):
+            raise ValueError("Latitude must be between -90 and 90")
+        return lats
+
+    def insert(self, key, lat, lon):
+        """Add a point, or move it if the key is already indexed"""
+        if not -90 <= lat <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        row = math.floor((lat + 90) / self._cell_deg)
+        cell = row * self._columns + math.floor((lon + 180) / self._col_deg) % self._columns
+        with self._lock:
+            slot = self._slot.get(key)
+            if slot is None:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    self._grow(self._used + 1)
+                    slot = self._used
+                    self._used += 1
+                self._slot[key] = slot
+                self._keys[slot] = key
+                self._cells.setdefault(cell, []).append(slot)
+            elif self._cell[slot] != cell:
+                self._unlink(slot)
+                self._cells.setdefault(cell, []).append(slot)
+            self._lat[slot], self._lon[slot], self._cell[slot] = lat, lon, cell
+
+    move = insert
+
+    def insert_many(self, keys, lats, lons):
+        """Bulk insert; keys already indexed are moved"""
+        keys = list(keys)
+        lats = self._check_latitudes(lats)
+        lons = np.asarray(lons, dtype=float)
+        if not len(keys) == len(lats) == len(lons):
+            raise ValueError("keys, lats and lons must have the same length")
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate keys in bulk insert")
+
+        with self._lock:
+            existing = np.fromiter((key in self._slot for key in keys), dtype=bool, count=len(keys))
+            for i in np.flatnonzero(existing).tolist():
+                self.insert(keys[i], lats[i], lons[i])
+            new = np.flatnonzero(~existing)
+            if not len(new):
+                return
+
+            # New points reuse freed slots first and take the rest as one
+            # fresh block, then join their cells grouped by cell id
+            reused = [self._free.pop() for _ in range(min(len(self._free), len(new)))]
+            fresh = len(new) - len(reused)
+            self._grow(self._used + fresh)
+            slots = np.array(reused + list(range(self._used, self._used + fresh)), dtype=np.int64)
+            cells = self._cell_ids(lats[new], lons[new])
+            self._lat[slots], self._lon[slots], self._cell[slots] = lats[new], lons[new], cells
+            self._used += fresh
+            for i, slot in zip(new.tolist(), slots.tolist()):
+                self._keys[slot] = keys[i]
+                self._slot[keys[i]] = slot
+
+            order = np.argsort(cells, kind='stable')
+            unique, first = np.unique(cells[order], return_index=True)
+            bounds = np.append(first, len(order))
+            ordered_slots = slots[order].tolist()
+            for cell, a, b in zip(unique.tolist(), bounds[:-1].tolist(), bounds[1:].tolist()):
+                self._cells.setdefault(cell, []).extend(ordered_slots[a:b])
+
+    def _unlink(self, slot):
+        cell = int(self._cell[slot])
+        members = self._cells[cell]
+        members.remove(slot)
+        if not members:
+            del self._cells[cell]
+
+    def remove(self, key):
+        """Drop a point; raises KeyError if the key is not indexed"""
+        with self._lock:
+            slot = self._slot.pop(key)
+            self._unlink(slot)
+            self._keys[slot] = None
+            self._free.append(slot)
+
+    def clear(self):
+        with self._lock:
+            self._slot.clear()
+            self._cells.clear()
+            self._free.clear()
+            self._keys = [None] * len(self._keys)
+            self._used = 0
+
+    # -- queries -----------------------------------------------------------
+
+    def _candidates(self, lat, lon, radius_km):
+        """Slots in every cell overlapping the bounding box of the search cap"""
+        row_lo = math.floor((max(-90.0, lat - radius_km / KM_PER_DEGREE) + 90) / self._cell_deg)
+        row_hi = math.floor((min(90.0, lat + radius_km / KM_PER_DEGREE) + 90) / self._cell_deg)
+        angle = radius_km / EARTH_RADIUS_KM
+        polar = angle >= math.pi / 2 - math.radians(abs(lat))
+        if polar:
+            col_lo, col_hi = 0, self._columns - 1
+        else:
+            # Widest longitude extent of a spherical cap around (lat, lon)
+            dlon = math.degrees(math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat)))))
+            col_lo = math.floor((lon - dlon + 180) / self._col_deg)
+            col_hi = math.floor((lon + dlon + 180) / self._col_deg)
+            if col_hi - col_lo + 1 >= self._columns:
+                col_lo, col_hi = 0, self._columns - 1
+        n_rows, n_cols = row_hi - row_lo + 1, col_hi - col_lo + 1
+
+        cells = self._cells
+        if n_rows * n_cols > len(cells):
+            # Sparse index: filter the occupied cells instead of walking the box
+            slots = []
+            for cell, members in cells.items():
+                row, col = divmod(cell, self._columns)
+                if row_lo <= row <= row_hi and (col - col_lo) % self._columns < n_cols:
+                    slots.extend(members)
+            return slots
+
+        slots = []
+        for row in range(row_lo, row_hi + 1):
+            base = row * self._columns
+            for col in range(col_lo, col_hi + 1):
+                members = cells.get(base + col % self._columns)
+                if members:
+                    slots.extend(members)
+        return slots
+
+    def _measure(self, lat, lon, radius_km):
+        slots = np.array(self._candidates(lat, lon, radius_km), dtype=np.int64)
+        return slots, _haversine_to(lat, lon, self._lat[slots], self._lon[slots])
+
+    def within(self, lat, lon, radius_km):
+        """[(key, km)] of every point within `radius_km`, nearest first"""
+        with self._lock:
+            slots, km = self._measure(lat, lon, radius_km)
+            inside = km <= radius_km
+            slots, km = slots[inside], km[inside]
+            order = np.argsort(km, kind='stable')
+            return [(self._keys[s], float(d)) for s, d in zip(slots[order].tolist(), km[order].tolist())]
+
+    def nearest(self, lat, lon, k=1, max_km=None):
+        """
+        [(key, km)] of the `k` nearest points, nearest first, optionally
+        limited to `max_km`. The search radius starts at one cell and
+        doubles until k points fall inside it.
+        """
+        if k < 1:
+            return []
+        limit = min(max_km if max_km is not None else HALF_CIRCUMFERENCE_KM, HALF_CIRCUMFERENCE_KM)
+        radius = min(self.cell_km, limit)
+        with self._lock:
+            k = min(k, len(self._slot))
+            while True:
+                slots, km = self._measure(lat, lon, radius)
+                inside = km <= radius
+                if inside.sum() >= k or radius >= limit:
+                    break
+                radius = min(2 * radius, limit)
+            slots, km = slots[inside], km[inside]
+            if len(km) > k:
+                top = np.argpartition(km, k - 1)[:k]
+                slots, km = slots[top], km[top]
+            order = np.argsort(km, kind='stable')
+            return [(self._keys[s], float(d)) for s, d in zip(slots[order].tolist(), km[order].tolist())]
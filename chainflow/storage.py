@@ -0,0 +1,35 @@
+"""
+Shared on-disk storage helpers.
+
+ARTIFACT_DIR is the cache directory for fitted models, distance matrices,
+Pedersen tables and compiled circuits ($CHAINFLOW_MODEL_DIR, default
+``model_artifacts/`` in the repository). atomic_write is how every module
+writes a file that other threads or processes may be reading.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ARTIFACT_DIR = Path(os.environ.get('CHAINFLOW_MODEL_DIR', REPO_ROOT / 'model_artifacts'))
+
+def atomic_write(path, data):
+    """
+    Write `data` (bytes or str) to `path` through a temporary file in the
+    same directory and os.replace, so readers see the old file or the new
+    one, never a partial write. Creates missing parent directories. Raises
+    OSError on failure and leaves no temporary file behind.
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
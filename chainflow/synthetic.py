@@ -0,0 +1,255 @@
+"""
+Synthetic supply chain datasets for the ChainFlow ML models.
+
+Every generator takes an explicit ``np.random.Generator`` so results are
+reproducible without touching NumPy's global random state. The parallel
+builders spawn one independent stream per worker from a root
+``SeedSequence``, so a (seed, workers) pair always yields the same rows.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from chainflow.parallel import default_workers, process_pool, split_evenly
+
+# Parquet output is optional; fall back to one .npy file per column
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Supplier categories with different trust profiles: sampling weight and
+# (mean, std) of each normally distributed score
+TRUST_SUPPLIER_CATEGORIES = {
+    'Premium': {
+        'weight': 0.2,
+        'base_trust': (90, 5),
+        'delivery_performance': (95, 3),
+        'quality_score': (92, 4),
+        'compliance_score': (98, 2)
+    },
+    'Standard': {
+        'weight': 0.4,
+        'base_trust': (75, 8),
+        'delivery_performance': (85, 8),
+        'quality_score': (80, 10),
+        'compliance_score': (88, 6)
+    },
+    'Budget': {
+        'weight': 0.3,
+        'base_trust': (60, 12),
+        'delivery_performance': (70, 15),
+        'quality_score': (65, 15),
+        'compliance_score': (75, 10)
+    },
+    'New': {
+        'weight': 0.1,
+        'base_trust': (50, 15),
+        'delivery_performance': (60, 20),
+        'quality_score': (55, 20),
+        'compliance_score': (70, 15)
+    }
+}
+
+def _category_normal(rng, category_codes, field):
+    """Draw one normal sample per row using the mean/std of that row's category"""
+    params = np.array([c[field] for c in TRUST_SUPPLIER_CATEGORIES.values()], dtype=float)
+    return rng.normal(params[category_codes, 0], params[category_codes, 1])
+
+def generate_trust_scoring_frame(n_suppliers=500, rng=None, id_offset=0):
+    """
+    Generate the supplier trust scoring dataset column-wise.
+    
+    Categories are sampled in bulk and every score column is a single
+    vectorised draw, so generation cost is dominated by NumPy rather than
+    per-row Python overhead. ``id_offset`` shifts the SUP-xxx numbering so
+    independently generated blocks can be concatenated.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    names = list(TRUST_SUPPLIER_CATEGORIES)
+    weights = np.array([c['weight'] for c in TRUST_SUPPLIER_CATEGORIES.values()])
+    
+    category_codes = rng.choice(len(names), size=n_suppliers, p=weights / weights.sum())
+    
+    base_trust = _category_normal(rng, category_codes, 'base_trust')
+    delivery_performance = _category_normal(rng, category_codes, 'delivery_performance')
+    quality_score = _category_normal(rng, category_codes, 'quality_score')
+    compliance_score = _category_normal(rng, category_codes, 'compliance_score')
+    
+    supplier_numbers = np.arange(id_offset + 1, id_offset + n_suppliers + 1).astype(str)
+    
+    return pd.DataFrame({
+        'supplier_id': np.char.add('SUP-', np.char.zfill(supplier_numbers, 3)),
+        'category': pd.Categorical.from_codes(category_codes, categories=names),
+        'years_in_business': np.maximum(1, rng.poisson(8, n_suppliers)),
+        'total_transactions': np.maximum(10, rng.poisson(200, n_suppliers)),
+        'delivery_performance': np.clip(delivery_performance, 0, 100),
+        'quality_score': np.clip(quality_score, 0, 100),
+        'compliance_score': np.clip(compliance_score, 0, 100),
+        'financial_stability': rng.normal(75, 15, n_suppliers),
+        'certifications_count': rng.poisson(3, n_suppliers),
+        'trust_score': np.clip(base_trust, 0, 100)
+    })
+
+# Per-feature sampling distributions, as (Generator method, *args), for
+# legitimate and fraudulent transactions
+FRAUD_NORMAL_PROFILE = {
+    'transaction_amount': ('lognormal', 8, 1),
+    'delivery_time_hours': ('normal', 72, 12),
+    'supplier_trust_score': ('normal', 85, 10),
+    'route_deviation_km': ('exponential', 5),
+    'temperature_variance': ('normal', 2, 1),
+    'documentation_completeness': ('normal', 95, 5),
+    'payment_delay_hours': ('exponential', 2)
+}
+
+FRAUD_FRAUD_PROFILE = {
+    'transaction_amount': ('lognormal', 10, 2),
+    'delivery_time_hours': ('normal', 120, 30),
+    'supplier_trust_score': ('normal', 45, 15),
+    'route_deviation_km': ('exponential', 50),
+    'temperature_variance': ('normal', 8, 3),
+    'documentation_completeness': ('normal', 60, 20),
+    'payment_delay_hours': ('exponential', 24)
+}
+
+def _sample_profile(rng, profile, size):
+    """Draw `size` rows of every feature in a transaction profile"""
+    return {
+        column: getattr(rng, method)(*args, size=size)
+        for column, (method, *args) in profile.items()
+    }
+
+def generate_fraud_chunk(n_samples, rng, fraud_ratio=0.2):
+    """
+    Generate one shuffled block of fraud detection rows.
+    
+    Each block holds exactly int(n_samples * (1 - fraud_ratio)) legitimate
+    rows followed by the fraudulent remainder, then is permuted in place.
+    """
+    normal_samples = int(n_samples * (1 - fraud_ratio))
+    fraud_samples = n_samples - normal_samples
+    
+    normal_data = _sample_profile(rng, FRAUD_NORMAL_PROFILE, normal_samples)
+    fraud_data = _sample_profile(rng, FRAUD_FRAUD_PROFILE, fraud_samples)
+    
+    indices = rng.permutation(n_samples)
+    combined_data = {
+        column: np.concatenate([normal_data[column], fraud_data[column]])[indices]
+        for column in FRAUD_NORMAL_PROFILE
+    }
+    combined_data['is_fraud'] = np.concatenate([
+        np.zeros(normal_samples, dtype=np.int64),
+        np.ones(fraud_samples, dtype=np.int64)
+    ])[indices]
+    
+    return pd.DataFrame(combined_data)
+
+def iter_fraud_detection_chunks(n_samples, chunk_size=1_000_000, fraud_ratio=0.2, rng=None):
+    """Yield the fraud detection dataset as shuffled DataFrames of at most chunk_size rows"""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    rng = rng if rng is not None else np.random.default_rng()
+    
+    for start in range(0, n_samples, chunk_size):
+        yield generate_fraud_chunk(min(chunk_size, n_samples - start), rng, fraud_ratio)
+
+def write_fraud_detection_dataset(path, n_samples, chunk_size=1_000_000, fraud_ratio=0.2, rng=None):
+    """
+    Stream the fraud detection dataset to a columnar file on disk.
+    
+    Writes a Parquet file (one row group per chunk) when pyarrow is
+    installed, otherwise a directory holding one .npy file per column.
+    Only one chunk is ever held in memory. Returns the number of rows written.
+    """
+    chunks = iter_fraud_detection_chunks(n_samples, chunk_size, fraud_ratio, rng)
+    if PARQUET_AVAILABLE:
+        return _write_parquet(path, chunks)
+    return _write_npy_columns(path, chunks, n_samples)
+
+def _write_parquet(path, chunks):
+    """Append each chunk to a Parquet file as its own row group"""
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+def _write_npy_columns(path, chunks, n_samples):
+    """Fill preallocated memory-mapped .npy column files chunk by chunk"""
+    os.makedirs(path, exist_ok=True)
+    columns = None
+    rows = 0
+    for chunk in chunks:
+        if columns is None:
+            columns = {
+                name: np.lib.format.open_memmap(
+                    os.path.join(path, f"{name}.npy"), mode='w+', dtype=chunk[name].dtype, shape=(n_samples,)
+                )
+                for name in chunk.columns
+            }
+        for name, column in columns.items():
+            column[rows:rows + len(chunk)] = chunk[name].to_numpy()
+        rows += len(chunk)
+    for column in (columns or {}).values():
+        column.flush()
+    return rows
+
+def _fraud_block(args):
+    """Worker: build one contiguous block of the fraud dataset from its own seed stream"""
+    n_samples, seed_sequence, fraud_ratio, chunk_size = args
+    rng = np.random.default_rng(seed_sequence)
+    chunks = list(iter_fraud_detection_chunks(n_samples, chunk_size, fraud_ratio, rng))
+    return pd.concat(chunks, ignore_index=True) if chunks else generate_fraud_chunk(0, rng, fraud_ratio)
+
+def _trust_block(args):
+    """Worker: build one contiguous block of the supplier registry from its own seed stream"""
+    n_suppliers, seed_sequence, id_offset = args
+    return generate_trust_scoring_frame(n_suppliers, np.random.default_rng(seed_sequence), id_offset)
+
+def _run_blocks(worker, tasks, workers):
+    """Run block tasks in order, inline for a single worker or across a process pool"""
+    if workers == 1:
+        return [worker(task) for task in tasks]
+    with process_pool(workers) as pool:
+        return list(pool.map(worker, tasks))
+
+def generate_fraud_dataset_parallel(n_samples, seed=42, workers=None, fraud_ratio=0.2, chunk_size=1_000_000):
+    """
+    Build the fraud detection dataset across `workers` processes.
+    
+    Rows are split into one contiguous block per worker and each block is
+    drawn from its own child of SeedSequence(seed), so the output is
+    bit-identical for a given seed and worker count.
+    """
+    workers = workers or default_workers()
+    streams = np.random.SeedSequence(seed).spawn(workers)
+    tasks = [
+        (block_size, stream, fraud_ratio, chunk_size)
+        for block_size, stream in zip(split_evenly(n_samples, workers), streams)
+    ]
+    return pd.concat(_run_blocks(_fraud_block, tasks, workers), ignore_index=True)
+
+def generate_trust_dataset_parallel(n_suppliers, seed=123, workers=None):
+    """Build the supplier trust dataset across `workers` processes (see generate_fraud_dataset_parallel)"""
+    workers = workers or default_workers()
+    streams = np.random.SeedSequence(seed).spawn(workers)
+    block_sizes = split_evenly(n_suppliers, workers)
+    offsets = np.concatenate([[0], np.cumsum(block_sizes)[:-1]])
+    tasks = [
+        (block_size, stream, int(offset))
+        for block_size, stream, offset in zip(block_sizes, streams, offsets)
+    ]
+    return pd.concat(_run_blocks(_trust_block, tasks, workers), ignore_index=True)
@@ -0,0 +1,466 @@
+"""
+Last-mile vehicle routing with capacity and time windows (CVRPTW).
+
+Stops are points on a city plane (km) served from one depot by identical
+vans. Routes are built with the Clarke-Wright savings heuristic over each
+stop's nearest neighbours and then improved by local search: or-opt
+(moving segments of up to three stops within or across routes), 2-opt*
+(exchanging route tails) and intra-route 2-opt. Candidate moves are
+restricted to nearest neighbours, and capacity/time-window feasibility is
+checked from each route's forward earliest-start and backward
+latest-start times, so most checks are O(1). Times are minutes since
+midnight; a vehicle may wait for a window to open.
+"""
+
+import math
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+STOP_COLUMNS = ['x_km', 'y_km', 'weight_kg', 'ready_min', 'due_min', 'service_min']
+
+# Street distance relative to the straight line, van speed, payload and
+# diesel van emissions
+ROAD_FACTOR = 1.3
+CITY_SPEED_KMH = 25
+VAN_CAPACITY_KG = 800
+VAN_CO2_KG_PER_KM = 0.25
+
+# Delivery shift at the depot (08:00-20:00) and window lengths offered in
+# the delivery tab (None = any time during the shift)
+SHIFT = (8 * 60, 20 * 60)
+DELIVERY_WINDOWS = {"2-hour": 120, "4-hour": 240, "Same Day": None, "Next Day": None}
+
+# Share of the booked window a priority level may use (Critical must be
+# delivered in the first half of its window)
+PRIORITY_DEADLINE_FACTOR = {"Standard": 1.0, "High": 0.75, "Critical": 0.5}
+
+def delivery_window(window="Same Day", opens_at=SHIFT[0], priority="Standard"):
+    """(ready, due) minutes for a booked window and priority level, clipped to the shift"""
+    length = DELIVERY_WINDOWS[window]
+    if length is None:
+        opens_at, length = SHIFT[0], SHIFT[1] - SHIFT[0]
+    opens_at = min(max(opens_at, SHIFT[0]), SHIFT[1])
+    due = opens_at + length * PRIORITY_DEADLINE_FACTOR.get(priority, 1.0)
+    return opens_at, min(due, SHIFT[1])
+
+def synthetic_city_stops(n_stops, seed=0, radius_km=12.0, clusters=12):
+    """
+    A depot at the origin plus `n_stops` deliveries in neighbourhood
+    clusters around it, with parcel weights, booked windows, priority
+    levels and service times. Row 0 is the depot.
+    """
+    rng = np.random.default_rng(seed)
+    centres = rng.uniform(-radius_km, radius_km, size=(clusters, 2))
+    clustered = rng.random(n_stops) < 0.7
+    points = np.where(
+        clustered[:, None],
+        centres[rng.integers(0, clusters, n_stops)] + rng.normal(0, radius_km / 8, size=(n_stops, 2)),
+        rng.uniform(-radius_km, radius_km, size=(n_stops, 2))
+    )
+
+    windows = rng.choice(list(DELIVERY_WINDOWS)[:3], size=n_stops, p=[0.3, 0.3, 0.4])
+    priorities = rng.choice(list(PRIORITY_DEADLINE_FACTOR), size=n_stops, p=[0.7, 0.2, 0.1])
+    opens = rng.integers(SHIFT[0], SHIFT[1] - 240, n_stops)
+    ready, due = zip(*(delivery_window(w, o, p) for w, o, p in zip(windows, opens, priorities)))
+
+    stops = pd.DataFrame({
+        'x_km': np.concatenate([[0.0], points[:, 0]]),
+        'y_km': np.concatenate([[0.0], points[:, 1]]),
+        'weight_kg': np.concatenate([[0.0], np.round(rng.lognormal(1.2, 0.6, n_stops), 1)]),
+        'ready_min': np.concatenate([[SHIFT[0]], ready]).astype(float),
+        'due_min': np.concatenate([[SHIFT[1]], due]).astype(float),
+        'service_min': np.concatenate([[0.0], rng.uniform(2, 5, n_stops).round(1)]),
+        'priority': np.concatenate([["Depot"], priorities])
+    })
+    stops.index.name = 'stop'
+    return stops
+
+def nearest_neighbours(x, y, k, block=512):
+    """Indices of the `k` nearest other points of every point, computed in row blocks"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    k = min(k, n - 1)
+    result = np.empty((n, max(k, 0)), dtype=np.int64)
+    if k <= 0:
+        return result
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        d2 = (x[start:stop, None] - x[None, :]) ** 2 + (y[start:stop, None] - y[None, :]) ** 2
+        d2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        candidates = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(d2, candidates, axis=1).argsort(axis=1)
+        result[start:stop] = np.take_along_axis(candidates, order, axis=1)
+    return result
+
+class _Solver:
+    """Route state and moves; node 0 is the depot, 1..n-1 are stops"""
+
+    def __init__(self, stops, capacity, speed_kmh, neighbours):
+        self.x = stops['x_km'].astype(float).tolist()
+        self.y = stops['y_km'].astype(float).tolist()
+        self.demand = stops['weight_kg'].astype(float).tolist()
+        self.ready = stops['ready_min'].astype(float).tolist()
+        self.due = stops['due_min'].astype(float).tolist()
+        self.service = stops['service_min'].astype(float).tolist()
+        self.service[0] = 0.0
+        self.capacity = capacity
+        self.minutes_per_km = 60.0 / speed_kmh
+        self.n = len(self.x)
+
+        # Candidate lists hold stops only (depot excluded), as node indices
+        near = nearest_neighbours(self.x[1:], self.y[1:], neighbours) + 1
+        self.neighbours = [[]] + near.tolist()
+
+        self.routes = []
+        self.route_of = [-1] * self.n
+        self.pos = [-1] * self.n
+        self.starts = []
+        self.latest = []
+        self.prefix_load = []
+
+    def dist(self, i, j):
+        return math.hypot(self.x[i] - self.x[j], self.y[i] - self.y[j]) * ROAD_FACTOR
+
+    def travel(self, i, j):
+        return self.dist(i, j) * self.minutes_per_km
+
+    # -- construction ------------------------------------------------------
+
+    def servable(self, c):
+        """A stop is servable if a dedicated van can meet its window and capacity"""
+        start = max(self.ready[c], self.ready[0] + self.travel(0, c))
+        return (self.demand[c] <= self.capacity and start <= self.due[c]
+                and start + self.service[c] + self.travel(c, 0) <= self.due[0])
+
+    def savings(self, served):
+        """Clarke-Wright parallel savings over nearest-neighbour pairs"""
+        ready, due, service, travel = self.ready, self.due, self.service, self.travel
+        members = {c: [c] for c in served}
+        route_id = {c: c for c in served}
+        load = {c: self.demand[c] for c in served}
+        es_tail = {c: max(ready[c], ready[0] + travel(0, c)) for c in served}
+        ls_head = {c: min(due[c], due[0] - service[c] - travel(c, 0)) for c in served}
+
+        served_mask = np.zeros(self.n, dtype=bool)
+        served_mask[served] = True
+        i = np.repeat(np.arange(self.n), [len(nbrs) for nbrs in self.neighbours])
+        j = np.concatenate([np.asarray(nbrs, dtype=np.int64) for nbrs in self.neighbours])
+        keep = served_mask[i] & served_mask[j]
+        i, j = i[keep], j[keep]
+        xs, ys = np.asarray(self.x), np.asarray(self.y)
+        saving = (np.hypot(xs[i] - xs[0], ys[i] - ys[0]) + np.hypot(xs[j] - xs[0], ys[j] - ys[0])
+                  - np.hypot(xs[i] - xs[j], ys[i] - ys[j]))
+        order = np.argsort(-saving, kind='stable')
+        order = order[saving[order] > 0]
+
+        def merge(a, b):
+            """Append route b to route a if capacity and time windows allow"""
+            tail, head = members[a][-1], members[b][0]
+            if load[a] + load[b] > self.capacity:
+                return False
+            t = max(ready[head], es_tail[a] + service[tail] + travel(tail, head))
+            if t > ls_head[b]:
+                return False
+            prev = head
+            for c in members[b][1:]:
+                t = max(ready[c], t + service[prev] + travel(prev, c))
+                prev = c
+            limit, nxt = ls_head[b], head
+            for c in reversed(members[a]):
+                limit = min(due[c], limit - service[c] - travel(c, nxt))
+                nxt = c
+            es_tail[a], ls_head[a] = t, limit
+            load[a] += load[b]
+            for c in members[b]:
+                route_id[c] = a
+            members[a].extend(members.pop(b))
+            return True
+
+        for k in order.tolist():
+            a, b = int(i[k]), int(j[k])
+            ra, rb = route_id[a], route_id[b]
+            if ra == rb:
+                continue
+            if members[ra][-1] == a and members[rb][0] == b:
+                merge(ra, rb)
+            elif members[rb][-1] == b and members[ra][0] == a:
+                merge(rb, ra)
+
+        for route in members.values():
+            self.routes.append(route)
+            self.refresh(len(self.routes) - 1)
+
+    # -- route bookkeeping -------------------------------------------------
+
+    def refresh(self, r):
+        """Recompute schedule, latest starts, prefix loads and positions of route r"""
+        route = self.routes[r]
+        ready, due, service, travel = self.ready, self.due, self.service, self.travel
+        starts, prefix = [], []
+        t, prev, load = ready[0], 0, 0.0
+        for p, c in enumerate(route):
+            t = max(ready[c], t + service[prev] + travel(prev, c))
+            starts.append(t)
+            load += self.demand[c]
+            prefix.append(load)
+            self.route_of[c] = r
+            self.pos[c] = p
+            prev = c
+        latest = [0.0] * len(route)
+        limit, nxt = due[0], 0
+        for p in range(len(route) - 1, -1, -1):
+            c = route[p]
+            limit = min(due[c], limit - service[c] - travel(c, nxt))
+            latest[p] = limit
+            nxt = c
+        if r == len(self.starts):
+            self.starts.append(starts)
+            self.latest.append(latest)
+            self.prefix_load.append(prefix)
+        else:
+            self.starts[r], self.latest[r], self.prefix_load[r] = starts, latest, prefix
+
+    def feasible(self, route):
+        """Full O(len) capacity and time-window check of a candidate route"""
+        t, prev, load = self.ready[0], 0, 0.0
+        for c in route:
+            t = max(self.ready[c], t + self.service[prev] + self.travel(prev, c))
+            if t > self.due[c]:
+                return False
+            load += self.demand[c]
+            prev = c
+        return load <= self.capacity and t + self.service[prev] + self.travel(prev, 0) <= self.due[0]
+
+    def reaches(self, u, t_u, r, p):
+        """Can a van serving node u at time t_u continue with route r from position p?"""
+        route = self.routes[r]
+        if p == len(route):
+            return t_u + self.service[u] + self.travel(u, 0) <= self.due[0]
+        v = route[p]
+        return max(self.ready[v], t_u + self.service[u] + self.travel(u, v)) <= self.latest[r][p]
+
+    def start_at(self, r, p):
+        return self.starts[r][p] if p >= 0 else self.ready[0]
+
+    # -- moves -------------------------------------------------------------
+
+    def try_or_opt(self, c):
+        """
+        Move a segment of 1-3 stops starting at c next to a neighbour of one
+        of its ends. Returns the stops around the changed edges, or None.
+        """
+        ra, pa = self.route_of[c], self.pos[c]
+        route_a = self.routes[ra]
+        x, y, hypot = self.x, self.y, math.hypot
+        routes, route_of, pos = self.routes, self.route_of, self.pos
+        for length in (1, 2, 3):
+            if pa + length > len(route_a):
+                break
+            segment = route_a[pa:pa + length]
+            first, last = segment[0], segment[-1]
+            before = route_a[pa - 1] if pa > 0 else 0
+            after = route_a[pa + length] if pa + length < len(route_a) else 0
+            removal_gain = (hypot(x[before] - x[first], y[before] - y[first])
+                            + hypot(x[last] - x[after], y[last] - y[after])
+                            - hypot(x[before] - x[after], y[before] - y[after]))
+            if removal_gain <= 1e-9:
+                continue
+            seg_load = sum(self.demand[s] for s in segment)
+
+            # Insertion points right after a neighbour of `first` or right
+            # before a neighbour of `last`, as (route, position)
+            candidates = [(route_of[n], pos[n] + 1) for n in self.neighbours[first]]
+            candidates += [(route_of[n], pos[n]) for n in self.neighbours[last]]
+            for rb, q in candidates:
+                if rb < 0 or (rb == ra and pa <= q <= pa + length):
+                    continue
+                route_b = routes[rb]
+                u = route_b[q - 1] if q > 0 else 0
+                v = route_b[q] if q < len(route_b) else 0
+                insertion_cost = (hypot(x[u] - x[first], y[u] - y[first]) + hypot(x[last] - x[v], y[last] - y[v])
+                                  - hypot(x[u] - x[v], y[u] - y[v]))
+                if removal_gain - insertion_cost <= 1e-9:
+                    continue
+                if rb == ra:
+                    rest = route_a[:pa] + route_a[pa + length:]
+                    insert_at = q if q < pa else q - length
+                    candidate = rest[:insert_at] + segment + rest[insert_at:]
+                    if not self.feasible(candidate):
+                        continue
+                    routes[ra] = candidate
+                    self.refresh(ra)
+                    return (before, after, u, v, *segment)
+                if self.prefix_load[rb][-1] + seg_load > self.capacity:
+                    continue
+                t, prev = self.start_at(rb, q - 1), u
+                for s in segment:
+                    t = max(self.ready[s], t + self.service[prev] + self.travel(prev, s))
+                    if t > self.due[s]:
+                        break
+                    prev = s
+                else:
+                    if self.reaches(last, t, rb, q):
+                        routes[rb] = route_b[:q] + segment + route_b[q:]
+                        routes[ra] = route_a[:pa] + route_a[pa + length:]
+                        self.refresh(ra)
+                        self.refresh(rb)
+                        return (before, after, u, v, *segment)
+        return None
+
+    def try_two_opt_star(self, i):
+        """Exchange route tails so that i is followed by a neighbour j from another route"""
+        ra, pi = self.route_of[i], self.pos[i]
+        route_a = self.routes[ra]
+        succ_a = route_a[pi + 1] if pi + 1 < len(route_a) else 0
+        x, y, hypot = self.x, self.y, math.hypot
+        base = hypot(x[i] - x[succ_a], y[i] - y[succ_a])
+        for j in self.neighbours[i]:
+            rb, pj = self.route_of[j], self.pos[j]
+            if rb < 0 or rb == ra:
+                continue
+            route_b = self.routes[rb]
+            pred_b = route_b[pj - 1] if pj > 0 else 0
+            gain = (base + hypot(x[pred_b] - x[j], y[pred_b] - y[j])
+                    - hypot(x[i] - x[j], y[i] - y[j]) - hypot(x[pred_b] - x[succ_a], y[pred_b] - y[succ_a]))
+            if gain <= 1e-9:
+                continue
+
+            load_a, load_b = self.prefix_load[ra], self.prefix_load[rb]
+            head_b = load_b[pj - 1] if pj > 0 else 0.0
+            if load_a[pi] + load_b[-1] - head_b > self.capacity or head_b + load_a[-1] - load_a[pi] > self.capacity:
+                continue
+            if not self.reaches(i, self.starts[ra][pi], rb, pj):
+                continue
+            if not self.reaches(pred_b, self.start_at(rb, pj - 1), ra, pi + 1):
+                continue
+
+            self.routes[ra] = route_a[:pi + 1] + route_b[pj:]
+            self.routes[rb] = route_b[:pj] + route_a[pi + 1:]
+            self.refresh(ra)
+            self.refresh(rb)
+            return (i, j, succ_a, pred_b)
+        return None
+
+    def try_two_opt(self, i):
+        """Reverse the stretch after i so that i is followed by a neighbour j later in its route"""
+        ra, pi = self.route_of[i], self.pos[i]
+        route = self.routes[ra]
+        succ = route[pi + 1] if pi + 1 < len(route) else 0
+        x, y, hypot = self.x, self.y, math.hypot
+        for j in self.neighbours[i]:
+            pj = self.pos[j]
+            if self.route_of[j] != ra or pj <= pi + 1:
+                continue
+            after = route[pj + 1] if pj + 1 < len(route) else 0
+            gain = (hypot(x[i] - x[succ], y[i] - y[succ]) + hypot(x[j] - x[after], y[j] - y[after])
+                    - hypot(x[i] - x[j], y[i] - y[j]) - hypot(x[succ] - x[after], y[succ] - y[after]))
+            if gain <= 1e-9:
+                continue
+            candidate = route[:pi + 1] + route[pi + 1:pj + 1][::-1] + route[pj + 1:]
+            if self.feasible(candidate):
+                self.routes[ra] = candidate
+                self.refresh(ra)
+                return (i, j, succ, after)
+        return None
+
+    def improve(self, deadline):
+        """
+        First-improvement local search with don't-look bits: after a move
+        only the stops on the changed routes are re-examined (their time
+        slack changed), until none improves or the deadline passes.
+        """
+        queue = deque(c for c in range(1, self.n) if self.route_of[c] >= 0)
+        queued = [False] * self.n
+        for c in queue:
+            queued[c] = True
+
+        steps = 0
+        while queue:
+            steps += 1
+            if steps % 256 == 0 and time.perf_counter() > deadline:
+                return
+            c = queue.popleft()
+            queued[c] = False
+            touched = self.try_two_opt_star(c) or self.try_or_opt(c) or self.try_two_opt(c)
+            if touched:
+                for r in {self.route_of[t] for t in touched if t}:
+                    for t in self.routes[r]:
+                        if not queued[t]:
+                            queued[t] = True
+                            queue.append(t)
+
+    def total_distance(self):
+        total = 0.0
+        for route in self.routes:
+            prev = 0
+            for c in route + [0]:
+                total += self.dist(prev, c)
+                prev = c
+        return total
+
+def solve_vrptw(stops, capacity_kg=VAN_CAPACITY_KG, speed_kmh=CITY_SPEED_KMH, neighbours=20, time_limit=5.0,
+                local_search=True):
+    """
+    Plan delivery routes for a stop table (row 0 is the depot; columns
+    STOP_COLUMNS, any index) with vans of `capacity_kg`.
+
+    Local search stops after `time_limit` seconds. Returns a dict with the
+    routes (lists of stop labels), a per-stop schedule DataFrame (vehicle,
+    sequence, arrival/start/departure minutes, load on board), unserved
+    stops (no van could meet their window or weight), the total distance,
+    the distance after construction only, an out-and-back baseline
+    distance, vehicles used, summed route duration and solve time.
+    """
+    missing = [column for column in STOP_COLUMNS if column not in stops]
+    if missing:
+        raise ValueError(f"Stop table is missing columns: {', '.join(missing)}")
+    started = time.perf_counter()
+    solver = _Solver(stops, capacity_kg, speed_kmh, neighbours)
+
+    served = [c for c in range(1, solver.n) if solver.servable(c)]
+    solver.savings(served)
+    construction_km = solver.total_distance()
+    if local_search:
+        solver.improve(started + time_limit)
+
+    labels = stops.index
+    routes = [route for route in solver.routes if route]
+    rows = []
+    duration = 0.0
+    for vehicle, route in enumerate(routes, start=1):
+        t, prev, on_board = solver.ready[0], 0, sum(solver.demand[c] for c in route)
+        for sequence, c in enumerate(route, start=1):
+            arrival = t + solver.service[prev] + solver.travel(prev, c)
+            t = max(solver.ready[c], arrival)
+            rows.append({
+                'stop': labels[c], 'vehicle': vehicle, 'sequence': sequence,
+                'arrival_min': round(arrival, 1), 'start_min': round(t, 1),
+                'departure_min': round(t + solver.service[c], 1), 'load_kg': round(on_board, 1)
+            })
+            on_board -= solver.demand[c]
+            prev = c
+        duration += t + solver.service[prev] + solver.travel(prev, 0) - solver.ready[0]
+
+    schedule = pd.DataFrame(rows, columns=[
+        'stop', 'vehicle', 'sequence', 'arrival_min', 'start_min', 'departure_min', 'load_kg'
+    ]).set_index('stop')
+    return {
+        'routes': [[labels[c] for c in route] for route in routes],
+        'schedule': schedule,
+        'unserved': [labels[c] for c in range(1, solver.n) if solver.route_of[c] < 0],
+        'distance_km': solver.total_distance(),
+        'construction_km': construction_km,
+        'baseline_km': sum(2 * solver.dist(0, c) for c in served),
+        'vehicles': len(routes),
+        'duration_min': duration,
+        'seconds': time.perf_counter() - started
+    }
+
+def format_clock(minutes):
+    """Minutes since midnight as HH:MM"""
+    minutes = int(round(minutes))
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
@@ -0,0 +1,210 @@
+"""
+Batch circuit inputs (Prover.toml witnesses) for ``src/main.nr``.
+
+Every product in ``database/products.json`` is joined to its supplier and
+to the distributor and retailer registries, and mapped to the circuit's
+Field inputs in declaration order. Catalogue values go through
+chainflow.fields.to_field, and ``expected_product_hash`` is computed the way
+the circuit does (a Field sum). The two registry roots are Merkle roots
+built once per catalogue. Witnesses are produced lazily so a whole catalogue
+can be streamed to one Prover.toml per product without holding it in
+memory, or packed into a single JSONL file.
+"""
+
+import json
+from pathlib import Path
+
+from chainflow.fields import BN254_MODULUS, to_field
+from chainflow.merkle import MerkleTree, SupplierRegistryTree, sha256_leaf
+from chainflow.proof_cache import circuit_version
+from chainflow.storage import atomic_write
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CATALOG_PATH = REPO_ROOT / "database" / "products.json"
+
+# main.nr parameters in declaration order; the last five are public
+CIRCUIT_INPUTS = [
+    "product_id", "product_category", "batch_number", "manufacturing_date",
+    "supplier_id", "supplier_tier", "supplier_certification_hash",
+    "origin_location", "intermediate_locations", "final_destination",
+    "manufacturer_signature", "distributor_signature",
+    "proof_version", "circuit_id",
+    "expected_product_hash", "trusted_supplier_root", "supply_chain_root", "verification_timestamp",
+    "zkverify_chain_id",
+]
+PUBLIC_INPUTS = CIRCUIT_INPUTS[-5:]
+N_INTERMEDIATE_LOCATIONS = 5
+PROOF_VERSION = 1
+ZKVERIFY_CHAIN_ID = 1
+REGISTRY_DEPTH = 20
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def location_registry_root(catalog, depth=REGISTRY_DEPTH):
+    """Merkle root over every registered supplier, distributor and retailer location ID"""
+    ids = sorted({str(i) for key in ("suppliers", "distributors", "retailers") for i in catalog.get(key, {})})
+    tree = MerkleTree(depth)
+    tree.extend(sha256_leaf(to_field(i)) for i in ids)
+    return int.from_bytes(tree.root, "big")
+
+class WitnessBuilder:
+    """
+    Maps catalogue products to main.nr inputs.
+
+    Registry roots are computed once at construction; pass ``supplier_tree``
+    to reuse a maintained SupplierRegistryTree (e.g. one built with the
+    circuit's hash). ``verification_timestamp`` defaults per product to its
+    zk_verification timestamp, falling back to the manufacturing date.
+    Products whose supplier, origin, distributors or retailer are not registered
+    are still mapped (unknown supplier fields become 0); ``missing_links``
+    lists them so callers can decide.
+
+    ``expected_product_hash`` is derived, not read from the catalogue: it
+    is the same Field sum of product_id, product_category, batch_number and
+    manufacturing_date that main.nr checks, so the circuit's product_hash
+    assertion always holds for builder output. The catalogue's own
+    ``product_hash`` values (e.g. ``0xhipaa...``) are not field elements
+    and cannot be used.
+    """
+
+    def __init__(self, catalog, supplier_tree=None, circuit_id=None, proof_version=PROOF_VERSION,
+                 zkverify_chain_id=ZKVERIFY_CHAIN_ID, verification_timestamp=None):
+        self.catalog = catalog
+        self.suppliers = catalog.get("suppliers", {})
+        self.distributors = catalog.get("distributors", {})
+        self.retailers = catalog.get("retailers", {})
+        if supplier_tree is None:
+            supplier_tree = SupplierRegistryTree(self.suppliers, REGISTRY_DEPTH)
+        self.trusted_supplier_root = int.from_bytes(supplier_tree.root, "big")
+        self.supply_chain_root = location_registry_root(catalog)
+        self.circuit_id = to_field(circuit_id if circuit_id is not None else "0x" + circuit_version(REPO_ROOT))
+        self.proof_version = to_field(proof_version)
+        self.zkverify_chain_id = to_field(zkverify_chain_id)
+        self.verification_timestamp = verification_timestamp
+        # Supplier fields depend only on the supplier, so convert each once
+        self._supplier_fields = {
+            str(supplier_id): (to_field(supplier_id), to_field(s.get("tier")), to_field(s.get("certification_hash")))
+            for supplier_id, s in self.suppliers.items()
+        }
+
+    def build(self, product_id, product):
+        """{input name: field element (int), or a list for intermediate_locations}"""
+        pid = to_field(product_id)
+        category = to_field(product.get("category"))
+        batch = to_field(product.get("batch_number"))
+        manufactured = to_field(product.get("manufacturing_date"))
+        supplier_key = str(product.get("supplier_id"))
+        supplier_id, tier, certification = self._supplier_fields.get(supplier_key, (to_field(supplier_key), 0, 0))
+
+        chain = product.get("supply_chain", {})
+        intermediates = [to_field(i) for i in chain.get("intermediates", [])[:N_INTERMEDIATE_LOCATIONS]]
+        intermediates += [0] * (N_INTERMEDIATE_LOCATIONS - len(intermediates))
+        signatures = product.get("signatures", {})
+
+        timestamp = self.verification_timestamp
+        if timestamp is None:
+            timestamp = product.get("zk_verification", {}).get("timestamp", product.get("manufacturing_date"))
+
+        return {
+            "product_id": pid,
+            "product_category": category,
+            "batch_number": batch,
+            "manufacturing_date": manufactured,
+            "supplier_id": supplier_id,
+            "supplier_tier": tier,
+            "supplier_certification_hash": certification,
+            "origin_location": to_field(chain.get("origin")),
+            "intermediate_locations": intermediates,
+            "final_destination": to_field(chain.get("destination")),
+            "manufacturer_signature": to_field(signatures.get("manufacturer")),
+            "distributor_signature": to_field(signatures.get("distributor")),
+            "proof_version": self.proof_version,
+            "circuit_id": self.circuit_id,
+            "expected_product_hash": (pid + category + batch + manufactured) % BN254_MODULUS,
+            "trusted_supplier_root": self.trusted_supplier_root,
+            "supply_chain_root": self.supply_chain_root,
+            "verification_timestamp": to_field(timestamp),
+            "zkverify_chain_id": self.zkverify_chain_id,
+        }
+
+    def missing_links(self, product):
+        """
+        Registry joins that fail for a product, e.g. ['supplier 1009',
+        'retailer 3007']. IDs are compared as strings, as DependencyMap
+        links them; the origin is a supplier location.
+        """
+        missing = []
+        if str(product.get("supplier_id")) not in self.suppliers:
+            missing.append(f"supplier {product.get('supplier_id')}")
+        chain = product.get("supply_chain", {})
+        origin = chain.get("origin")
+        if origin is not None and str(origin) not in self.suppliers:
+            missing.append(f"origin {origin}")
+        for location in chain.get("intermediates", []):
+            if location and str(location) not in self.distributors:
+                missing.append(f"distributor {location}")
+        destination = chain.get("destination")
+        if destination is not None and str(destination) not in self.retailers:
+            missing.append(f"retailer {destination}")
+        return missing
+
+    def witnesses(self, products=None):
+        """Lazily yield (product_id, inputs) for `products` (default: the whole catalogue)"""
+        products = self.catalog.get("products", {}) if products is None else products
+        for product_id, product in products.items():
+            yield product_id, self.build(product_id, product)
+
+def format_prover_toml(inputs, order=CIRCUIT_INPUTS):
+    """
+    Prover.toml text with values as quoted strings (decimal for field
+    elements). Names listed in `order` come first, in that order; any other
+    inputs follow in their dict order, so inputs of other circuits format too.
+    """
+    names = [name for name in order if name in inputs]
+    names += [name for name in inputs if name not in set(order)]
+    lines = []
+    for name in names:
+        value = inputs[name]
+        if isinstance(value, (list, tuple)):
+            items = ", ".join(f'"{v}"' for v in value)
+            lines.append(f"{name} = [{items}]")
+        else:
+            lines.append(f'{name} = "{value}"')
+    return "\n".join(lines) + "\n"
+
+def write_prover_tomls(witnesses, directory):
+    """Write <directory>/<product_id>/Prover.toml for each witness; returns the count"""
+    directory = Path(directory)
+    count = 0
+    for product_id, inputs in witnesses:
+        product_dir = directory / str(product_id)
+        product_dir.mkdir(parents=True, exist_ok=True)
+        with open(product_dir / "Prover.toml", "w", encoding="utf-8") as f:
+            f.write(format_prover_toml(inputs))
+        count += 1
+    return count
+
+def write_packed(witnesses, path):
+    """
+    Write every witness to one JSONL file, a {"product_id", "inputs"} object
+    per line with field elements as decimal strings. Written with
+    atomic_write, so readers never see a partial catalogue.
+    """
+    lines = []
+    for product_id, inputs in witnesses:
+        encoded = {name: [str(v) for v in value] if isinstance(value, list) else str(value)
+                   for name, value in inputs.items()}
+        lines.append(json.dumps({"product_id": product_id, "inputs": encoded}, separators=(",", ":")) + "\n")
+    atomic_write(path, "".join(lines))
+    return len(lines)
+
+def read_packed(path):
+    """Yield (product_id, inputs) back from a write_packed file"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            inputs = {name: [int(v) for v in value] if isinstance(value, list) else int(value)
+                      for name, value in record["inputs"].items()}
+            yield record["product_id"], inputs
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chainflow.assignment import assign_packages, clearance_mask, min_cost_assignment
+
+linear_sum_assignment = pytest.importorskip("scipy.optimize").linear_sum_assignment
+
+
+def reference(cost, feasible, capacity):
+    """(rows served, total cost) from scipy over one column per slot plus a dummy per row"""
+    n = cost.shape[0]
+    slots = np.repeat(np.arange(cost.shape[1]), capacity)
+    expanded = np.where(feasible, cost, 1e9)[:, slots]
+    expanded = np.hstack([expanded, np.full((n, n), 1e6)])
+    rows, columns = linear_sum_assignment(expanded)
+    served = columns < len(slots)
+    return int(served.sum()), expanded[rows[served], columns[served]].sum()
+
+
+def check(cost, feasible, capacity, columns):
+    assert len(columns) == cost.shape[0]
+    served = columns >= 0
+    assert feasible[np.flatnonzero(served), columns[served]].all()
+    assert (np.bincount(columns[served], minlength=cost.shape[1]) <= capacity).all()
+    return int(served.sum()), cost[np.flatnonzero(served), columns[served]].sum()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_min_cost_assignment_matches_scipy(seed):
+    rng = np.random.default_rng(seed)
+    n, m = rng.integers(1, 30), rng.integers(1, 12)
+    cost = rng.uniform(0, 100, size=(n, m))
+    feasible = rng.random((n, m)) < rng.choice([1.0, 0.5, 0.15])
+    capacity = rng.integers(1, 4, size=m)
+    columns = min_cost_assignment(cost, feasible, capacity)
+    served, total = check(cost, feasible, capacity, columns)
+    expected_served, expected_total = reference(cost, feasible, capacity)
+    assert served == expected_served
+    assert total == pytest.approx(expected_total)
+
+
+def test_square_assignment_matches_scipy():
+    cost = np.random.default_rng(1).uniform(0, 1, size=(60, 60))
+    columns = min_cost_assignment(cost)
+    rows, expected = linear_sum_assignment(cost)
+    assert cost[np.arange(60), columns].sum() == pytest.approx(cost[rows, expected].sum())
+
+
+def test_assign_packages_respects_clearance_and_capacity():
+    drivers = pd.DataFrame({
+        'driver_id': ["D1", "D2"], 'lat': [51.5, 51.6], 'lon': [-0.1, -0.2],
+        'clearance': ["Standard", "Military-Grade"], 'capacity': [2, 1]
+    })
+    packages = pd.DataFrame({
+        'package_id': ["P1", "P2", "P3", "P4"], 'lat': [51.5, 51.6, 51.55, 51.5], 'lon': [-0.1, -0.2, -0.15, -0.1],
+        'clearance': ["Military-Grade", "Enhanced", "Standard", "Standard"]
+    })
+    assignments, summary = assign_packages(drivers, packages)
+    assert (summary['assigned'], summary['unassigned']) == (3, 1)
+    allowed = clearance_mask(packages['clearance'], drivers['clearance'])
+    column = {driver: i for i, driver in enumerate(drivers['driver_id'])}
+    for row, driver in enumerate(assignments['driver_id']):
+        if pd.notna(driver):
+            assert allowed[row, column[driver]]
+    assert assignments['driver_id'].value_counts().to_dict() == {"D1": 2, "D2": 1}
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from chainflow.cache import RouteCache
+
+
+class Rerun(BaseException):
+    """Stands in for Streamlit's RerunException/StopException"""
+
+
+def run_concurrently(cache, key, leader_compute, follower_compute):
+    started, release = threading.Event(), threading.Event()
+    outcome = {}
+
+    def leader():
+        def compute():
+            started.set()
+            release.wait()
+            return leader_compute()
+        try:
+            outcome['leader'] = cache.get_or_compute(key, compute)
+        except BaseException as e:
+            outcome['leader'] = e
+
+    def follower():
+        started.wait()
+        try:
+            outcome['follower'] = cache.get_or_compute(key, follower_compute)
+        except BaseException as e:
+            outcome['follower'] = e
+
+    threads = [threading.Thread(target=leader), threading.Thread(target=follower)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    while cache.stats()['coalesced'] < 1:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return outcome
+
+
+def test_waiters_share_the_leaders_exception():
+    def fail():
+        raise ValueError("boom")
+    outcome = run_concurrently(RouteCache(), "k", fail, lambda: "unused")
+    assert isinstance(outcome['leader'], ValueError)
+    assert outcome['follower'] is outcome['leader']
+
+
+def test_waiters_recompute_after_a_leader_base_exception():
+    def rerun():
+        raise Rerun()
+    cache = RouteCache()
+    outcome = run_concurrently(cache, "k", rerun, lambda: "follower value")
+    assert isinstance(outcome['leader'], Rerun)
+    assert outcome['follower'] == "follower value"
+    assert cache.get_or_compute("k", lambda: pytest.fail("should be cached")) == "follower value"
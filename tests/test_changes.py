@@ -0,0 +1,53 @@
+import copy
+import json
+
+import pytest
+
+from chainflow.changes import ProofManifest
+from chainflow.witness import CATALOG_PATH
+
+
+@pytest.fixture
+def catalog():
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def manifest(catalog, tmp_path):
+    manifest = ProofManifest(tmp_path / "manifest.json")
+    plan = manifest.plan(catalog)
+    assert set(plan.to_prove) == set(catalog["products"])
+    manifest.commit(plan)
+    return manifest
+
+
+def test_unchanged_catalogue_requeues_nothing(catalog, manifest):
+    plan = manifest.plan(catalog)
+    assert len(plan) == 0 and plan.refreshed == [] and not plan.roots_changed
+
+
+def test_supplier_rename_requeues_nothing(catalog, manifest):
+    edited = copy.deepcopy(catalog)
+    edited["suppliers"]["1003"]["name"] = "Renamed Supplier"
+    plan = manifest.plan(edited)
+    assert len(plan) == 0
+    assert sorted(plan.refreshed) == ["P005", "P006", "P008"]
+    assert plan.changed_records["suppliers"] == (set(), {"1003"}, set())
+
+
+def test_supplier_tier_change_requeues_only_its_products(catalog, manifest):
+    edited = copy.deepcopy(catalog)
+    edited["suppliers"]["1001"]["tier"] = 3
+    plan = manifest.plan(edited)
+    assert sorted(plan.to_prove) == ["P001", "P003"]
+    assert plan.roots_changed
+    assert all(plan.to_prove[p]["supplier_tier"] == 3 for p in plan.to_prove)
+
+
+def test_unproven_products_stay_pending(catalog, manifest, tmp_path):
+    edited = copy.deepcopy(catalog)
+    edited["suppliers"]["1001"]["tier"] = 3
+    manifest.commit(manifest.plan(edited), proven=["P001"])
+    reloaded = ProofManifest(tmp_path / "manifest.json")
+    assert list(reloaded.plan(edited).to_prove) == ["P003"]
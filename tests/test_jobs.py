@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from chainflow.jobs import CANCELLED, DONE, FAILED, JobCancelled, ProofJobQueue
+
+
+class Rerun(BaseException):
+    """Stands in for Streamlit's RerunException/StopException"""
+
+
+def raise_(error):
+    raise error
+
+
+@pytest.mark.parametrize("error", [Rerun(), SystemExit(1), KeyboardInterrupt()])
+def test_base_exception_cancels_the_job_and_keeps_the_worker(error):
+    queue = ProofJobQueue(workers=1)
+    try:
+        interrupted = queue.submit(raise_, error)
+        following = queue.submit(lambda: 42)
+        with pytest.raises(JobCancelled):
+            queue.result(interrupted, timeout=5)
+        assert queue.result(following, timeout=5) == 42
+        assert queue.status(interrupted)['state'] == CANCELLED
+        assert queue.status(interrupted)['error'] == repr(error)
+        assert queue.status(following)['state'] == DONE
+        stats = queue.stats()
+        assert (stats['running'], stats['cancelled'], stats['completed']) == (0, 1, 1)
+    finally:
+        queue.shutdown()
+
+
+def test_exception_fails_the_job():
+    queue = ProofJobQueue(workers=1)
+    try:
+        job_id = queue.submit(raise_, ValueError("bad witness"))
+        with pytest.raises(ValueError, match="bad witness"):
+            queue.result(job_id, timeout=5)
+        assert queue.status(job_id)['state'] == FAILED
+        assert queue.result(queue.submit(lambda: "ok"), timeout=5) == "ok"
+    finally:
+        queue.shutdown()
+
+
+def test_priority_order():
+    queue = ProofJobQueue(workers=1)
+    order = []
+    try:
+        gate = threading.Event()
+        blocker = queue.submit(gate.wait, 5)
+        jobs = [queue.submit(order.append, name, priority=name) for name in ("standard", "healthcare", "military")]
+        gate.set()
+        for job_id in [blocker, *jobs]:
+            queue.result(job_id, timeout=5)
+        assert order == ["military", "healthcare", "standard"]
+    finally:
+        queue.shutdown()
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from chainflow.lanes import plan_lane, plan_lanes
+
+
+def test_bad_lanes_are_reported_per_row():
+    lanes = pd.DataFrame({
+        'origin': ["China", "Atlantis", "Australia", "China"],
+        'destination': ["United States", "Germany", "Germany", "Germany"],
+        'avoid_regions': [None, None, "Europe", None],
+        'priority': ["Cost", "Cost", "Cost", "Cheapest"]
+    })
+    planned = plan_lanes(lanes, workers=1)
+    assert list(planned['status']) == ["ok", "error", "error", "error"]
+    assert planned.loc[1, 'error'] == "Unknown country: Atlantis"
+    assert "satisfies the routing constraints" in planned.loc[2, 'error']
+    assert planned.loc[3, 'error'] == "Unknown priority: Cheapest"
+    assert planned.loc[0, 'path'].startswith("China → ")
+
+
+def test_unusable_stop_limit_is_an_error_row():
+    row = plan_lane("China", "Germany", "Cost", "2")
+    assert row['status'] == "error"
+    assert row['error'].startswith("TypeError: ")
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from chainflow.merkle import MerkleTree, SupplierRegistryTree, sha256_leaf, sha256_pair
+
+
+def full_root(leaves, depth, empty=bytes(32)):
+    """Root rebuilt from scratch over the leaves padded with empty ones"""
+    level = list(leaves) + [empty] * ((1 << depth) - len(leaves))
+    for _ in range(depth):
+        level = [sha256_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+    return level[0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_root_matches_full_rebuild(seed):
+    rng = random.Random(seed)
+    depth = 6
+    tree, leaves = MerkleTree(depth), []
+    assert tree.root == full_root(leaves, depth)
+    while len(leaves) < tree.capacity - 8:
+        op = rng.random()
+        if op < 0.4 or not leaves:
+            batch = [sha256_leaf(rng.getrandbits(64)) for _ in range(rng.randint(0, 7))]
+            assert tree.extend(batch) == len(leaves)
+            leaves += batch
+        elif op < 0.7:
+            leaf = sha256_leaf(rng.getrandbits(64))
+            assert tree.append(leaf) == len(leaves)
+            leaves.append(leaf)
+        else:
+            index = rng.randrange(len(leaves))
+            leaves[index] = sha256_leaf(rng.getrandbits(64))
+            tree.update(index, leaves[index])
+        assert tree.root == full_root(leaves, depth)
+
+    indices = rng.sample(range(len(leaves)), 10)
+    elements, bits = tree.paths(indices)
+    for k, index in enumerate(indices):
+        assert tree.verify(leaves[index], elements[k], bits[k])
+        assert not tree.verify(sha256_leaf(index), elements[k], bits[k])
+
+
+def test_full_tree_rejects_more_leaves():
+    tree = MerkleTree(2)
+    tree.extend([sha256_leaf(i) for i in range(4)])
+    with pytest.raises(ValueError):
+        tree.append(sha256_leaf(4))
+
+
+def test_registry_upserts_match_a_fresh_build():
+    rng = random.Random(0)
+    suppliers = {str(1000 + i): {'tier': rng.choice([1, 2, 3]), 'certification_hash': f"0x{i:04x}"} for i in range(40)}
+    tree = SupplierRegistryTree(dict(list(suppliers.items())[:25]), depth=8)
+    for supplier_id in rng.sample(sorted(suppliers), 20):
+        suppliers[supplier_id] = dict(suppliers[supplier_id], tier=rng.choice([1, 2, 3]))
+        tree.upsert(supplier_id, suppliers[supplier_id])
+    tree.upsert_many(suppliers)
+    fresh = SupplierRegistryTree({s: suppliers[s] for s in tree.index_of}, depth=8)
+    assert tree.root == fresh.root
+    proofs = tree.inclusion_proofs(["1003"])
+    assert proofs["1003"]['merkle_root'] == fresh.inclusion_proofs(["1003"])["1003"]['merkle_root']
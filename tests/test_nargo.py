@@ -0,0 +1,134 @@
+import gzip
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from chainflow.nargo import NargoError, NargoRunner
+from chainflow.witness import format_prover_toml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKE_NARGO = REPO_ROOT / "benchmarks" / "fake_nargo.py"
+
+
+@pytest.fixture(autouse=True)
+def fast_fake_nargo(monkeypatch):
+    for stage in ("COMPILE", "EXECUTE", "CHECK"):
+        monkeypatch.setenv(f"FAKE_NARGO_{stage}_SECONDS", "0")
+    monkeypatch.delenv("FAKE_NARGO_FAIL", raising=False)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    shutil.copy2(REPO_ROOT / "Nargo.toml", root / "Nargo.toml")
+    shutil.copytree(REPO_ROOT / "src", root / "src")
+    return root
+
+
+@pytest.fixture
+def runner(project, tmp_path):
+    runner = NargoRunner(project, nargo=FAKE_NARGO, workers=4, cache_dir=tmp_path / "cache",
+                         work_dir=tmp_path / "jobs", keep_workdirs=True)
+    yield runner
+    runner.shutdown()
+
+
+def inputs(i):
+    return {'product_id': str(1000 + i), 'merkle_root': f"0x{i:064x}", 'path_indices': ["0", "1"]}
+
+
+def expected_witness(job_inputs):
+    return hashlib.sha256(format_prover_toml(job_inputs).encode()).digest()
+
+
+def test_compiles_once_per_circuit_version(runner, project):
+    first = [runner.execute(inputs(i)) for i in range(3)]
+    assert runner.stats()['compiles'] == 1
+    assert first[0]['timings']['compile'] > 0
+    assert all(result['timings']['compile'] == 0.0 for result in first[1:])
+
+    with open(project / "src" / "main.nr", "a", encoding="utf-8") as f:
+        f.write("\n// edited\n")
+    edited = runner.execute(inputs(0))
+    assert runner.stats()['compiles'] == 2
+    assert edited['circuit_version'] != first[0]['circuit_version']
+    runner.execute(inputs(1))
+    assert runner.stats()['compiles'] == 2
+
+
+def test_concurrent_jobs_get_their_own_prover_toml_and_witness(runner, tmp_path):
+    job_ids = {i: runner.submit(inputs(i), label=str(i)) for i in range(12)}
+    results = {i: runner.result(job_id, timeout=60) for i, job_id in job_ids.items()}
+    for i, result in results.items():
+        assert gzip.decompress(result['witness']) == expected_witness(inputs(i))
+    assert runner.stats()['compiles'] == 1
+
+    job_dirs = [d for d in (tmp_path / "jobs").iterdir() if (d / "Prover.toml").exists()]
+    assert len(job_dirs) == 12
+    tomls = {(d / "Prover.toml").read_text(encoding="utf-8") for d in job_dirs}
+    assert tomls == {format_prover_toml(inputs(i)) for i in range(12)}
+    assert all(len(list((d / "target").glob("*.gz"))) == 1 for d in job_dirs)
+
+
+def test_check_and_info_output_is_cached(runner, project, tmp_path):
+    first = runner.status()
+    second = runner.status()
+    assert not first['check']['cached'] and not first['info']['cached']
+    assert second['check']['cached'] and second['info']['cached']
+    assert second['info']['output'] == first['info']['output']
+    assert "ACIR Opcodes" in first['info']['output']
+    stages = runner.stats()['stages']
+    assert stages['check']['runs'] == 1 and stages['info']['runs'] == 1
+
+    restarted = NargoRunner(project, nargo=FAKE_NARGO, cache_dir=tmp_path / "cache")
+    assert restarted.info() == {'output': first['info']['output'], 'seconds': 0.0, 'cached': True}
+    assert restarted.stats()['stages']['info']['runs'] == 0
+
+
+def test_nonzero_exit_raises_nargo_error(runner, monkeypatch):
+    monkeypatch.setenv("FAKE_NARGO_FAIL", "execute")
+    with pytest.raises(NargoError) as error:
+        runner.execute(inputs(0))
+    assert error.value.stage == "execute"
+    assert error.value.returncode == 1
+    assert "fake nargo execute failure" in error.value.stderr
+
+    with pytest.raises(NargoError):
+        runner.result(runner.submit(inputs(1)), timeout=60)
+
+
+def test_missing_binary_and_timeout_raise_nargo_error(project, tmp_path, monkeypatch):
+    missing = NargoRunner(project, nargo=tmp_path / "no-such-nargo", cache_dir=tmp_path / "cache")
+    with pytest.raises(NargoError) as error:
+        missing.execute(inputs(0))
+    assert error.value.stage == "compile" and error.value.returncode is None
+
+    monkeypatch.setenv("FAKE_NARGO_EXECUTE_SECONDS", "5")
+    slow = NargoRunner(project, nargo=FAKE_NARGO, cache_dir=tmp_path / "cache", timeout=0.5)
+    with pytest.raises(NargoError, match="timed out"):
+        slow.execute(inputs(0))
+
+
+def test_relative_binary_path_is_resolved(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    runner = NargoRunner(project, nargo="benchmarks/fake_nargo.py", cache_dir=tmp_path / "cache")
+    assert Path(runner.nargo).is_absolute()
+    assert gzip.decompress(runner.execute(inputs(0))['witness']) == expected_witness(inputs(0))
+
+
+def test_result_before_any_submit_raises_key_error(runner):
+    with pytest.raises(KeyError):
+        runner.result("job_unknown")
+
+
+def test_concurrent_cold_status_runs_each_stage_once(runner):
+    with ThreadPoolExecutor(8) as pool:
+        statuses = list(pool.map(lambda _: runner.status(), range(8)))
+    stages = runner.stats()['stages']
+    assert stages['check']['runs'] == 1 and stages['info']['runs'] == 1
+    assert sum(not status['info']['cached'] for status in statuses) == 1
+    assert len({status['info']['output'] for status in statuses}) == 1
@@ -0,0 +1,63 @@
+import json
+import random
+
+import pandas as pd
+import pytest
+
+from chainflow.fields import BN254_MODULUS
+from chainflow.preflight import ASSERTIONS, MIN_SCORE, preflight
+from chainflow.witness import CATALOG_PATH, WitnessBuilder
+
+NONZERO = ["supplier_certification_hash", "origin_location", "final_destination", "manufacturer_signature",
+           "distributor_signature", "proof_version", "circuit_id", "zkverify_chain_id"]
+
+
+def reference_failures(inputs):
+    """main.nr's assertions evaluated one witness at a time"""
+    def u32(name):
+        return inputs[name] % BN254_MODULUS & 0xFFFFFFFF
+
+    tier, category, timestamp = u32("supplier_tier"), u32("product_category"), u32("verification_timestamp")
+    score = 50 + {1: 30, 2: 20}.get(tier, 10) + {1: 15, 2: 20, 3: 10}.get(category, 0)
+    score += 5 if timestamp > 1_700_000_000 else 0
+    product_hash = sum(inputs[n] for n in ("product_id", "product_category", "batch_number", "manufacturing_date"))
+    holds = {
+        "product_hash": product_hash % BN254_MODULUS == inputs["expected_product_hash"] % BN254_MODULUS,
+        "supplier_tier_min": tier >= 1,
+        "supplier_tier_max": tier <= 3,
+        "risk_score": min(score, 100) >= MIN_SCORE,
+    }
+    for name in NONZERO:
+        holds[name.replace("supplier_", "")] = inputs[name] % BN254_MODULUS != 0
+    return [name for name, _ in ASSERTIONS if not holds[name]]
+
+
+@pytest.fixture(scope="module")
+def witnesses():
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        return list(WitnessBuilder(json.load(f)).witnesses())
+
+
+def test_builder_output_matches_reference(witnesses):
+    report = preflight(witnesses)
+    for (_, inputs), failures in zip(witnesses, report['failures']):
+        assert (failures.split(";") if failures else []) == reference_failures(inputs)
+    assert report['failed_assertion'].isna().sum() == report['passed'].sum()
+
+
+def test_tampered_witnesses_match_reference(witnesses):
+    rng = random.Random(0)
+    tampered = []
+    for i in range(300):
+        product_id, inputs = rng.choice(witnesses)
+        inputs = dict(inputs)
+        for name in rng.sample(NONZERO + ["supplier_tier", "product_category", "expected_product_hash",
+                                          "verification_timestamp"], rng.randint(1, 3)):
+            values = [0, BN254_MODULUS, 2, 4, 1 << 32 | 1, 1_800_000_000, rng.randrange(BN254_MODULUS)]
+            inputs[name] = rng.choice(values)
+        tampered.append((f"{product_id}-{i}", inputs))
+    report = preflight(tampered)
+    for (_, inputs), first, failures in zip(tampered, report['failed_assertion'], report['failures']):
+        expected = reference_failures(inputs)
+        assert (failures.split(";") if failures else []) == expected
+        assert (pd.isna(first) and not expected) or first == expected[0]
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from chainflow.routing import METRIC_INDEX, PRIORITY_METRICS, HubNetwork, plan_route, ranked_routes
+
+MODES = ("Sea", "Air", "Rail")
+
+
+def random_network(seed, hubs=6, edges=16):
+    rng = random.Random(seed)
+    network = HubNetwork()
+    countries = [network.add_node("Origin"), network.add_node("Destination")]
+    hub_nodes = [network.add_node(f"H{i}", hub=True, tags=["North" if i % 2 else "South"]) for i in range(hubs)]
+    for country in countries:
+        for hub in rng.sample(hub_nodes, 2):
+            network.add_edge(country, hub, rng.randint(1, 20), rng.randint(1, 20), rng.randint(1, 20), "Road")
+    for _ in range(edges):
+        a, b = rng.sample(hub_nodes, 2)
+        network.add_edge(a, b, rng.randint(1, 50), rng.randint(1, 50), rng.randint(1, 50), rng.choice(MODES))
+    return network
+
+
+def brute_routes(network, origin, destination, avoid=()):
+    """(cost, time, carbon, stops) of every loopless route, transiting hubs only"""
+    source, target = network.node(origin), network.node(destination)
+    routes = []
+
+    def walk(node, visited, totals, stops):
+        for neighbour, cost, time, carbon, mode in network.adjacency[node]:
+            if neighbour in visited:
+                continue
+            step = (totals[0] + cost, totals[1] + time, totals[2] + carbon)
+            if neighbour == target:
+                routes.append((*step, stops))
+            elif network.is_hub[neighbour] and not (set(avoid) & network.tags[neighbour]):
+                walk(neighbour, visited | {neighbour}, step, stops + 1)
+
+    walk(source, {source}, (0, 0, 0), 0)
+    return routes
+
+
+def frontier(points):
+    return {p for p in points if not any(q != p and all(a <= b for a, b in zip(q, p)) for q in points)}
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shortest_path_matches_brute_force(seed):
+    network = random_network(seed)
+    routes = brute_routes(network, "Origin", "Destination")
+    for priority, metric in PRIORITY_METRICS.items():
+        route = network.shortest_path("Origin", "Destination", priority)
+        assert route[metric] == min(r[METRIC_INDEX[metric]] for r in routes)
+        assert route['path'][0] == "Origin" and route['path'][-1] == "Destination"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_k_shortest_paths_match_brute_force(seed):
+    network = random_network(seed)
+    expected = sorted(cost for cost, *_ in brute_routes(network, "Origin", "Destination"))
+    routes = network.k_shortest_paths("Origin", "Destination", k=8)
+    assert [route['cost'] for route in routes] == expected[:8]
+    legs = {tuple((leg['to'], leg['mode'], leg['cost'], leg['time']) for leg in route['legs']) for route in routes}
+    assert len(legs) == len(routes)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_pareto_routes_match_brute_force(seed):
+    network = random_network(seed)
+    routes = brute_routes(network, "Origin", "Destination")
+    for max_stops in (None, 1, 2):
+        allowed = [r[:3] for r in routes if max_stops is None or r[3] <= max_stops]
+        found = network.pareto_routes("Origin", "Destination", max_stops=max_stops)
+        assert {(r['cost'], r['time'], r['carbon']) for r in found} == frontier(set(allowed))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_pareto_routes_under_avoidance_and_time_limit_match_brute_force(seed):
+    network = random_network(seed)
+    routes = brute_routes(network, "Origin", "Destination", avoid=["North"])
+    max_time = sorted(r[1] for r in routes)[len(routes) // 2] if routes else None
+    allowed = [r[:3] for r in routes if r[1] <= (max_time or 0)]
+    found = network.pareto_routes("Origin", "Destination", avoid=["North"], max_time=max_time)
+    assert {(r['cost'], r['time'], r['carbon']) for r in found} == frontier(set(allowed))
+    assert all(not any(hub.startswith("H") and int(hub[1:]) % 2 for hub in r['path']) for r in found)
+
+
+def test_avoided_hubs_can_cut_the_origin_off():
+    network = HubNetwork()
+    origin, destination = network.add_node("Origin"), network.add_node("Destination")
+    gateway = network.add_node("Gateway", hub=True, tags=["Blocked"])
+    far = network.add_node("Far", hub=True)
+    network.add_edge(origin, gateway, 1, 1, 1, "Road")
+    network.add_edge(gateway, far, 1, 1, 1, "Sea")
+    network.add_edge(far, destination, 1, 1, 1, "Road")
+
+    assert len(network.k_shortest_paths("Origin", "Destination")) == 1
+    assert network.k_shortest_paths("Origin", "Destination", avoid=["Blocked"]) == []
+    assert network.pareto_routes("Origin", "Destination", avoid=["Blocked"]) == []
+    assert network.k_shortest_paths("Origin", "Destination", modes=["Air"]) == []
+    network.add_node("Island")
+    with pytest.raises(ValueError):
+        network.shortest_path("Island", "Destination")
+
+
+def test_ranked_routes_when_avoided_regions_cut_the_origin_off():
+    assert ranked_routes("Australia", "Germany", avoid_regions=("Europe",)) == []
+    with pytest.raises(ValueError):
+        plan_route("Australia", "Germany", avoid_regions=("Europe",))
@@ -0,0 +1,57 @@
+import math
+import random
+
+import pytest
+
+from chainflow.spatial import GridIndex, _haversine_to
+
+
+def brute_within(points, lat, lon, radius_km):
+    keys = list(points)
+    lats = [points[k][0] for k in keys]
+    lons = [points[k][1] for k in keys]
+    km = _haversine_to(lat, lon, lats, lons)
+    return sorted(k for k, d in zip(keys, km.tolist()) if d <= radius_km)
+
+
+def test_columns_tile_the_circle_exactly():
+    for cell_km in (0.3, 1.0, 7.5, 500.0, 1000.0, 50_000.0):
+        index = GridIndex(cell_km=cell_km)
+        assert math.isclose(index._columns * index._col_deg, 360)
+
+
+def test_within_across_the_antimeridian():
+    index = GridIndex(cell_km=1.0)
+    index.insert('a', 0, -179.999)
+    index.insert('b', 0, 179.9995)
+    found = dict(index.within(0, 179.9999, 0.5))
+    assert set(found) == {'a', 'b'}
+    assert found['a'] == pytest.approx(0.122, abs=0.001)
+
+
+@pytest.mark.parametrize("cell_km", [1.0, 500.0, 1000.0])
+def test_random_queries_near_the_antimeridian_match_brute_force(cell_km):
+    rng = random.Random(cell_km)
+    points = {i: (rng.uniform(-60, 60), rng.choice([-1, 1]) * rng.uniform(170, 180)) for i in range(2000)}
+    index = GridIndex(cell_km=cell_km)
+    index.insert_many(list(points), [p[0] for p in points.values()], [p[1] for p in points.values()])
+    for _ in range(50):
+        lat, lon = rng.uniform(-60, 60), rng.choice([-1, 1]) * rng.uniform(175, 180)
+        radius = rng.uniform(0.5, 3) * cell_km
+        assert sorted(k for k, _ in index.within(lat, lon, radius)) == brute_within(points, lat, lon, radius)
+        nearest = index.nearest(lat, lon, k=5)
+        keys = list(points)
+        km = _haversine_to(lat, lon, [points[k][0] for k in keys], [points[k][1] for k in keys])
+        assert [d for _, d in nearest] == pytest.approx(sorted(km.tolist())[:5])
+
+
+def test_insert_many_reuses_freed_slots():
+    index = GridIndex(cell_km=10.0, capacity=8)
+    index.insert_many(range(8), [0.0] * 8, [float(i) for i in range(8)])
+    for key in range(3):
+        index.remove(key)
+    index.insert_many(['x', 'y', 'z', 'w'], [1.0] * 4, [1.0, 2.0, 3.0, 4.0])
+    assert index._used == 9
+    assert len(index) == 9
+    assert index.position('w') == (1.0, 4.0)
+    assert {k for k, _ in index.within(1.0, 1.0, 1.0)} == {'x'}
@@ -0,0 +1,56 @@
+import math
+
+import pandas as pd
+import pytest
+
+from chainflow.vrp import CITY_SPEED_KMH, ROAD_FACTOR, synthetic_city_stops, solve_vrptw
+
+
+def km(stops, a, b):
+    dx, dy = stops.at[a, 'x_km'] - stops.at[b, 'x_km'], stops.at[a, 'y_km'] - stops.at[b, 'y_km']
+    return math.hypot(dx, dy) * ROAD_FACTOR
+
+
+def check_routes(stops, plan, capacity_kg):
+    """Replay every route from the stop table; returns the total distance"""
+    depot = stops.index[0]
+    minutes_per_km = 60 / CITY_SPEED_KMH
+    visited = [stop for route in plan['routes'] for stop in route]
+    assert sorted(visited + plan['unserved']) == sorted(stops.index[1:])
+    assert len(set(visited)) == len(visited)
+
+    total = 0.0
+    for route in plan['routes']:
+        assert stops.loc[route, 'weight_kg'].sum() <= capacity_kg + 1e-9
+        t, prev, service = stops.at[depot, 'ready_min'], depot, 0.0
+        for stop in route:
+            t = max(stops.at[stop, 'ready_min'], t + service + km(stops, prev, stop) * minutes_per_km)
+            assert t <= stops.at[stop, 'due_min'] + 1e-6
+            total += km(stops, prev, stop)
+            prev, service = stop, stops.at[stop, 'service_min']
+        assert t + service + km(stops, prev, depot) * minutes_per_km <= stops.at[depot, 'due_min'] + 1e-6
+        total += km(stops, prev, depot)
+    return total
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("capacity_kg", [40, 800])
+def test_routes_respect_capacity_and_time_windows(seed, capacity_kg):
+    stops = synthetic_city_stops(150, seed=seed)
+    plan = solve_vrptw(stops, capacity_kg=capacity_kg, time_limit=0.5)
+    assert check_routes(stops, plan, capacity_kg) == pytest.approx(plan['distance_km'])
+    assert plan['distance_km'] <= plan['construction_km'] + 1e-9
+
+
+def test_stops_no_van_can_serve_are_unserved():
+    stops = pd.DataFrame({
+        'x_km': [0.0, 1.0, 2.0, 40.0],
+        'y_km': [0.0, 1.0, 0.0, 40.0],
+        'weight_kg': [0.0, 900.0, 5.0, 5.0],
+        'ready_min': [480.0, 480.0, 480.0, 480.0],
+        'due_min': [1200.0, 1200.0, 600.0, 490.0],
+        'service_min': [0.0, 3.0, 3.0, 3.0]
+    }, index=["depot", "heavy", "near", "far"])
+    plan = solve_vrptw(stops, capacity_kg=800)
+    assert plan['routes'] == [["near"]]
+    assert sorted(plan['unserved']) == ["far", "heavy"]